@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from api.routes import deploy, metrics, log, service
+from api.routes import deploy, metrics, log, service, system
 
 api_router = APIRouter()
 
@@ -7,4 +7,4 @@ api_router.include_router(deploy.router, prefix="/deploy", tags=["deploy"])
 api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 api_router.include_router(log.router, prefix="/log", tags=["log"])
 api_router.include_router(service.router, prefix="/service", tags=["service"])
-
+api_router.include_router(system.router, prefix="/system", tags=["system"])
@@ -1,15 +1,27 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session
-from schemas.deploy import DeployRequest, DeployCreate, DeployResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from schemas.deploy import DeployRequest, DeployCreate, DeployResponse, DeployBulkResponse
+from core.config import env_int
+from core.deploy_events import deploy_event_hub, stream_deploy_events
 from core.jenkins_client import JenkinsClient
-from crud.deploy import create_deploy, get_deploy, get_deploys_by_service, get_latest_deploy_by_service, get_today_user_deploys_count
+from core.pagination import cursor_param, paginate
+from crud.deploy import create_deploy, create_deploys, get_deploy_cached, get_deploys_by_service, get_latest_deploy_by_service_cached
+from crud.user_summary import get_user_summary
 from database.yoitang import get_db
 
 router = APIRouter()
 
+# 일괄 생성 한 번에 받을 최대 개수
+BULK_MAX_ITEMS = env_int("BULK_INSERT_MAX_ITEMS", 1000)
+
+# 서비스별 배포 이력 페이지 크기 (기본 / 최대)
+DEPLOY_PAGE_SIZE = env_int("DEPLOY_PAGE_SIZE", 4)
+DEPLOY_PAGE_MAX = env_int("DEPLOY_PAGE_MAX", 100)
+
 #@router.post("/", summary="새 배포 요청")
 #@router.post("", summary="새 배포 요청")
 async def deploy(req: DeployRequest):
@@ -30,7 +42,7 @@ async def deploy(req: DeployRequest):
         )
 
     try:
-        queue_id = jenkins.trigger_build(
+        queue_id = await jenkins.trigger_build(
             prefix=req.prefix,
             git_repo=str(req.git_repo),
             branch=req.branch,
@@ -53,13 +65,59 @@ async def deploy(req: DeployRequest):
 
 # 배포 생성
 @router.post("/", response_model=DeployResponse, summary="새 배포 생성")
-async def create_new_deploy(deploy_data: DeployCreate, db: Session = Depends(get_db)):
-    return create_deploy(db, deploy_data)
+async def create_new_deploy(deploy_data: DeployCreate, db: AsyncSession = Depends(get_db)):
+    return await create_deploy(db, deploy_data)
+
+# 배포 일괄 생성 (한 트랜잭션)
+@router.post("/bulk", response_model=DeployBulkResponse, summary="여러 배포 일괄 생성")
+async def create_new_deploys(deploys: List[DeployCreate], db: AsyncSession = Depends(get_db)):
+    if len(deploys) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {BULK_MAX_ITEMS}개까지 생성할 수 있습니다."
+        )
+    return DeployBulkResponse(deploy_ids=await create_deploys(db, deploys))
+
+# 🔥 배포 상태 변경 SSE 스트림 (/{deploy_id} 보다 먼저 등록)
+# 상태를 polling 하는 대신 구독: 유저 또는 서비스 단위
+@router.get("/events", summary="배포 상태 변경 실시간 스트림 (SSE)")
+async def stream_deploy_status(
+    request: Request,
+    user_id: int | None = None,
+    service_id: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    if user_id is None and service_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="user_id 또는 service_id 중 하나는 지정해야 합니다."
+        )
+
+    # 구독을 먼저 걸고 스냅샷을 읽어야 그 사이의 변경을 놓치지 않는다
+    sub = deploy_event_hub.subscribe(user_id, service_id)
+    snapshot = None
+    if service_id is not None:
+        try:
+            latest = await get_latest_deploy_by_service_cached(db, service_id)
+        except Exception:
+            deploy_event_hub.unsubscribe(sub)
+            raise
+        snapshot = latest.model_dump(mode="json") if latest else None
+    await db.close()
+
+    return StreamingResponse(
+        stream_deploy_events(sub, snapshot, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",   # nginx 버퍼링 방지
+        },
+    )
 
 # 배포 내용 조회
 @router.get("/{deploy_id}", response_model=DeployResponse, summary="단일 배포 정보 조회")
-async def get_single_deploy(deploy_id: int, db: Session = Depends(get_db)):
-    deploy = get_deploy(db, deploy_id)
+async def get_single_deploy(deploy_id: int, db: AsyncSession = Depends(get_db)):
+    deploy = await get_deploy_cached(db, deploy_id)
 
     if not deploy:
         raise HTTPException(
@@ -70,8 +128,8 @@ async def get_single_deploy(deploy_id: int, db: Session = Depends(get_db)):
 
 # 서비스의 가장 최근 배포 조회
 @router.get("/service/latest/{service_id}", response_model=DeployResponse, summary="서비스의 가장 최근 배포 조회")
-async def get_service_latest_deploy(service_id: int, db: Session = Depends(get_db)):
-    deploy = get_latest_deploy_by_service(db, service_id)
+async def get_service_latest_deploy(service_id: int, db: AsyncSession = Depends(get_db)):
+    deploy = await get_latest_deploy_by_service_cached(db, service_id)
 
     if not deploy:
         raise HTTPException(
@@ -80,12 +138,21 @@ async def get_service_latest_deploy(service_id: int, db: Session = Depends(get_d
         )
     return deploy
 
-# 서비스의 최근 4번의 배포 이력 조회
-@router.get("/service/{service_id}", response_model=List[DeployResponse], summary="서비스의 최근 4번의 배포 이력 조회")
-async def get_service_deploys(service_id: int, db: Session = Depends(get_db)):
-    deploys = get_deploys_by_service(db, service_id)
+# 서비스의 배포 이력 조회 (최근 순, 다음 페이지는 X-Next-Cursor 헤더)
+@router.get("/service/{service_id}", response_model=List[DeployResponse], summary="서비스의 배포 이력 조회")
+async def get_service_deploys(
+    service_id: int,
+    response: Response,
+    limit: int = Query(DEPLOY_PAGE_SIZE, ge=1, le=DEPLOY_PAGE_MAX),
+    after: tuple | None = Depends(cursor_param),
+    db: AsyncSession = Depends(get_db),
+):
+    deploys = paginate(
+        await get_deploys_by_service(db, service_id, limit + 1, after),
+        limit, response, lambda d: (d.created_date, d.deploy_id),
+    )
 
-    if not deploys:
+    if not deploys and after is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="해당 서비스의 배포 이력이 존재하지 않습니다."
@@ -94,6 +161,5 @@ async def get_service_deploys(service_id: int, db: Session = Depends(get_db)):
 
 # 오늘 생성된 유저의 배포 개수 조회
 @router.get("/user/{user_id}/today_count", response_model=int, summary="오늘 생성된 유저의 배포 개수 조회")
-async def get_today_user_deploys_count_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    count = get_today_user_deploys_count(db, user_id)
-    return count
\ No newline at end of file
+async def get_today_user_deploys_count_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return (await get_user_summary(db, user_id))["today_deploys_count"]
\ No newline at end of file
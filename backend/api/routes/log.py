@@ -1,69 +1,215 @@
-import os
-import requests
-from fastapi.responses import PlainTextResponse
+import httpx
+from typing import List
+from datetime import datetime
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 
-from fastapi import APIRouter, HTTPException, status, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Request
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.yoitang import get_db
-from crud.log import create_log, get_log
-from schemas.log import LogResponse, LogCreate
+from crud.deploy import get_deploy
+from crud.log import append_log_chunk, create_log, create_logs, get_log_meta
+from core.config import env_int
+from core.log_archive import CODEC
+from core.log_reader import find_tail_offset, get_log_layout, iter_log_range, read_log_content
+from core.log_search import search_logs
+from core.jenkins_client import JenkinsError
+from core.log_tail_cache import log_tail_cache
+from core.log_stream import stream_build_log
+from core.log_tiering import (
+    LogStorageError,
+    archived_log_size,
+    find_archived_tail_offset,
+    get_log_storage,
+    iter_archived_log_range,
+    read_archived_log,
+)
+from crud.archived_log import archived_log_meta, get_archived_deploy_ids, get_archived_log
+from models.deploy import DeployStatus
+from schemas.deploy import DeployStatus as DeployStatusParam
+from schemas.log import (
+    LogResponse, LogCreate, LogMetaResponse, LogType, LogSearchResponse, LogBulkResponse, LogAppendResponse,
+)
 
 router = APIRouter()
 
+# 일괄 생성 한 번에 받을 최대 개수 / 이어붙이기 한 번의 최대 크기(bytes)
+BULK_MAX_ITEMS = env_int("BULK_INSERT_MAX_ITEMS", 1000)
+APPEND_MAX_BYTES = env_int("LOG_APPEND_MAX_BYTES", 4 * 1024 * 1024)
+
 class JenkinsLogResponse(BaseModel):
     chunk: str          # 이번 요청으로 받은 로그
     nextOffset: int     # 다음 요청할 offset
     hasMore: bool       # 아직 로그가 더 있는지 여부
 
+async def _read_archived_log(db: AsyncSession, deploy_id: int) -> dict | None:
+    try:
+        return await read_archived_log(db, deploy_id)
+    except LogStorageError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
 # 🔥 Jenkins progressive-text 로그 API
+# 같은 빌드를 보는 viewer들은 log_tail_cache를 통해 upstream 조회 한 번을 공유한다
 @router.get("/jenkins/{build_number}", response_model=JenkinsLogResponse, summary="Jenkins 로그 실시간 조회")
 async def get_jenkins_log(build_number: int, offset: int = 0):
-    # Jenkins 환경 변수 로드
-    JENKINS_URL = os.getenv("JENKINS_URL")
-    JENKINS_USER = os.getenv("JENKINS_USER")
-    JENKINS_TOKEN = os.getenv("JENKINS_TOKEN")
-    JOB_NAME = os.getenv("JENKINS_JOB_NAME", "yoitang-autodeploy")
-
-    if not (JENKINS_URL and JENKINS_USER and JENKINS_TOKEN):
+    try:
+        chunk, next_offset, has_more = await log_tail_cache.read(build_number, offset)
+    except JenkinsError as e:
+        # 정상 응답이 아닌 경우
+        raise HTTPException(
+            status_code=e.status_code,
+            detail=f"Jenkins 응답 코드: {e.status_code}"
+        )
+    except RuntimeError:
         raise HTTPException(
             status_code=500,
             detail="Jenkins 환경변수가 설정되지 않았습니다. (JENKINS_URL, JENKINS_USER, JENKINS_TOKEN)"
         )
-
-    url = f"{JENKINS_URL}/job/{JOB_NAME}/{build_number}/logText/progressiveText?start={offset}"
-
-    try:
-        resp = requests.get(url, auth=(JENKINS_USER, JENKINS_TOKEN), timeout=10)
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"Jenkins 호출 실패: {e}")
 
-    # 정상 응답이 아닌 경우
-    if resp.status_code != 200:
-        raise HTTPException(
-            status_code=resp.status_code,
-            detail=f"Jenkins 응답 코드: {resp.status_code}"
-        )
+    return JenkinsLogResponse(chunk=chunk, nextOffset=next_offset, hasMore=has_more)
 
-    chunk = resp.text or ""
 
-    size_header = resp.headers.get("X-Text-Size")
-    next_offset = int(size_header) if size_header else offset + len(chunk)
-    has_more = resp.headers.get("X-More-Data", "false").lower() == "true"
+# 🔥 Jenkins 로그 SSE 스트림 (polling 대신 push)
+# 클라이언트는 result 이벤트를 받으면 EventSource.close() 해야 한다 (안 닫으면 retry 후 다시 연결함)
+@router.get("/jenkins/{build_number}/stream", summary="Jenkins 로그 실시간 스트림 (SSE)")
+async def stream_jenkins_log(
+    request: Request,
+    build_number: int,
+    offset: int = 0,
+    last_event_id: str | None = Header(default=None),
+):
+    # 재연결 시 브라우저가 보내는 Last-Event-ID(= 마지막으로 받은 nextOffset)에서 이어서 전송
+    if last_event_id:
+        try:
+            offset = int(last_event_id)
+        except ValueError:
+            pass
+        # 끝난 빌드를 끝까지 받은 뒤의 재연결 → 204로 EventSource 재연결을 멈춘다
+        # (result를 다시 보내면 close() 하지 않는 클라이언트가 계속 재연결함)
+        try:
+            chunk, next_offset, has_more = await log_tail_cache.read(build_number, offset)
+        except Exception:
+            chunk, next_offset, has_more = "", offset, True
+        if not has_more and not chunk and next_offset <= offset:
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    return JenkinsLogResponse(chunk=chunk, nextOffset=next_offset, hasMore=has_more)
+    return StreamingResponse(
+        stream_build_log(build_number, offset, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",   # nginx 버퍼링 방지
+        },
+    )
 
 
+# 로그 전문 검색 (/{deploy_id} 보다 먼저 등록)
+@router.get("/search", response_model=LogSearchResponse, summary="빌드/배포 로그 전문 검색")
+async def search_deploy_logs(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (모든 단어가 들어있는 줄을 찾음)"),
+    service_id: int | None = None,
+    status: DeployStatusParam | None = None,
+    date_from: datetime | None = Query(None, description="배포 생성 시각 시작 (포함)"),
+    date_to: datetime | None = Query(None, description="배포 생성 시각 끝 (미포함)"),
+    log_type: LogType | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+):
+    results = await search_logs(
+        db,
+        q,
+        log_type=log_type.value if log_type else None,
+        limit=limit,
+        offset=offset,
+        service_id=service_id,
+        status=DeployStatus(status.value) if status else None,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    return LogSearchResponse(query=q, results=results)
+
 # 로그 생성
 @router.post("/", response_model=LogResponse, summary="DB에 새 로그 생성")
-async def create_new_log(log_data: LogCreate, db: Session = Depends(get_db)):
-    return create_log(db, log_data)
+async def create_new_log(log_data: LogCreate, db: AsyncSession = Depends(get_db)):
+    if await get_archived_log(db, log_data.deploy_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 object storage로 옮긴 배포의 로그는 새로 만들 수 없습니다."
+        )
+    try:
+        return await create_log(db, log_data)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 로그가 있는 배포입니다. /log/{deploy_id}/{log_type}/append 로 이어붙이세요."
+        )
+
+# 로그 일괄 생성 (한 트랜잭션)
+@router.post("/bulk", response_model=LogBulkResponse, summary="여러 로그 일괄 생성")
+async def create_new_logs(logs: List[LogCreate], db: AsyncSession = Depends(get_db)):
+    if len(logs) > BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {BULK_MAX_ITEMS}개까지 생성할 수 있습니다."
+        )
+    archived = await get_archived_deploy_ids(db, [l.deploy_id for l in logs])
+    if archived:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"이미 object storage로 옮긴 배포의 로그는 새로 만들 수 없습니다: {sorted(archived)}"
+        )
+    try:
+        return LogBulkResponse(log_ids=await create_logs(db, logs))
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 로그가 있거나 요청 안에서 겹치는 배포가 있습니다. (배포 하나에 로그 하나)"
+        )
+
+# 로그 이어붙이기 (요청 본문 = 로그 텍스트 그대로, 예: curl --data-binary @stage.log)
+# build 조각은 빌드가 끝나면 Jenkins 콘솔 로그 보관(core.log_archive)이 통째로 갈아끼우므로 이어붙일 수 없다
+@router.post("/{deploy_id}/{log_type}/append", response_model=LogAppendResponse, summary="로그 뒤에 조각 이어붙이기")
+async def append_log(deploy_id: int, log_type: LogType, request: Request, db: AsyncSession = Depends(get_db)):
+    if log_type == LogType.BUILD:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="build 로그는 Jenkins 콘솔 로그로 보관되므로 이어붙일 수 없습니다. (deploy / application 사용)"
+        )
+    raw = await request.body()
+    if not raw:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="로그 내용이 비어 있습니다.")
+    if len(raw) > APPEND_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {APPEND_MAX_BYTES} bytes까지 이어붙일 수 있습니다."
+        )
+
+    if await get_deploy(db, deploy_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 배포가 존재하지 않습니다."
+        )
+
+    appended = await append_log_chunk(db, deploy_id, log_type.value, raw, CODEC)
+    if appended is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 object storage로 옮긴 로그에는 이어붙일 수 없습니다."
+        )
+    seq, size = appended
+    return LogAppendResponse(deploy_id=deploy_id, log_type=log_type, seq=seq, size=size)
 
 # 로그 내용 조회
 @router.get("/{deploy_id}", response_model=LogResponse, summary="단일 로그 정보 조회")
-async def get_log_by_deploy(deploy_id: int, db: Session = Depends(get_db)):
-    log = get_log(db, deploy_id)
+async def get_log_by_deploy(deploy_id: int, db: AsyncSession = Depends(get_db)):
+    # 압축 보관된 빌드 로그까지 풀어서 응답 (object storage로 옮긴 로그는 거기서 읽음)
+    # 로그 종류별로 LOG_CONTENT_MAX_BYTES 를 넘으면 마지막 부분만 (truncated 참고)
+    log = await read_log_content(db, deploy_id) or await _read_archived_log(db, deploy_id)
 
     if not log:
         raise HTTPException(
@@ -73,3 +219,72 @@ async def get_log_by_deploy(deploy_id: int, db: Session = Depends(get_db)):
 
     return log
 
+# 로그 메타데이터 조회 (텍스트 컬럼은 읽지 않음)
+@router.get("/{deploy_id}/meta", response_model=LogMetaResponse, summary="로그 크기 등 메타데이터 조회")
+async def get_log_meta_by_deploy(deploy_id: int, db: AsyncSession = Depends(get_db)):
+    meta = await get_log_meta(db, deploy_id)
+    if not meta:
+        archived = await get_archived_log(db, deploy_id)
+        meta = archived_log_meta(archived) if archived else None
+
+    if not meta:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 배포가 존재하지 않습니다."
+        )
+
+    return meta
+
+# 로그 일부 조회 (바이트 범위 또는 마지막 N줄) → 크기와 상관없이 스트리밍
+@router.get("/{deploy_id}/{log_type}", response_class=StreamingResponse, summary="로그 범위 조회")
+async def get_log_range_by_deploy(
+    deploy_id: int,
+    log_type: LogType,
+    offset: int = Query(0, ge=0, description="시작 바이트 offset"),
+    length: int | None = Query(None, ge=0, description="읽을 바이트 수 (없으면 끝까지)"),
+    tail_lines: int | None = Query(None, ge=1, le=100000, description="마지막 N줄 (지정하면 offset/length 무시)"),
+    db: AsyncSession = Depends(get_db),
+):
+    layout = await get_log_layout(db, deploy_id, log_type.value)
+
+    # object storage로 옮긴 로그는 걸치는 조각만 ranged GET 으로 받아 응답
+    archived = await get_archived_log(db, deploy_id) if not layout else None
+
+    if not layout and not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 배포가 존재하지 않습니다."
+        )
+
+    storage = None
+    if archived:
+        # 객체를 받는 동안에는 DB 커넥션을 풀에 돌려준다
+        await db.close()
+        try:
+            storage = get_log_storage()
+        except LogStorageError as e:
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    total = layout.size if layout else archived_log_size(archived, log_type.value)
+    if tail_lines is not None:
+        if layout:
+            start = await find_tail_offset(db, layout, tail_lines)
+        else:
+            try:
+                start = await find_archived_tail_offset(storage, archived, log_type.value, tail_lines)
+            except LogStorageError as e:
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+        end = total
+    else:
+        start = min(offset, total)
+        end = total if length is None else min(total, start + length)
+
+    return StreamingResponse(
+        iter_log_range(layout, start, end) if layout else iter_archived_log_range(storage, archived, log_type.value, start, end),
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-Log-Size": str(total),
+            "X-Range-Start": str(start),
+            "X-Range-End": str(end),
+        },
+    )
@@ -1,8 +1,10 @@
 import time
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 
+from core.config import env_float, env_int
+from core.fanout import FanOut
 from core.prometheus_client import PrometheusClient
 from core.kubecost_client import KubecostClient
 
@@ -11,6 +13,15 @@ router = APIRouter(prefix="/namespaces", tags=["namespace-metrics"])
 prom = PrometheusClient()
 kc = KubecostClient()
 
+# 요청 하나가 동시에 보내는 upstream 호출 수 (overview는 세 묶음 합계 10건) / 모든 호출이 공유하는 마감 시간(초)
+UPSTREAM_CONCURRENCY = env_int("METRICS_UPSTREAM_CONCURRENCY", 4)
+OVERVIEW_CONCURRENCY = env_int("METRICS_OVERVIEW_CONCURRENCY", 8)
+UPSTREAM_DEADLINE_SEC = env_float("METRICS_UPSTREAM_DEADLINE_SEC", 10.0)
+
+
+def _fanout(limit: int | None = None) -> FanOut:
+    return FanOut(limit or UPSTREAM_CONCURRENCY, UPSTREAM_DEADLINE_SEC)
+
 
 def _extract_single_value(result: List[Dict[str, Any]]) -> float:
     """
@@ -48,6 +59,10 @@ async def get_namespace_resource_usage(
         namespace_cpu:kube_pod_container_resource_requests:sum{namespace="<ns>"}
         namespace_memory:kube_pod_container_resource_requests:sum{namespace="<ns>"}
     """
+    return await _resource_usage(_fanout(), namespace, minutes, step_sec)
+
+
+async def _resource_usage(fan: FanOut, namespace: str, minutes: int, step_sec: int) -> Dict[str, Any]:
     now = int(time.time())
     start = now - minutes * 60
     end = now
@@ -66,8 +81,23 @@ async def get_namespace_resource_usage(
         ')'
     )
 
-    cpu_series = await prom.query_range(cpu_query, start, end, step_sec)
-    mem_series = await prom.query_range(mem_query, start, end, step_sec)
+    # Efficiency 계산용: 현재 시점 request vs usage
+    cpu_req_query = (
+        f'namespace_cpu:kube_pod_container_resource_requests:sum'
+        f'{{namespace="{namespace}"}}'
+    )
+    mem_req_query = (
+        f'namespace_memory:kube_pod_container_resource_requests:sum'
+        f'{{namespace="{namespace}"}}'
+    )
+
+    # 네 쿼리는 서로 독립이므로 동시에
+    cpu_series, mem_series, cpu_req_res, mem_req_res = await fan.gather(
+        fan.call(prom.query_range, cpu_query, start, end, step_sec),
+        fan.call(prom.query_range, mem_query, start, end, step_sec),
+        fan.call(prom.query_instant, cpu_req_query),
+        fan.call(prom.query_instant, mem_req_query),
+    )
 
     cpu_points: List[Dict[str, Any]] = []
     if cpu_series:
@@ -86,19 +116,6 @@ async def get_namespace_resource_usage(
             except ValueError:
                 continue
 
-    # Efficiency 계산용: 현재 시점 request vs usage
-    cpu_req_query = (
-        f'namespace_cpu:kube_pod_container_resource_requests:sum'
-        f'{{namespace="{namespace}"}}'
-    )
-    mem_req_query = (
-        f'namespace_memory:kube_pod_container_resource_requests:sum'
-        f'{{namespace="{namespace}"}}'
-    )
-
-    cpu_req_res = await prom.query_instant(cpu_req_query)
-    mem_req_res = await prom.query_instant(mem_req_query)
-
     cpu_req = _extract_single_value(cpu_req_res)
     mem_req = _extract_single_value(mem_req_res)
 
@@ -163,9 +180,14 @@ async def get_namespace_cost_summary(namespace: str):
     - 7d
     - month (monthToDate 느낌으로 사용)
     """
-    today_alloc = await kc.allocation(window="today", aggregation="namespace", namespace=namespace)
-    last7_alloc = await kc.allocation(window="7d", aggregation="namespace", namespace=namespace)
-    month_alloc = await kc.allocation(window="month", aggregation="namespace", namespace=namespace)
+    return await _cost_summary(_fanout(), namespace)
+
+
+async def _cost_summary(fan: FanOut, namespace: str) -> Dict[str, Any]:
+    today_alloc, last7_alloc, month_alloc = await fan.gather(*(
+        fan.call(kc.allocation, window=window, aggregation="namespace", namespace=namespace)
+        for window in ("today", "7d", "month")
+    ))
 
     today_cost = _sum_namespace_cost_from_allocation(today_alloc, namespace)
     last7_cost = _sum_namespace_cost_from_allocation(last7_alloc, namespace)
@@ -259,6 +281,10 @@ async def get_namespace_health(namespace: str):
     - 컨테이너 재시작 수 합계
     - Running / Failed Pod 개수
     """
+    return await _health(_fanout(), namespace)
+
+
+async def _health(fan: FanOut, namespace: str) -> Dict[str, Any]:
     queries = {
         "restarts_total": (
             f'sum(kube_pod_container_status_restarts_total'
@@ -274,10 +300,10 @@ async def get_namespace_health(namespace: str):
         ),
     }
 
-    results: Dict[str, float] = {}
-    for key, q in queries.items():
-        res = await prom.query_instant(q)
-        results[key] = _extract_single_value(res)
+    responses = await fan.gather(*(fan.call(prom.query_instant, q) for q in queries.values()))
+    results: Dict[str, float] = {
+        key: _extract_single_value(res) for key, res in zip(queries, responses)
+    }
 
     return {
         "namespace": namespace,
@@ -286,4 +312,52 @@ async def get_namespace_health(namespace: str):
             "running": results["pods_running"],
             "failed": results["pods_failed"],
         },
-    }
\ No newline at end of file
+    }
+
+
+OVERVIEW_SECTIONS = ("usage", "health", "cost")
+
+
+@router.get("/{namespace}/overview")
+async def get_namespace_overview(
+    namespace: str,
+    minutes: int = Query(60, ge=5, le=24 * 60, description="조회 기간 (분 단위)"),
+    step_sec: int = Query(60, ge=10, le=3600, description="샘플링 간격 (초)"),
+    include: str = Query(",".join(OVERVIEW_SECTIONS), description="응답에 담을 항목 (usage,health,cost 중 쉼표로 구분)"),
+):
+    """
+    대시보드 metrics 패널용: resource-usage / health / cost-summary 를 한 번에.
+    include 에 적은 항목만 조회한다 (패널에 안 보이는 항목의 upstream 호출은 보내지 않음).
+    세 묶음의 upstream 호출이 동시 호출 수 제한과 마감 시각을 함께 쓴다.
+    일부만 실패하면 해당 항목은 null, errors 에 이유를 담아 나머지를 응답한다 (모두 실패하면 그 에러 그대로).
+    """
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = names - set(OVERVIEW_SECTIONS)
+    if not names or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"include 는 {', '.join(OVERVIEW_SECTIONS)} 중에서 골라야 합니다: {include}",
+        )
+
+    fan = _fanout(OVERVIEW_CONCURRENCY)
+    loaders = {
+        "usage": lambda: _resource_usage(fan, namespace, minutes, step_sec),
+        "health": lambda: _health(fan, namespace),
+        "cost": lambda: _cost_summary(fan, namespace),
+    }
+    sections = {name: loaders[name]() for name in OVERVIEW_SECTIONS if name in names}
+    results = await fan.gather(*sections.values(), return_exceptions=True)
+
+    response: Dict[str, Any] = {"namespace": namespace, "errors": {}}
+    for name, result in zip(sections, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, HTTPException):
+                raise result
+            response[name] = None
+            response["errors"][name] = result.detail
+        else:
+            response[name] = result
+
+    if len(response["errors"]) == len(sections):
+        raise next(r for r in results if isinstance(r, HTTPException))
+    return response
@@ -1,25 +1,34 @@
-import asyncio
-from fastapi import APIRouter, HTTPException, status, Depends   
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from database.yoitang import get_db
-from crud.service import create_service, get_service, get_services_by_user, get_services_count_by_user, get_success_services_count_by_user, get_today_user_services_count, get_user_service_success_rate
+from crud.service import create_service, get_service, get_service_cached, get_services_by_user
+from crud.user_summary import get_user_summary
 from crud.deploy import create_deploy, get_latest_deploy_by_service, update_deploy_status
-from schemas.service import ServiceCreate, ServiceResponse, ServiceDeployInfo
+from schemas.service import ServiceCreate, ServiceResponse, ServiceDeployInfo, UserSummaryResponse
 from schemas.deploy import DeployCreate, DeployRequest
+from core.config import env_int
 from core.git_util import get_latest_commit
-from core.jenkins_trigger import trigger_jenkins_build
+from core.pagination import cursor_param, paginate
+from core.deploy_scheduler import deploy_scheduler
+from core.secret_box import check_secret_key
+from models.deploy_job import DeployLane
 
 router = APIRouter()
 
+# 유저별 서비스 목록 페이지 크기 (기본 / 최대)
+SERVICE_PAGE_SIZE = env_int("SERVICE_PAGE_SIZE", 50)
+SERVICE_PAGE_MAX = env_int("SERVICE_PAGE_MAX", 200)
+
 # 서비스 생성
 @router.post("/", response_model=ServiceResponse, summary="DB에 새 서비스 생성")
-async def create_new_service(service_data: ServiceCreate, db: Session = Depends(get_db)):
-    return create_service(db, service_data)
+async def create_new_service(service_data: ServiceCreate, db: AsyncSession = Depends(get_db)):
+    return await create_service(db, service_data)
 
 # 서비스 내용 조회
 @router.get("/{service_id}", response_model=ServiceResponse, summary="단일 서비스 정보 조회")
-async def get_service_by_id(service_id: int, db: Session = Depends(get_db)):
-    service = get_service(db, service_id)
+async def get_service_by_id(service_id: int, db: AsyncSession = Depends(get_db)):
+    service = await get_service_cached(db, service_id)
 
     if not service:
         raise HTTPException(
@@ -29,48 +38,66 @@ async def get_service_by_id(service_id: int, db: Session = Depends(get_db)):
 
     return service
 
-# 특정 유저의 모든 서비스 조회
-@router.get("/user/{user_id}", response_model=list[ServiceResponse], summary="특정 유저의 모든 서비스 조회")
-async def get_services_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    services = get_services_by_user(db, user_id)
-    return services
+# 특정 유저의 서비스 목록 조회 (최근 생성 순, 다음 페이지는 X-Next-Cursor 헤더)
+@router.get("/user/{user_id}", response_model=list[ServiceResponse], summary="특정 유저의 서비스 목록 조회")
+async def get_services_by_user_id(
+    user_id: int,
+    response: Response,
+    limit: int = Query(SERVICE_PAGE_SIZE, ge=1, le=SERVICE_PAGE_MAX),
+    after: tuple | None = Depends(cursor_param),
+    db: AsyncSession = Depends(get_db),
+):
+    services = await get_services_by_user(db, user_id, limit + 1, after)
+    return paginate(services, limit, response, lambda s: (s.created_date, s.service_id))
+
+# 대시보드용 유저 요약 (서비스 수 / 활성 서비스 수 / 오늘 생성·배포 수 / 오늘 성공률)
+@router.get("/user/{user_id}/summary", response_model=UserSummaryResponse, summary="특정 유저의 대시보드 요약 조회")
+async def get_user_summary_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return await get_user_summary(db, user_id)
 
 # 특정 유저의 서비스 개수 조회
 @router.get("/user/{user_id}/count", response_model=int, summary="특정 유저의 서비스 개수 조회")
-async def get_services_count_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    count = get_services_count_by_user(db, user_id)
-    return count
+async def get_services_count_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return (await get_user_summary(db, user_id))["services_count"]
 
 # 특정 유저의 활성화 서비스 개수 조회
 @router.get("/user/{user_id}/active_count", response_model=int, summary="특정 유저의 활성화 서비스 개수 조회")
-async def get_success_services_count_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    count = get_success_services_count_by_user(db, user_id)
-    return count
+async def get_success_services_count_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return (await get_user_summary(db, user_id))["active_services_count"]
 
 # 오늘 생성된 유저의 서비스 개수 조회
 @router.get("/user/{user_id}/today_count", response_model=int, summary="오늘 생성된 유저의 서비스 개수 조회")
-async def get_today_user_services_count_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    count = get_today_user_services_count(db, user_id)
-    return count
+async def get_today_user_services_count_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return (await get_user_summary(db, user_id))["today_services_count"]
 
 # 특정 유저의 오늘 서비스 성공률 조회
 @router.get("/user/{user_id}/success_rate", response_model=int, summary="특정 유저의 오늘 서비스 성공률 조회")
-async def get_user_service_success_rate_by_user_id(user_id: int, db: Session = Depends(get_db)):
-    success_rate = get_user_service_success_rate(db, user_id)
-    return success_rate
+async def get_user_service_success_rate_by_user_id(user_id: int, db: AsyncSession = Depends(get_db)):
+    return (await get_user_summary(db, user_id))["success_rate"]
 
 # 새 서비스 자동 배포
 @router.post("/auto_deploy", summary="새 서비스 자동 배포")
-async def create_auto_deploy(auto_deploy_data: ServiceDeployInfo, db: Session = Depends(get_db)):
+async def create_auto_deploy(auto_deploy_data: ServiceDeployInfo, db: AsyncSession = Depends(get_db)):
+    # git_pat 은 대기열에 암호화해서 넣으므로, 키가 없으면 서비스를 만들기 전에 거절
+    if auto_deploy_data.git_pat:
+        try:
+            check_secret_key()
+        except RuntimeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=str(e),
+            )
+
     service_create = ServiceCreate(
         user_id=auto_deploy_data.user_id,
         name=auto_deploy_data.name,
         domain=auto_deploy_data.domain,
         git_repo=auto_deploy_data.git_repo,
     )
-    service = create_service(db, service_create)
+    service = await create_service(db, service_create)
 
-    commit_id, commit_message = get_latest_commit(auto_deploy_data.git_repo, auto_deploy_data.git_branch, auto_deploy_data.git_pat)
+    # GitHub API 호출(requests)은 동기라 threadpool에서 실행
+    commit_id, commit_message = await run_in_threadpool(get_latest_commit, auto_deploy_data.git_repo, auto_deploy_data.git_branch, auto_deploy_data.git_pat)
 
     deploy_create = DeployCreate(
         service_id=service.service_id,
@@ -78,7 +105,7 @@ async def create_auto_deploy(auto_deploy_data: ServiceDeployInfo, db: Session =
         commit_id=commit_id,
         commit_message=commit_message,
     )
-    deploy = create_deploy(db, deploy_create)
+    deploy = await create_deploy(db, deploy_create)
 
     deploy_req = DeployRequest(
         prefix=service.domain,
@@ -88,34 +115,34 @@ async def create_auto_deploy(auto_deploy_data: ServiceDeployInfo, db: Session =
         frontend_stack="react-vite",
         git_pat=auto_deploy_data.git_pat
     )
-    asyncio.create_task(trigger_jenkins_build(deploy.deploy_id, deploy_req))
+    await deploy_scheduler.submit(db, deploy.deploy_id, service.service_id, deploy_req, DeployLane.NEW)
 
     return {
         "service": service,
         "deploy": deploy,
-        "message": "Service and deploy created, Jenkins build triggered asynchronously."
+        "message": "Service and deploy created, Jenkins build queued."
     }
 
 # 서비스 다시 배포
 @router.post("/redeploy/{service_id}", summary="서비스 다시 배포")
-async def redeploy_service(service_id: int, db: Session = Depends(get_db)):    
-    deploy = get_latest_deploy_by_service(db, service_id)
+async def redeploy_service(service_id: int, db: AsyncSession = Depends(get_db)):    
+    deploy = await get_latest_deploy_by_service(db, service_id)
     if not deploy:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="해당 서비스의 배포 이력이 존재하지 않습니다."
         )
     
-    update_deploy_status(db, deploy.deploy_id, "ARCHIVED")
+    await update_deploy_status(db, deploy.deploy_id, "ARCHIVED")
     
-    service = get_service(db, service_id)
+    service = await get_service(db, service_id)
     if not service:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, 
             detail="해당 서비스가 존재하지 않습니다."
         )
 
-    commit_id, commit_message = get_latest_commit(service.git_repo, deploy.git_branch)
+    commit_id, commit_message = await run_in_threadpool(get_latest_commit, service.git_repo, deploy.git_branch)
 
     deploy_create = DeployCreate(
         service_id=service.service_id,
@@ -123,7 +150,7 @@ async def redeploy_service(service_id: int, db: Session = Depends(get_db)):
         commit_id=commit_id,
         commit_message=commit_message,
     )
-    new_deploy = create_deploy(db, deploy_create)
+    new_deploy = await create_deploy(db, deploy_create)
 
     deploy_req = DeployRequest(
         prefix=service.domain,
@@ -132,10 +159,10 @@ async def redeploy_service(service_id: int, db: Session = Depends(get_db)):
         use_repo_dockerfile=False,
         frontend_stack="react-vite",
     )
-    asyncio.create_task(trigger_jenkins_build(new_deploy.deploy_id, deploy_req))
+    await deploy_scheduler.submit(db, new_deploy.deploy_id, service.service_id, deploy_req, DeployLane.REDEPLOY)
 
     return {
         "service": service,
         "deploy": new_deploy,
-        "message": "Redeploy created, Jenkins build triggered asynchronously."
+        "message": "Redeploy created, Jenkins build queued."
     }
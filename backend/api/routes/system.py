@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.yoitang import async_engine, get_db
+from database.pool_monitor import pool_monitor
+
+from core.jenkins_client import crumb_cache
+from core.build_watcher import build_watcher
+from core.deploy_scheduler import deploy_scheduler
+from core.log_tail_cache import log_tail_cache
+from core.entity_cache import entity_cache_stats
+from core.metrics_cache import metrics_cache_stats
+from core.deploy_events import deploy_event_hub
+from core.log_tiering import log_tiering
+
+router = APIRouter()
+
+# Jenkins 연동 상태 (crumb 캐시 hit/miss 등)
+@router.get("/jenkins", summary="Jenkins 연동 상태 조회")
+async def get_jenkins_stats():
+    return {
+        "crumb_cache": crumb_cache.stats(),
+        "build_watcher": build_watcher.stats(),
+        "log_tail_cache": log_tail_cache.stats(),
+    }
+
+# 배포 스케줄러 대기열 깊이 / 대기 시간
+@router.get("/scheduler", summary="배포 스케줄러 상태 조회")
+async def get_scheduler_stats(db: AsyncSession = Depends(get_db)):
+    return await deploy_scheduler.stats(db)
+
+# DB 커넥션 풀 사용량 / checkout 대기 시간
+@router.get("/db-pool", summary="DB 커넥션 풀 상태 조회")
+async def get_db_pool_stats():
+    return pool_monitor.stats(async_engine.pool)
+
+# 서비스/배포 / Prometheus·Kubecost 조회 캐시 hit/miss
+@router.get("/cache", summary="서비스/배포 / metrics 조회 캐시 상태 조회")
+async def get_cache_stats():
+    return {**entity_cache_stats(), **metrics_cache_stats()}
+
+# 배포 상태 이벤트 LISTEN 연결 / 구독자 수
+@router.get("/deploy-events", summary="배포 상태 이벤트 스트림 상태 조회")
+async def get_deploy_events_stats():
+    return deploy_event_hub.stats()
+
+# 로그 object storage 이동 / 보존 기간 정리
+@router.get("/log-tiering", summary="로그 보관/정리 작업 상태 조회")
+async def get_log_tiering_stats():
+    return log_tiering.stats()
@@ -0,0 +1,197 @@
+"""
+대시보드 카운트(active_count / success_rate) 쿼리 수와 지연 시간 측정.
+
+DB_* 환경 변수가 가리키는 DB에 벤치마크 전용 user_id로 서비스/배포를 넣고,
+예전 방식(서비스마다 최근 배포 조회, N+1), 한 번의 집계 쿼리(DISTINCT ON),
+요약 테이블 조회(crud.user_summary)를 비교한 뒤 데이터를 지운다.
+
+    cd backend
+    python benchmarks/dashboard_queries.py --services 3000 --deploys 5 --repeat 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, event, func, insert, select
+
+from crud.deploy import get_latest_deploy_by_service
+from crud.service import get_services_by_user
+from crud.user_summary import _local_day, get_user_summary, local_today, rebuild_user_summary
+from database.yoitang import AsyncSessionLocal, async_engine
+from models.deploy import Deploy, DeployStatus
+from models.service import Service
+from models.user_summary import UserDailySummary, UserSummary
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        event.listen(async_engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+# 예전 구현 (비교용)
+async def legacy_success_services_count(db, user_id: int) -> int:
+    count = 0
+    for service in await get_services_by_user(db, user_id):
+        latest_deploy = await get_latest_deploy_by_service(db, service.service_id)
+        if latest_deploy and latest_deploy.status == DeployStatus.SUCCESS:
+            count += 1
+    return count
+
+
+async def legacy_success_rate(db, user_id: int) -> int:
+    today = date.today()
+    total = await db.scalar(
+        select(func.count()).select_from(Service).where(Service.user_id == user_id, Service.created_date >= today)
+    )
+    if total == 0:
+        return 0
+    success = 0
+    for service in await get_services_by_user(db, user_id):
+        latest_deploy = await get_latest_deploy_by_service(db, service.service_id)
+        if latest_deploy and latest_deploy.status == DeployStatus.SUCCESS and latest_deploy.created_date.date() == today:
+            success += 1
+    return int((success / total) * 100)
+
+
+# 집계 쿼리 (비교용, 요약 테이블 도입 전 crud.service 구현 / 날짜는 DASHBOARD_TZ 기준)
+def _latest_deploys_by_user(user_id: int):
+    # 유저의 서비스별 가장 최근 배포 한 건 (DISTINCT ON (service_id))
+    return select(Deploy.service_id, Deploy.status, Deploy.created_date).join(
+        Service, Deploy.service_id == Service.service_id
+    ).where(
+        Service.user_id == user_id
+    ).distinct(Deploy.service_id).order_by(
+        Deploy.service_id, Deploy.created_date.desc(), Deploy.deploy_id.desc()
+    ).subquery()
+
+
+def _success_services_count_query(user_id: int, day: date | None = None):
+    latest = _latest_deploys_by_user(user_id)
+    query = select(func.count()).select_from(latest).where(latest.c.status == DeployStatus.SUCCESS)
+    if day is not None:
+        query = query.where(_local_day(latest.c.created_date) == day)
+    return query
+
+
+async def setbased_success_services_count(db, user_id: int) -> int:
+    return await db.scalar(_success_services_count_query(user_id))
+
+
+async def setbased_success_rate(db, user_id: int) -> int:
+    # 오늘 생성된 서비스 수와 오늘 성공한 서비스 수를 한 번의 쿼리로 조회
+    today = local_today()
+    total_services = select(func.count(Service.service_id)).where(
+        Service.user_id == user_id,
+        _local_day(Service.created_date) == today,
+    ).scalar_subquery()
+    success_services = _success_services_count_query(user_id, today).scalar_subquery()
+
+    total_services, success_services = (await db.execute(select(total_services, success_services))).one()
+    if total_services == 0:
+        return 0
+    return int((success_services / total_services) * 100)
+
+
+async def summary_active_count(db, user_id: int) -> int:
+    return (await get_user_summary(db, user_id))["active_services_count"]
+
+
+async def summary_success_rate(db, user_id: int) -> int:
+    return (await get_user_summary(db, user_id))["success_rate"]
+
+
+async def seed(db, user_id: int, services: int, deploys: int) -> None:
+    service_ids = (await db.scalars(
+        insert(Service.__table__).returning(Service.__table__.c.service_id),
+        [{"user_id": user_id, "name": f"bench-{i}", "domain": f"bench-{i}", "git_repo": "https://example.com/bench.git"} for i in range(services)],
+    )).all()
+
+    now = datetime.now()
+    statuses = list(DeployStatus)
+    rows = []
+    for service_id in service_ids:
+        for n in range(deploys):
+            rows.append({
+                "service_id": service_id,
+                "git_branch": "main",
+                "commit_id": "bench",
+                "commit_message": "bench",
+                "status": random.choice(statuses).name,
+                "created_date": now - timedelta(hours=n * 12),
+            })
+    await db.execute(insert(Deploy.__table__), rows)
+    await db.commit()
+    # 직접 INSERT 했으므로 요약 테이블은 다시 계산
+    await rebuild_user_summary(db, user_id)
+
+
+async def cleanup(db, user_id: int) -> None:
+    service_ids = select(Service.service_id).where(Service.user_id == user_id)
+    await db.execute(delete(Deploy).where(Deploy.service_id.in_(service_ids)))
+    await db.execute(delete(Service).where(Service.user_id == user_id))
+    await db.execute(delete(UserSummary).where(UserSummary.user_id == user_id))
+    await db.execute(delete(UserDailySummary).where(UserDailySummary.user_id == user_id))
+    await db.commit()
+
+
+async def measure(counter: QueryCounter, fn, db, user_id: int, repeat: int) -> tuple[int, int, list[float]]:
+    timings = []
+    queries = 0
+    result = None
+    for _ in range(repeat):
+        db.expire_all()
+        before = counter.count
+        started = time.perf_counter()
+        result = await fn(db, user_id)
+        timings.append((time.perf_counter() - started) * 1000)
+        queries = counter.count - before
+    return result, queries, timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--services", type=int, default=3000)
+    parser.add_argument("--deploys", type=int, default=5, help="서비스당 배포 수")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--user-id", type=int, default=9_000_000_001, help="벤치마크 전용 user_id (끝나면 삭제)")
+    args = parser.parse_args()
+
+    counter = QueryCounter()
+    async with AsyncSessionLocal() as db:
+        await cleanup(db, args.user_id)
+        try:
+            await seed(db, args.user_id, args.services, args.deploys)
+            print(f"seeded services={args.services} deploys={args.services * args.deploys}")
+
+            cases = [
+                ("active_count (legacy)", legacy_success_services_count),
+                ("active_count (set-based)", setbased_success_services_count),
+                ("active_count (summary)", summary_active_count),
+                ("success_rate (legacy)", legacy_success_rate),
+                ("success_rate (set-based)", setbased_success_rate),
+                ("success_rate (summary)", summary_success_rate),
+            ]
+            for name, fn in cases:
+                result, queries, timings = await measure(counter, fn, db, args.user_id, args.repeat)
+                print(
+                    f"{name:24s} result={result:<6} queries={queries:<6} "
+                    f"p50={statistics.median(timings):8.2f}ms max={max(timings):8.2f}ms"
+                )
+        finally:
+            await db.rollback()
+            await cleanup(db, args.user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+"""
+자주 쓰는 crud 조회가 인덱스를 타는지 EXPLAIN으로 확인.
+
+DB_* 환경 변수가 가리키는 DB(alembic upgrade head 가 적용된 상태)에
+한 트랜잭션 안에서 데이터를 넣고 ANALYZE 한 뒤, crud 함수들이 실제로 보내는 SELECT를
+그대로 EXPLAIN 한다. 핫 테이블에 Seq Scan이 있으면 exit 1. 끝나면 rollback 하므로 데이터는 남지 않는다.
+
+    cd backend
+    alembic upgrade head
+    python benchmarks/explain_hot_paths.py --users 200 --services 50 --deploys 4
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, insert, text
+
+from crud.deploy import get_deploys_by_service, get_latest_deploy_by_service
+from crud.log import get_log, get_log_chunk_index, get_log_meta
+from crud.service import get_services_by_user
+from crud.user_summary import get_user_summary, local_today
+from database.yoitang import AsyncSessionLocal
+from models.deploy import Deploy
+from models.log import Log
+from models.log_chunk import LogChunk
+from models.service import Service
+from models.user_summary import UserDailySummary, UserSummary
+
+
+# Seq Scan이 나오면 안 되는 테이블
+HOT_TABLES = {"deploys", "services", "logs", "log_chunks", "user_summaries", "user_daily_summaries"}
+
+# 벤치마크 전용 user_id 시작값
+BASE_USER_ID = 9_100_000_000
+
+
+async def seed(db, users: int, services: int, deploys: int) -> tuple[int, int, int]:
+    now = datetime.now()
+    service_ids = (await db.scalars(
+        insert(Service.__table__).returning(Service.__table__.c.service_id, sort_by_parameter_order=True),
+        [
+            {"user_id": BASE_USER_ID + u, "name": f"explain-{u}-{i}", "domain": f"explain-{u}-{i}",
+             "git_repo": "https://example.com/explain.git", "created_date": now - timedelta(days=i % 30)}
+            for u in range(users) for i in range(services)
+        ],
+    )).all()
+
+    deploy_ids = (await db.scalars(
+        insert(Deploy.__table__).returning(Deploy.__table__.c.deploy_id, sort_by_parameter_order=True),
+        [
+            {"service_id": service_id, "git_branch": "main", "commit_id": "explain", "commit_message": "explain",
+             "status": "SUCCESS" if n % 3 else "FAILED", "created_date": now - timedelta(hours=n * 12)}
+            for service_id in service_ids for n in range(deploys)
+        ],
+    )).all()
+
+    await db.execute(insert(Log.__table__), [{"deploy_id": d, "build_log": "ok"} for d in deploy_ids])
+    await db.execute(insert(LogChunk.__table__), [
+        {"deploy_id": d, "log_type": "build", "seq": 0, "codec": "none", "raw_size": 2, "data": b"ok"}
+        for d in deploy_ids
+    ])
+    # 요약 테이블은 행이 작아 유저 수가 적으면 Seq Scan이 더 싸므로 서비스가 없는 유저 요약도 채운다
+    await db.execute(insert(UserSummary.__table__), [
+        {"user_id": BASE_USER_ID + u, "services_count": services, "active_services_count": services // 2}
+        for u in range(users * 50)
+    ])
+    await db.execute(insert(UserDailySummary.__table__), [
+        {"user_id": BASE_USER_ID + u, "day": local_today() - timedelta(days=d), "services_created": 1}
+        for u in range(users) for d in range(30)
+    ])
+    for table in HOT_TABLES:
+        await db.execute(text(f"ANALYZE {table}"))
+
+    return BASE_USER_ID + users // 2, service_ids[len(service_ids) // 2], deploy_ids[len(deploy_ids) // 2]
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") in HOT_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--services", type=int, default=50, help="유저당 서비스 수")
+    parser.add_argument("--deploys", type=int, default=4, help="서비스당 배포 수")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        connection = await db.connection()
+        # EXPLAIN은 asyncpg 연결에 직접 보낸다 (캡처한 SQL은 $1 형식 파라미터)
+        driver = (await connection.get_raw_connection()).driver_connection
+        try:
+            user_id, service_id, deploy_id = await seed(db, args.users, args.services, args.deploys)
+            # 목록 중간쯤의 keyset (다음 페이지 조회)
+            service_cursor = (datetime.now() - timedelta(days=15), 2 ** 62)
+            deploy_cursor = (datetime.now() - timedelta(hours=12), 2 ** 62)
+
+            captured: list[tuple[str, object]] = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    captured.append((statement, parameters))
+
+            cases = [
+                ("get_latest_deploy_by_service", lambda: get_latest_deploy_by_service(db, service_id)),
+                ("get_deploys_by_service", lambda: get_deploys_by_service(db, service_id)),
+                ("get_deploys_by_service (cursor)", lambda: get_deploys_by_service(db, service_id, 5, deploy_cursor)),
+                ("get_services_by_user", lambda: get_services_by_user(db, user_id, 51)),
+                ("get_services_by_user (cursor)", lambda: get_services_by_user(db, user_id, 51, service_cursor)),
+                ("get_user_summary", lambda: get_user_summary(db, user_id)),
+                ("get_log", lambda: get_log(db, deploy_id)),
+                ("get_log_meta", lambda: get_log_meta(db, deploy_id)),
+                ("get_log_chunk_index", lambda: get_log_chunk_index(db, deploy_id, "build")),
+            ]
+
+            failures = 0
+            for name, call in cases:
+                captured.clear()
+                event.listen(connection.sync_connection, "before_cursor_execute", capture)
+                try:
+                    await call()
+                finally:
+                    event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+                for statement, parameters in captured:
+                    plan = await driver.fetchval("EXPLAIN (FORMAT JSON) " + statement, *parameters)
+                    if isinstance(plan, str):
+                        plan = json.loads(plan)
+                    plan = plan[0]["Plan"]
+
+                    scans = seq_scans(plan)
+                    status = "FAIL" if scans else "ok"
+                    detail = f" (Seq Scan on {', '.join(scans)})" if scans else ""
+                    print(f"[{status:4s}] {name}{detail}")
+                    if args.verbose or scans:
+                        print(json.dumps(plan, indent=2))
+                    failures += bool(scans)
+        finally:
+            await db.rollback()
+
+    if failures:
+        print(f"{failures}개 조회가 Seq Scan으로 실행됩니다.")
+        sys.exit(1)
+    print("모든 조회가 인덱스를 사용합니다.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
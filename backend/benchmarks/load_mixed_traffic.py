@@ -0,0 +1,112 @@
+"""
+실행 중인 API 서버에 대시보드/로그 조회가 섞인 동시 요청을 보내 처리량과 지연 시간을 측정.
+
+    cd backend
+    uvicorn main:app --port 8080 &
+    python benchmarks/load_mixed_traffic.py --base-url http://127.0.0.1:8080 --concurrency 50 --duration 20
+
+처음에 /service/, /deploy/bulk, /log/bulk 로 벤치마크 데이터를 넣는다 (삭제하지 않으므로 테스트 DB에서 실행).
+/system/jenkins 는 DB를 쓰지 않는 요청으로, 다른 요청의 DB 호출이 event loop를 막는지 보여준다.
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+
+import httpx
+
+
+async def seed(client: httpx.AsyncClient, services: int, deploys: int) -> tuple[int, list[int], list[int]]:
+    user_id = random.randint(8_000_000_000, 8_999_999_999)
+    service_ids = []
+    for i in range(services):
+        r = await client.post("/service/", json={
+            "user_id": user_id, "name": f"load-{i}", "domain": f"load-{i}", "git_repo": "https://github.com/load/test",
+        })
+        r.raise_for_status()
+        service_ids.append(r.json()["service_id"])
+
+    r = await client.post("/deploy/bulk", json=[
+        {"service_id": s, "git_branch": "main", "commit_id": "load", "commit_message": "load", "status": "SUCCESS"}
+        for s in service_ids for _ in range(deploys)
+    ])
+    r.raise_for_status()
+    deploy_ids = r.json()["deploy_ids"]
+
+    log_text = "".join(f"[{n:05d}] step ok\n" for n in range(2000))
+    r = await client.post("/log/bulk", json=[{"deploy_id": d, "build_log": log_text} for d in deploy_ids])
+    r.raise_for_status()
+    return user_id, service_ids, deploy_ids
+
+
+def requests_for(user_id: int, service_ids: list[int], deploy_ids: list[int]):
+    return [
+        ("active_count", 3, lambda: f"/service/user/{user_id}/active_count"),
+        ("success_rate", 3, lambda: f"/service/user/{user_id}/success_rate"),
+        ("services", 2, lambda: f"/service/user/{user_id}"),
+        ("latest_deploy", 3, lambda: f"/deploy/service/latest/{random.choice(service_ids)}"),
+        ("log_meta", 2, lambda: f"/log/{random.choice(deploy_ids)}/meta"),
+        ("log_tail", 2, lambda: f"/log/{random.choice(deploy_ids)}/build?tail_lines=50"),
+        ("no_db", 1, lambda: "/system/jenkins"),
+    ]
+
+
+async def worker(client, mix, weights, deadline, latencies, errors) -> None:
+    while time.monotonic() < deadline:
+        name, _, path = random.choices(mix, weights=weights)[0]
+        started = time.perf_counter()
+        try:
+            r = await client.get(path())
+            if r.status_code >= 500:
+                errors[name] += 1
+                continue
+        except httpx.HTTPError:
+            errors[name] += 1
+            continue
+        latencies[name].append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values: list[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8080")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간(초)")
+    parser.add_argument("--services", type=int, default=300)
+    parser.add_argument("--deploys", type=int, default=3, help="서비스당 배포 수")
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=60) as client:
+        user_id, service_ids, deploy_ids = await seed(client, args.services, args.deploys)
+        mix = requests_for(user_id, service_ids, deploy_ids)
+        weights = [w for _, w, _ in mix]
+
+        latencies: dict[str, list[float]] = defaultdict(list)
+        errors: dict[str, int] = defaultdict(int)
+        deadline = time.monotonic() + args.duration
+        started = time.monotonic()
+        await asyncio.gather(*[
+            worker(client, mix, weights, deadline, latencies, errors) for _ in range(args.concurrency)
+        ])
+        elapsed = time.monotonic() - started
+
+    total = sum(len(v) for v in latencies.values())
+    print(f"concurrency={args.concurrency} duration={elapsed:.1f}s requests={total} "
+          f"throughput={total / elapsed:.1f} req/s errors={sum(errors.values())}")
+    for name, _, _ in mix:
+        values = latencies.get(name) or [0.0]
+        print(
+            f"  {name:14s} n={len(latencies.get(name, [])):<6} p50={statistics.median(values):8.1f}ms "
+            f"p95={percentile(values, 0.95):8.1f}ms p99={percentile(values, 0.99):8.1f}ms errors={errors.get(name, 0)}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
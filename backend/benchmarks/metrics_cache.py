@@ -0,0 +1,128 @@
+"""
+Prometheus / Kubecost 응답 캐시(core.metrics_cache)의 upstream 호출 감소 측정.
+
+지연(--latency-ms)을 넣은 가짜 Prometheus / Kubecost 서버를 로컬에 띄우고,
+같은 namespace의 /overview 를 viewer --viewers 명이 동시에 --waves 번 조회한다.
+캐시를 거치지 않았을 때와 캐시를 켰을 때의 upstream 호출 수 / 응답 시간을 비교한다.
+
+    cd backend
+    python benchmarks/metrics_cache.py --viewers 50 --waves 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from api.routes import metrics
+from core import http_pool, metrics_cache
+
+
+def start_fake_upstream(latency: float, counter: list[int]) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            counter[0] += 1
+            time.sleep(latency)
+            if self.path.startswith("/api/v1/query_range"):
+                body = {"status": "success", "data": {"result": [{"metric": {}, "values": [[0, "1"], [60, "2"]]}]}}
+            elif self.path.startswith("/api/v1/query"):
+                body = {"status": "success", "data": {"result": [{"metric": {}, "value": [0, "4"]}]}}
+            else:
+                body = {"code": 200, "data": [{"bench": {"totalCost": 1.5}}]}
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(client: httpx.AsyncClient, path: str, viewers: int, waves: int, pause: float) -> list[float]:
+    async def view() -> float:
+        started = time.perf_counter()
+        resp = await client.get(path)
+        resp.raise_for_status()
+        return (time.perf_counter() - started) * 1000
+
+    samples = []
+    for _ in range(waves):
+        samples.extend(await asyncio.gather(*(view() for _ in range(viewers))))
+        await asyncio.sleep(pause)
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--viewers", type=int, default=50, help="동시에 같은 namespace를 보는 viewer 수")
+    parser.add_argument("--waves", type=int, default=5, help="조회 반복 횟수")
+    parser.add_argument("--pause", type=float, default=1.0, help="반복 사이 대기(초)")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="upstream 호출 하나의 지연")
+    parser.add_argument("--namespace", default="bench")
+    args = parser.parse_args()
+
+    counter = [0]
+    server = start_fake_upstream(args.latency_ms / 1000, counter)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    metrics.prom.base_url = base_url
+    metrics.kc.base_url = base_url
+    # viewer 수만큼 동시에 upstream으로 나가도 풀 대기에 막히지 않도록
+    os.environ.setdefault("PROMETHEUS_MAX_CONNECTIONS", "200")
+    os.environ.setdefault("KUBECOST_MAX_CONNECTIONS", "200")
+    os.environ.setdefault("METRICS_UPSTREAM_DEADLINE_SEC", "60")
+    metrics.UPSTREAM_DEADLINE_SEC = float(os.environ["METRICS_UPSTREAM_DEADLINE_SEC"])
+
+    from main import app
+    transport = httpx.ASGITransport(app=app)
+    path = f"/metrics/namespaces/{args.namespace}/overview"
+    caches = (metrics_cache.prometheus_instant_cache, metrics_cache.kubecost_cache)
+    series_store = metrics_cache.prometheus_series_store
+
+    results = {}
+    for label in ("no cache", "cache"):
+        series_store.clear()
+        for cache in caches:
+            cache.clear()
+        if label == "no cache":
+            # 캐시 / single-flight 없이 매번 loader 호출
+            for cache in caches:
+                cache.get_or_load = lambda key, loader: loader()
+            series_store.get_range = lambda key, start, end, step, loader: loader(start, end)
+        else:
+            for cache in caches:
+                del cache.get_or_load
+            del series_store.get_range
+        counter[0] = 0
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            samples = await run(client, path, args.viewers, args.waves, args.pause)
+        results[label] = (counter[0], statistics.median(samples), max(samples))
+
+    print(f"{args.viewers} viewers x {args.waves} waves of /overview, upstream latency {args.latency_ms:.0f}ms")
+    print(f"{'':10s} {'upstream calls':>15s} {'p50 ms':>10s} {'max ms':>10s}")
+    for label, (calls, p50, worst) in results.items():
+        print(f"{label:10s} {calls:15d} {p50:10.1f} {worst:10.1f}")
+    print(f"upstream calls reduced {results['no cache'][0] / max(results['cache'][0], 1):.0f}x")
+    print(json.dumps(metrics_cache.metrics_cache_stats(), indent=2))
+
+    await http_pool.close_all()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+namespace metrics 엔드포인트의 upstream 동시 호출 효과 측정.
+
+지연(--latency-ms)을 넣은 가짜 Prometheus / Kubecost 서버를 로컬에 띄우고
+앱을 ASGI로 직접 호출해 엔드포인트별 응답 시간을 잰다.
+동시 호출 수 1(= 순서대로 호출하던 예전 방식)과
+METRICS_UPSTREAM_CONCURRENCY / METRICS_OVERVIEW_CONCURRENCY 설정값을 비교한다.
+
+    cd backend
+    python benchmarks/metrics_fanout.py --latency-ms 100 --rounds 5
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from api.routes import metrics
+from core import http_pool
+
+
+def start_fake_upstream(latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            if self.path.startswith("/api/v1/query_range"):
+                body = {"status": "success", "data": {"result": [{"metric": {}, "values": [[0, "1"], [60, "2"]]}]}}
+            elif self.path.startswith("/api/v1/query"):
+                body = {"status": "success", "data": {"result": [{"metric": {}, "value": [0, "4"]}]}}
+            else:
+                body = {"code": 200, "data": [{"bench": {"totalCost": 1.5}}]}
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def measure(client: httpx.AsyncClient, path: str, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        resp = await client.get(path)
+        resp.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="upstream 호출 하나의 지연")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--namespace", default="bench")
+    args = parser.parse_args()
+
+    server = start_fake_upstream(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    metrics.prom.base_url = base_url
+    metrics.kc.base_url = base_url
+
+    from main import app
+    transport = httpx.ASGITransport(app=app)
+    paths = ["resource-usage", "health", "cost-summary", "overview"]
+
+    results = {}
+    limits = (metrics.UPSTREAM_CONCURRENCY, metrics.OVERVIEW_CONCURRENCY)
+    for label, (endpoint_limit, overview_limit) in (("sequential", (1, 1)), ("concurrent", limits)):
+        metrics.UPSTREAM_CONCURRENCY, metrics.OVERVIEW_CONCURRENCY = endpoint_limit, overview_limit
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 커넥션 풀 예열
+            await client.get(f"/metrics/namespaces/{args.namespace}/overview")
+            results[label] = {
+                p: await measure(client, f"/metrics/namespaces/{args.namespace}/{p}", args.rounds) for p in paths
+            }
+
+    sequential, concurrent = results["sequential"], results["concurrent"]
+    print(f"upstream latency {args.latency_ms:.0f}ms, median of {args.rounds} rounds (ms)")
+    print(f"concurrent limits: endpoint={limits[0]}, overview={limits[1]}")
+    print(f"{'endpoint':16s} {'sequential':>14s} {'concurrent':>14s}")
+    for p in paths:
+        print(f"{p:16s} {sequential[p]:14.1f} {concurrent[p]:14.1f}")
+    print(f"{'dashboard':16s} {sequential['resource-usage'] + sequential['cost-summary']:14.1f} {concurrent['overview']:14.1f}"
+          "  (before: resource-usage + cost-summary, after: overview)")
+
+    await http_pool.close_all()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
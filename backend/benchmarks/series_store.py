@@ -0,0 +1,117 @@
+"""
+query_range series store(core.series_store)의 upstream 조회 점 수 측정.
+
+요청 구간의 점을 그대로 돌려주는 가짜 Prometheus 서버를 로컬에 띄우고,
+/resource-usage?minutes=1440 을 --interval 초마다 --refreshes 번 새로고침한다 (시각은 흉내 냄).
+새로고침마다 전체 구간을 다시 받던 방식과 series store 의 upstream 조회 점 수를 비교한다.
+
+    cd backend
+    python benchmarks/series_store.py --refreshes 20 --interval 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from api.routes import metrics
+from core import http_pool, metrics_cache
+
+
+def start_fake_prometheus(counter: dict) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if url.path == "/api/v1/query_range":
+                start, end, step = int(params["start"]), int(params["end"]), int(params["step"])
+                values = [[ts, str(ts % 97)] for ts in range(start, end + 1, step)]
+                counter["range_calls"] += 1
+                counter["range_points"] += len(values)
+                body = {"status": "success", "data": {"result": [{"metric": {}, "values": values}]}}
+            else:
+                body = {"status": "success", "data": {"result": [{"metric": {}, "value": [0, "4"]}]}}
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refreshes", type=int, default=20, help="새로고침 횟수")
+    parser.add_argument("--interval", type=int, default=30, help="새로고침 간격(초, 흉내 낸 시각)")
+    parser.add_argument("--minutes", type=int, default=24 * 60)
+    parser.add_argument("--step-sec", type=int, default=60)
+    parser.add_argument("--namespace", default="bench")
+    args = parser.parse_args()
+
+    counter = {"range_calls": 0, "range_points": 0}
+    server = start_fake_prometheus(counter)
+    metrics.prom.base_url = f"http://127.0.0.1:{server.server_port}"
+
+    from main import app
+    transport = httpx.ASGITransport(app=app)
+    path = f"/metrics/namespaces/{args.namespace}/resource-usage?minutes={args.minutes}&step_sec={args.step_sec}"
+    store = metrics_cache.prometheus_series_store
+
+    results = {}
+    for label in ("full range", "series store"):
+        store.clear()
+        metrics_cache.prometheus_instant_cache.clear()
+        if label == "full range":
+            # 새로고침마다 전체 구간 조회
+            store.get_range = lambda key, start, end, step, loader: loader(start, end)
+        else:
+            del store.get_range
+
+        clock = {"wall": 1_700_000_000.0, "mono": time.monotonic()}
+        per_refresh = []
+        with mock.patch("time.time", lambda: clock["wall"]):
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for _ in range(args.refreshes):
+                    before = counter["range_points"]
+                    # series store 의 tail TTL 도 흉내 낸 시각으로 지나가도록
+                    with mock.patch("time.monotonic", lambda: clock["mono"]):
+                        resp = await client.get(path)
+                    resp.raise_for_status()
+                    assert len(resp.json()["cpu"]) == args.minutes * 60 // args.step_sec + 1
+                    per_refresh.append(counter["range_points"] - before)
+                    clock["wall"] += args.interval
+                    clock["mono"] += args.interval
+        results[label] = per_refresh
+
+    print(f"/resource-usage minutes={args.minutes} step_sec={args.step_sec}, "
+          f"{args.refreshes} refreshes every {args.interval}s (2 range queries per refresh)")
+    print(f"{'':14s} {'first':>8s} {'later avg':>10s} {'total':>8s}   upstream points")
+    for label, per_refresh in results.items():
+        later = per_refresh[1:] or [0]
+        print(f"{label:14s} {per_refresh[0]:8d} {sum(later) / len(later):10.1f} {sum(per_refresh):8d}")
+    print(json.dumps(store.stats(), indent=2))
+
+    await http_pool.close_all()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
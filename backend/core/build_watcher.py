@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict
+
+from core.config import env_int
+from core.jenkins_client import JenkinsClient, jenkins_job_name
+from core.log_archive import schedule_build_log_archive
+from core.poll_policy import PollPolicy, expected_duration, load_poll_policy
+from crud.deploy import update_deploy_status
+from crud.deploy_job import finish_deploy_job
+from database.yoitang import AsyncSessionLocal
+from models.deploy import DeployStatus
+
+
+logger = logging.getLogger("BuildWatcher")
+
+
+def map_jenkins_result_to_status(result: str | None) -> DeployStatus:
+    if result is None:
+        return DeployStatus.IN_PROGRESS
+    r = result.upper()
+    if r == "SUCCESS":
+        return DeployStatus.SUCCESS
+    # FAILURE / ABORTED / NOT_BUILT / UNSTABLE → 실패로 처리
+    return DeployStatus.FAILED
+
+
+@dataclass
+class TrackedBuild:
+    deploy_id: int
+    queue_id: int
+    build_number: int | None = None
+    tracked_at: float = field(default_factory=time.monotonic)
+    # 빌드 시작 시각 (epoch 초, Jenkins timestamp 기준)
+    started_at: float | None = None
+    next_poll_at: float = 0.0
+    polls: int = 0          # 이 빌드를 확인한 총 횟수
+    phase_polls: int = 0    # 현재 단계(큐 대기/빌드 진행)에서의 확인 횟수 → backoff 계산용
+    # 큐에서도, 빌드 목록에서도 보이지 않은 연속 poll 횟수 (취소된 큐 아이템 감지용)
+    missing_polls: int = 0
+
+
+class BuildWatcher:
+    """
+    진행 중인 모든 Jenkins 빌드를 하나의 poll 루프로 추적.
+    배포 수와 상관없이 한 주기마다 아래 호출만 한다.
+      - GET /job/<job>/api/json?tree=builds[number,result,queueId,duration,timestamp]{0,N}
+      - GET /queue/api/json  (빌드 목록에 아직 안 보이는 큐 아이템이 있을 때만)
+    빌드가 끝나면 update_deploy_status로 배포 상태를 반영한다.
+
+    각 빌드의 다음 확인 시각은 잡별 PollPolicy(core.poll_policy)로 정하고,
+    루프는 가장 이른 빌드의 확인 시각까지만 잔다.
+
+    환경 변수:
+      - JENKINS_WATCH_HISTORY       : 한 번에 조회할 최근 빌드 수 최소값 (default 50)
+      - JENKINS_WATCH_MISSING_POLLS : 큐/빌드 어디에도 없으면 실패 처리할 연속 횟수 (default 5)
+      - JENKINS_POLL_POLICY         : 잡별 polling 전략 override (core.poll_policy 참고)
+    """
+
+    def __init__(self) -> None:
+        self.history = env_int("JENKINS_WATCH_HISTORY", 50)
+        self.max_missing_polls = env_int("JENKINS_WATCH_MISSING_POLLS", 5)
+
+        self._builds: Dict[int, TrackedBuild] = {}   # queue_id → TrackedBuild
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.policy: PollPolicy = load_poll_policy(jenkins_job_name())
+        self.expected_duration: float | None = None
+
+        self.polls = 0
+        self.upstream_calls = 0
+        self.finished = 0
+        self.timed_out = 0
+        # 최근 완료된 빌드들의 poll 횟수 (요청 감소 효과 확인용)
+        self._finished_polls: deque[int] = deque(maxlen=200)
+
+    def track(self, deploy_id: int, queue_id: int) -> None:
+        policy = self.policy
+        self._builds[queue_id] = TrackedBuild(
+            deploy_id=deploy_id,
+            queue_id=queue_id,
+            next_poll_at=time.monotonic() + policy.queue_wait(0),
+        )
+        self._wakeup.set()
+        self.start()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._builds:
+                await self._wakeup.wait()
+                continue
+
+            # 가장 먼저 확인해야 하는 빌드 시각까지 대기 (새 빌드가 추가되면 깨어남)
+            delay = min(t.next_poll_at for t in self._builds.values()) - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+            try:
+                await self.poll_once()
+            except Exception as e:
+                # Jenkins 일시 장애 → 실패한 빌드들은 policy 간격 뒤 다시 시도
+                logger.warning(f"Jenkins build poll 실패: {e}")
+                self._reschedule_all()
+
+    async def poll_once(self) -> None:
+        jenkins = JenkinsClient()
+        policy = self.policy
+        self.polls += 1
+
+        # 추적 중인 빌드가 모두 목록 안에 들어오도록 조회 범위를 늘린다
+        limit = max(self.history, policy.history_size, len(self._builds) * 2)
+        builds = await jenkins.get_recent_builds(limit)
+        self.upstream_calls += 1
+        by_queue = {b.get("queueId"): b for b in builds if b.get("queueId") is not None}
+
+        durations = [b.get("duration") for b in builds if b.get("result") == "SUCCESS"]
+        self.expected_duration = expected_duration(durations[:policy.history_size]) or self.expected_duration
+
+        unresolved = [t for t in self._builds.values() if t.queue_id not in by_queue]
+        queued_ids: set[int] = set()
+        if unresolved:
+            items = await jenkins.get_queue_items()
+            self.upstream_calls += 1
+            queued_ids = {item.get("id") for item in items}
+
+        now = time.monotonic()
+        for tracked in list(self._builds.values()):
+            # 이번 조회 결과는 모든 빌드에 반영하지만, 주기/카운트는 확인 시각이 된 빌드만 갱신
+            due = tracked.next_poll_at <= now
+            if due:
+                tracked.polls += 1
+            build = by_queue.get(tracked.queue_id)
+
+            if build is None:
+                if tracked.queue_id not in queued_ids:
+                    # 큐에서 빠졌는데 빌드도 없음 → 취소되었거나 목록 반영 전
+                    tracked.missing_polls += 1
+                    if tracked.missing_polls >= self.max_missing_polls:
+                        logger.warning(f"큐 아이템이 사라졌습니다. (queue_id={tracked.queue_id}, deploy_id={tracked.deploy_id})")
+                        await self._finish(tracked, DeployStatus.FAILED)
+                        continue
+                else:
+                    tracked.missing_polls = 0
+
+                if now - tracked.tracked_at > policy.queue_deadline:
+                    await self._time_out(tracked, "queue")
+                elif due:
+                    self._schedule(tracked, now)
+                continue
+
+            tracked.missing_polls = 0
+            if tracked.build_number is None:
+                # 큐 → 빌드 진행으로 단계 전환
+                tracked.build_number = build.get("number")
+                tracked.phase_polls = 0
+                due = True
+            if build.get("timestamp"):
+                tracked.started_at = build["timestamp"] / 1000
+
+            result = build.get("result")
+            if result is not None:
+                await self._finish(tracked, map_jenkins_result_to_status(result))
+                continue
+
+            if self._elapsed(tracked) > policy.build_deadline:
+                await self._time_out(tracked, "build")
+            elif due:
+                self._schedule(tracked, now)
+
+    def _elapsed(self, tracked: TrackedBuild) -> float:
+        if tracked.started_at is not None:
+            return max(0.0, time.time() - tracked.started_at)
+        return time.monotonic() - tracked.tracked_at
+
+    def _schedule(self, tracked: TrackedBuild, now: float) -> None:
+        policy = self.policy
+        if tracked.build_number is None:
+            wait = policy.queue_wait(tracked.phase_polls)
+        else:
+            wait = policy.build_wait(tracked.phase_polls, self._elapsed(tracked), self.expected_duration)
+        tracked.phase_polls += 1
+        tracked.next_poll_at = now + wait
+
+    def _reschedule_all(self) -> None:
+        now = time.monotonic()
+        for tracked in self._builds.values():
+            self._schedule(tracked, now)
+
+    async def _time_out(self, tracked: TrackedBuild, phase: str) -> None:
+        self.timed_out += 1
+        logger.warning(
+            f"Jenkins {phase} 대기 시간 초과 → FAILED 처리 "
+            f"(queue_id={tracked.queue_id}, build_number={tracked.build_number}, deploy_id={tracked.deploy_id})"
+        )
+        await self._finish(tracked, DeployStatus.FAILED)
+
+    async def _finish(self, tracked: TrackedBuild, deploy_status: DeployStatus) -> None:
+        self._builds.pop(tracked.queue_id, None)
+        self.finished += 1
+        self._finished_polls.append(tracked.polls)
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await update_deploy_status(db, tracked.deploy_id, deploy_status.value)
+                await finish_deploy_job(db, tracked.deploy_id, deploy_status == DeployStatus.SUCCESS, tracked.build_number)
+        except Exception as e:
+            logger.error(f"배포 상태 업데이트 실패 (deploy_id={tracked.deploy_id}): {e}")
+
+        # Jenkins가 빌드를 정리해도 로그가 남도록 압축 보관
+        if tracked.build_number is not None:
+            schedule_build_log_archive(tracked.deploy_id, tracked.build_number)
+
+    def stats(self) -> dict:
+        finished_polls = list(self._finished_polls)
+        return {
+            "tracked": len(self._builds),
+            "queued": sum(1 for t in self._builds.values() if t.build_number is None),
+            "running": sum(1 for t in self._builds.values() if t.build_number is not None),
+            "polls": self.polls,
+            "upstream_calls": self.upstream_calls,
+            "finished": self.finished,
+            "timed_out": self.timed_out,
+            "expected_duration_sec": self.expected_duration,
+            "polls_per_build": {
+                "avg": sum(finished_polls) / len(finished_polls) if finished_polls else 0.0,
+                "max": max(finished_polls, default=0),
+                "in_flight": {t.deploy_id: t.polls for t in self._builds.values()},
+            },
+        }
+
+
+# 프로세스 전역 watcher (FastAPI lifespan에서 시작/종료)
+build_watcher = BuildWatcher()
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable
+
+import asyncpg
+
+from core.config import env_float, env_int
+from core.entity_cache import deploy_cache, invalidate_deploys, latest_deploy_cache
+from core.log_stream import KEEPALIVE_SEC, sse_event
+from crud.deploy import DEPLOY_EVENTS_CHANNEL
+from database.yoitang import DB_URL
+
+
+logger = logging.getLogger("deploy_events")
+
+
+@dataclass(eq=False)
+class DeploySubscription:
+    user_id: int | None
+    service_id: int | None
+    queue: asyncio.Queue
+    # 큐가 넘쳐 이벤트를 버렸으면 클라이언트에 다시 조회하라고 알린다
+    overflowed: bool = False
+
+    def matches(self, event: dict) -> bool:
+        if self.service_id is not None and event.get("service_id") != self.service_id:
+            return False
+        if self.user_id is not None and event.get("user_id") != self.user_id:
+            return False
+        return True
+
+
+@dataclass
+class _Stats:
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    reconnects: int = 0
+    by_status: dict = field(default_factory=dict)
+
+
+class DeployEventHub:
+    """
+    Postgres LISTEN deploy_status → 이 프로세스의 SSE 구독자에게 전달.
+
+    NOTIFY는 DB를 거치므로 API 프로세스가 여러 개거나 상태를 바꾼 곳이 별도 워커여도
+    모든 프로세스가 같은 이벤트를 받는다. 받은 이벤트로 core.entity_cache도 무효화한다.
+    LISTEN은 커넥션 풀과 별개인 전용 asyncpg 연결 하나를 쓴다.
+
+      - DEPLOY_EVENTS_QUEUE_SIZE    : 구독자별 대기 이벤트 수 (default 100)
+      - DEPLOY_EVENTS_RECONNECT_SEC : LISTEN 연결이 끊겼을 때 재연결 간격(초) (default 5)
+    """
+
+    def __init__(self) -> None:
+        self.queue_size = env_int("DEPLOY_EVENTS_QUEUE_SIZE", 100)
+        self.reconnect_interval = env_float("DEPLOY_EVENTS_RECONNECT_SEC", 5.0)
+
+        self._subscriptions: set[DeploySubscription] = set()
+        self._task: asyncio.Task | None = None
+        self.connected = False
+        self._stats = _Stats()
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def subscribe(self, user_id: int | None = None, service_id: int | None = None) -> DeploySubscription:
+        sub = DeploySubscription(user_id=user_id, service_id=service_id, queue=asyncio.Queue(self.queue_size))
+        self._subscriptions.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: DeploySubscription) -> None:
+        self._subscriptions.discard(sub)
+
+    async def _run(self) -> None:
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(DB_URL)
+                lost = asyncio.Event()
+                conn.add_termination_listener(lambda _: lost.set())
+                await conn.add_listener(DEPLOY_EVENTS_CHANNEL, self._on_notify)
+                self.connected = True
+                logger.info(f"LISTEN {DEPLOY_EVENTS_CHANNEL} 시작")
+                await lost.wait()
+                logger.warning("배포 이벤트 LISTEN 연결이 끊겼습니다.")
+            except Exception as e:
+                logger.warning(f"배포 이벤트 LISTEN 실패: {e}")
+            finally:
+                self.connected = False
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            # 끊긴 동안의 변경은 알 수 없으므로 캐시를 비우고 구독자에게 다시 조회하라고 알린다
+            deploy_cache.clear()
+            latest_deploy_cache.clear()
+            for sub in self._subscriptions:
+                sub.overflowed = True
+            self._stats.reconnects += 1
+            await asyncio.sleep(self.reconnect_interval)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"배포 이벤트 payload 오류: {payload!r}")
+            return
+        self.dispatch(event)
+
+    def dispatch(self, event: dict) -> None:
+        self._stats.received += 1
+        status = event.get("status")
+        self._stats.by_status[status] = self._stats.by_status.get(status, 0) + 1
+        invalidate_deploys([event.get("deploy_id")], [event.get("service_id")])
+
+        for sub in self._subscriptions:
+            if not sub.matches(event):
+                continue
+            try:
+                sub.queue.put_nowait(event)
+                self._stats.delivered += 1
+            except asyncio.QueueFull:
+                sub.overflowed = True
+                self._stats.dropped += 1
+
+    def stats(self) -> dict:
+        return {
+            "connected": self.connected,
+            "subscribers": len(self._subscriptions),
+            "received": self._stats.received,
+            "delivered": self._stats.delivered,
+            "dropped": self._stats.dropped,
+            "reconnects": self._stats.reconnects,
+            "by_status": dict(self._stats.by_status),
+        }
+
+
+async def stream_deploy_events(
+    sub: DeploySubscription,
+    snapshot: dict | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """
+    구독한 배포 상태 변경을 Server-Sent Events로 흘려보낸다.
+
+      event: snapshot → 구독 시점의 최근 배포 (service_id로 구독했을 때)
+      event: status   → {"deploy_id", "service_id", "user_id", "status", "previous_status"}
+      event: resync   → 이벤트를 놓쳤을 수 있으니 다시 조회할 것
+    """
+    try:
+        yield f"retry: {int(deploy_event_hub.reconnect_interval * 1000)}\n\n"
+        if snapshot is not None:
+            yield sse_event("snapshot", snapshot)
+
+        while True:
+            if await is_disconnected():
+                return
+            if sub.overflowed:
+                sub.overflowed = False
+                yield sse_event("resync", {})
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout=KEEPALIVE_SEC)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield sse_event("status", event)
+    finally:
+        deploy_event_hub.unsubscribe(sub)
+
+
+# 프로세스 전역 이벤트 허브 (FastAPI lifespan에서 시작/종료)
+deploy_event_hub = DeployEventHub()
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import env_float, env_int
+from core.jenkins_trigger import trigger_jenkins_build
+from crud.deploy_job import (
+    adopt_stale_deploy_jobs,
+    claim_deploy_jobs,
+    enqueue_deploy_job,
+    finish_deploy_job,
+    get_deploy_job_stats,
+    heartbeat_deploy_jobs,
+    load_deploy_payload,
+    mark_deploy_job_triggered,
+    recover_orphaned_deploys,
+    requeue_stale_deploy_jobs,
+)
+from crud.deploy import update_deploy_status
+from core.build_watcher import build_watcher
+from database.yoitang import AsyncSessionLocal
+from models.deploy import DeployStatus
+from models.deploy_job import DeployJob, DeployLane
+from schemas.deploy import DeployRequest
+
+
+logger = logging.getLogger("DeployScheduler")
+
+
+class DeployScheduler:
+    """
+    deploy_jobs 테이블 기반의 영속 배포 대기열.
+
+    API 쪽은 submit()으로 작업을 등록만 하고, 워커(run)가
+    SELECT ... FOR UPDATE SKIP LOCKED 로 작업을 가져가 Jenkins 트리거 → build_watcher 추적까지 맡는다.
+    워커는 여러 개 띄워도 되고(python worker.py), 기본값으로는 API 프로세스 안에서도 하나가 돈다.
+
+      - 새 서비스 배포(NEW)가 재배포(REDEPLOY)보다 먼저 처리된다.
+        단, DEPLOY_LANE_MAX_WAIT 초 이상 기다린 작업은 lane과 상관없이 먼저 꺼낸다.
+      - 같은 서비스/브랜치 재배포가 대기 중이면 새 요청이 기존 요청을 대체하고,
+        대체된 배포는 ARCHIVED 처리한다.
+      - 워커가 죽으면 lease(DEPLOY_JOB_LEASE_SEC)가 끝난 작업을 다른 워커가 다시 가져가거나
+        (트리거 전) 빌드 추적을 이어받는다(트리거 후).
+      - 시작할 때 진행 중인 작업 없이 IN_PROGRESS로 남은 배포는 다시 빌드하지 않고
+        마지막 작업 결과대로 상태를 맞춘다 (작업 기록이 없으면 FAILED).
+      - payload 의 git_pat 은 DEPLOY_SECRET_KEY 로 암호화해서 보관한다 (API / 워커가 같은 키 사용).
+
+    환경 변수:
+      - DEPLOY_MAX_CONCURRENT_TRIGGERS : 워커당 동시에 진행할 트리거 수 (default 4)
+      - DEPLOY_LANE_MAX_WAIT           : 낮은 lane 기아 방지 대기 한도(초) (default 30)
+      - DEPLOY_WORKER_POLL_INTERVAL    : 대기열이 비었을 때 재확인 주기(초) (default 1)
+      - DEPLOY_JOB_LEASE_SEC           : 워커 lease 시간(초) (default 60)
+      - DEPLOY_ORPHAN_GRACE_SEC        : 고아 배포로 판단하기 전 유예 시간(초) (default 60)
+    """
+
+    def __init__(self) -> None:
+        self.max_concurrent = max(1, env_int("DEPLOY_MAX_CONCURRENT_TRIGGERS", 4))
+        self.lane_max_wait = env_float("DEPLOY_LANE_MAX_WAIT", 30.0)
+        self.poll_interval = env_float("DEPLOY_WORKER_POLL_INTERVAL", 1.0)
+        self.lease_sec = env_float("DEPLOY_JOB_LEASE_SEC", 60.0)
+        self.orphan_grace_sec = env_float("DEPLOY_ORPHAN_GRACE_SEC", 60.0)
+        # 컨테이너 재시작으로 hostname/pid가 같아도 이전 워커와 구분되도록 suffix 추가
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._available = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+
+        self.dispatched = 0
+        self.recovered = 0
+        self.adopted = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._dispatches)
+
+    async def submit(self, db: AsyncSession, deploy_id: int, service_id: int, req: DeployRequest, lane: DeployLane) -> DeployJob:
+        job = await enqueue_deploy_job(db, deploy_id, service_id, req, lane)
+        # 같은 프로세스에 워커가 있으면 바로 깨움 (다른 워커는 poll 주기에 가져감)
+        self._available.set()
+        return job
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        tasks = list(self._dispatches)
+        if self._task is not None:
+            tasks.append(self._task)
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def run(self) -> None:
+        await self._recover_on_startup()
+
+        loop = asyncio.get_running_loop()
+        next_maintenance = loop.time() + self.lease_sec / 3
+
+        while True:
+            if loop.time() >= next_maintenance:
+                await self._maintain()
+                next_maintenance = loop.time() + self.lease_sec / 3
+
+            claimed = []
+            free = self.max_concurrent - self.in_flight
+            if free > 0:
+                try:
+                    claimed = await self._with_db(claim_deploy_jobs, self.worker_id, free, self.lane_max_wait)
+                except Exception as e:
+                    logger.warning(f"배포 작업 claim 실패: {e}")
+
+            for job in claimed:
+                task = asyncio.create_task(self._dispatch(job))
+                self._dispatches.add(task)
+                task.add_done_callback(self._on_dispatch_done)
+
+            if not claimed:
+                self._available.clear()
+                try:
+                    await asyncio.wait_for(self._available.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    def _on_dispatch_done(self, task: asyncio.Task) -> None:
+        self._dispatches.discard(task)
+        # 슬롯이 비었으니 대기 중인 작업을 바로 확인
+        self._available.set()
+
+    async def _dispatch(self, job: DeployJob) -> None:
+        self.dispatched += 1
+        try:
+            req = load_deploy_payload(job.payload)
+        except Exception as e:
+            logger.error(f"배포 작업 payload 오류 (job_id={job.job_id}): {e}")
+            await self._with_db(update_deploy_status, job.deploy_id, DeployStatus.FAILED.value)
+            await self._with_db(finish_deploy_job, job.deploy_id, False)
+            return
+
+        queue_id = await trigger_jenkins_build(job.deploy_id, req)
+        if queue_id is None:
+            await self._with_db(finish_deploy_job, job.deploy_id, False)
+            return
+        await self._with_db(mark_deploy_job_triggered, job.job_id, queue_id)
+
+    async def _recover_on_startup(self) -> None:
+        try:
+            count = await self._with_db(recover_orphaned_deploys, self.orphan_grace_sec)
+            if count:
+                logger.info(f"진행 중인 작업이 없는 IN_PROGRESS 배포 {count}건의 상태를 정리했습니다.")
+            self.recovered += count
+        except Exception as e:
+            logger.warning(f"고아 배포 복구 실패: {e}")
+        await self._maintain()
+
+    async def _maintain(self) -> None:
+        try:
+            await self._with_db(heartbeat_deploy_jobs, self.worker_id)
+            await self._with_db(requeue_stale_deploy_jobs, self.lease_sec)
+            for job in await self._with_db(adopt_stale_deploy_jobs, self.worker_id, self.lease_sec):
+                if job.queue_id is None:
+                    continue
+                self.adopted += 1
+                build_watcher.track(job.deploy_id, job.queue_id)
+        except Exception as e:
+            logger.warning(f"배포 작업 lease 관리 실패: {e}")
+
+    @staticmethod
+    async def _with_db(fn, *args):
+        async with AsyncSessionLocal() as db:
+            return await fn(db, *args)
+
+    async def stats(self, db: AsyncSession) -> dict:
+        return {
+            **await get_deploy_job_stats(db),
+            "worker": {
+                "worker_id": self.worker_id,
+                "running": self._task is not None and not self._task.done(),
+                "max_concurrent": self.max_concurrent,
+                "in_flight": self.in_flight,
+                "dispatched": self.dispatched,
+                "recovered": self.recovered,
+                "adopted": self.adopted,
+            },
+        }
+
+
+# 프로세스 전역 스케줄러 (API lifespan 또는 worker.py에서 시작/종료)
+deploy_scheduler = DeployScheduler()
@@ -0,0 +1,29 @@
+from core.config import env_float, env_int
+from core.ttl_cache import TTLCache
+
+
+# 서비스/배포 단건 조회용 캐시 (crud.service / crud.deploy 에서 사용).
+# 값은 ORM 객체가 아니라 응답 스키마로 저장하므로 세션과 무관하게 공유된다.
+# 쓰기 경로(create_service / create_deploy(s) / update_deploy_status 등)가 commit 후 invalidate 하며,
+# 별도 워커 프로세스에서 바뀐 값은 TTL 안에 반영된다.
+#   - SERVICE_CACHE_TTL_SEC  : 서비스 캐시 TTL(초) (default 300)
+#   - DEPLOY_CACHE_TTL_SEC   : 배포 / 서비스별 최근 배포 캐시 TTL(초) (default 10)
+#   - ENTITY_CACHE_MAX_ITEMS : 캐시별 최대 항목 수 (default 10000)
+
+_MAX_ITEMS = env_int("ENTITY_CACHE_MAX_ITEMS", 10000)
+
+# service_id → ServiceResponse
+service_cache = TTLCache("service", env_float("SERVICE_CACHE_TTL_SEC", 300.0), _MAX_ITEMS)
+# deploy_id → DeployResponse
+deploy_cache = TTLCache("deploy", env_float("DEPLOY_CACHE_TTL_SEC", 10.0), _MAX_ITEMS)
+# service_id → 가장 최근 DeployResponse
+latest_deploy_cache = TTLCache("latest_deploy", env_float("DEPLOY_CACHE_TTL_SEC", 10.0), _MAX_ITEMS)
+
+
+def invalidate_deploys(deploy_ids=(), service_ids=()) -> None:
+    deploy_cache.invalidate(*deploy_ids)
+    latest_deploy_cache.invalidate(*service_ids)
+
+
+def entity_cache_stats() -> dict:
+    return {cache.name: cache.stats() for cache in (service_cache, deploy_cache, latest_deploy_cache)}
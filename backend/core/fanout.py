@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from fastapi import HTTPException
+
+
+class FanOut:
+    """
+    요청 하나에서 여러 upstream 호출(Prometheus / Kubecost 등)을 동시에 보낼 때 쓰는 묶음.
+    응답 시간이 호출 시간의 합이 아니라 가장 느린 호출 시간이 되도록 하되,
+      - 동시에 나가는 호출 수는 limit 개로 제한하고
+      - 모든 호출이 같은 마감 시각(생성 시점 + timeout초)을 공유한다.
+    마감을 넘긴 호출은 504로 실패한다.
+    """
+
+    def __init__(self, limit: int, timeout: float) -> None:
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max(1, limit))
+        self._deadline = asyncio.get_running_loop().time() + timeout
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self._deadline - asyncio.get_running_loop().time())
+
+    async def _limited(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        async with self._semaphore:
+            return await fn(*args, **kwargs)
+
+    async def call(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        # 슬롯을 기다리는 시간도 마감에 포함
+        try:
+            return await asyncio.wait_for(self._limited(fn, *args, **kwargs), self.remaining)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail=f"upstream 응답 시간 초과 ({self.timeout:g}초)")
+
+    async def gather(self, *aws: Awaitable[Any], return_exceptions: bool = False) -> list[Any]:
+        tasks = [asyncio.ensure_future(aw) for aw in aws]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        finally:
+            # 하나가 실패하면 나머지 호출은 기다리지 않고 취소
+            for task in tasks:
+                task.cancel()
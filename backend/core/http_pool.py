@@ -0,0 +1,69 @@
+import importlib.util
+import logging
+from typing import Dict
+
+import httpx
+
+from core.config import env_bool, env_int, env_float
+
+
+logger = logging.getLogger("http_pool")
+
+# 호스트(이름)별로 하나씩 유지하는 keep-alive AsyncClient
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+# HTTP/2는 h2 패키지(httpx[http2])가 있을 때만 사용
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _build_client(name: str, http2: bool = False, read_timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    이름별 환경 변수로 커넥션 풀 한도를 설정한 AsyncClient 생성.
+    예) name="JENKINS"
+      - JENKINS_MAX_CONNECTIONS      : 호스트당 최대 동시 커넥션 (default 20)
+      - JENKINS_MAX_KEEPALIVE        : 유지할 idle keep-alive 커넥션 수 (default 10)
+      - JENKINS_KEEPALIVE_EXPIRY     : idle 커넥션 유지 시간(초) (default 30)
+      - JENKINS_CONNECT_TIMEOUT      : 커넥션 획득/연결 타임아웃(초) (default 5)
+      - JENKINS_READ_TIMEOUT         : 응답 대기 타임아웃(초) (default read_timeout 인자)
+      - JENKINS_HTTP2                : HTTP/2 사용 여부 (default http2 인자, h2 미설치 시 HTTP/1.1)
+    """
+    prefix = name.upper()
+    limits = httpx.Limits(
+        max_connections=env_int(f"{prefix}_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=env_int(f"{prefix}_MAX_KEEPALIVE", 10),
+        keepalive_expiry=env_float(f"{prefix}_KEEPALIVE_EXPIRY", 30.0),
+    )
+    connect_timeout = env_float(f"{prefix}_CONNECT_TIMEOUT", 5.0)
+    timeout = httpx.Timeout(env_float(f"{prefix}_READ_TIMEOUT", read_timeout), connect=connect_timeout, pool=connect_timeout)
+
+    use_http2 = env_bool(f"{prefix}_HTTP2", http2)
+    if use_http2 and not H2_AVAILABLE:
+        logger.info(f"h2 패키지가 없어 {prefix} 클라이언트는 HTTP/1.1을 사용합니다.")
+        use_http2 = False
+
+    return httpx.AsyncClient(limits=limits, timeout=timeout, verify=True, http2=use_http2)
+
+
+def get_client(name: str, http2: bool = False, read_timeout: float = 10.0) -> httpx.AsyncClient:
+    """
+    프로세스 전역 AsyncClient 반환.
+    lifespan 밖(스크립트/워커)에서 호출돼도 쓸 수 있도록 없으면 생성한다.
+    http2 / read_timeout 은 처음 생성할 때의 기본값 (환경 변수가 우선).
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(name, http2, read_timeout)
+        _clients[name] = client
+    return client
+
+
+async def close_all() -> None:
+    """
+    FastAPI lifespan 종료 시 모든 커넥션 풀 정리
+    """
+    for name, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning(f"HTTP client close 실패 ({name}): {e}")
+    _clients.clear()
@@ -1,8 +1,107 @@
 import os
-import requests
 import time
+import asyncio
 import logging
-from requests.auth import HTTPBasicAuth
+
+import httpx
+
+from core.config import env_float
+from core.http_pool import get_client
+
+
+class JenkinsError(RuntimeError):
+    """
+    Jenkins가 비정상 응답을 준 경우. 라우터에서 status_code를 그대로 전달할 수 있도록 보관.
+    """
+
+    def __init__(self, message: str, status_code: int = 502) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CrumbCache:
+    """
+    Jenkins CSRF crumb 캐시.
+    Jenkins는 crumb을 웹 세션(JSESSIONID 쿠키)에 묶어서 발급하므로,
+    공유 커넥션 풀의 쿠키 jar에 들어있는 세션 값이 바뀌면 캐시도 무효로 본다.
+      - JENKINS_CRUMB_TTL : crumb 재사용 시간(초) (default 300)
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._value: tuple[str | None, str | None] | None = None
+        self._session: str | None = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.retries = 0
+
+    @staticmethod
+    def session_key(http: httpx.AsyncClient) -> str | None:
+        values = sorted(f"{c.name}={c.value}" for c in http.cookies.jar if c.name.startswith("JSESSIONID"))
+        return ";".join(values) or None
+
+    def get(self, http: httpx.AsyncClient):
+        if self._value is None or time.monotonic() >= self._expires_at:
+            return None
+        if self._session is not None and self._session != self.session_key(http):
+            return None
+        return self._value
+
+    async def get_or_fetch(self, http: httpx.AsyncClient, fetch):
+        cached = self.get(http)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        # 동시에 여러 배포가 들어와도 crumb 발급은 한 번만
+        async with self._lock:
+            cached = self.get(http)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+            self.misses += 1
+            value = await fetch()
+            if value[0] and value[1]:
+                self._value = value
+                # crumb 발급 응답에서 받은 세션 쿠키 기준으로 묶음
+                self._session = self.session_key(http)
+                self._expires_at = time.monotonic() + self.ttl
+            return value
+
+    def invalidate(self) -> None:
+        self.invalidations += 1
+        self._value = None
+        self._session = None
+        self._expires_at = 0.0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "invalidations": self.invalidations,
+            "retries": self.retries,
+            "ttl_sec": self.ttl,
+            "cached": self._value is not None and time.monotonic() < self._expires_at,
+        }
+
+
+# 프로세스 전역 crumb 캐시 (커넥션 풀/쿠키 jar와 수명이 같음)
+crumb_cache = CrumbCache(ttl=env_float("JENKINS_CRUMB_TTL", 300.0))
+
+
+def jenkins_job_name() -> str:
+    return os.getenv("JENKINS_JOB_NAME", "yoitang-autodeploy")
+
+
+def _is_crumb_error(resp: httpx.Response) -> bool:
+    return resp.status_code == 403 and "No valid crumb" in resp.text
 
 
 class JenkinsClient:
@@ -13,21 +112,26 @@ class JenkinsClient:
       - JENKINS_USER  : admin
       - JENKINS_TOKEN : Jenkins API Token
       - JENKINS_JOB_NAME : yoitang-autodeploy (Default)
+
+    모든 요청은 프로세스 전역 keep-alive 커넥션 풀(core.http_pool)을 공유한다.
     """
 
     def __init__(self) -> None:
         self.base_url = os.getenv("JENKINS_URL", "").rstrip("/")
         self.username = os.getenv("JENKINS_USER", "")
         self.token = os.getenv("JENKINS_TOKEN", "")
-        self.job_name = os.getenv("JENKINS_JOB_NAME", "yoitang-autodeploy")
+        self.job_name = jenkins_job_name()
 
         if not all([self.base_url, self.username, self.token]):
             raise RuntimeError("JENKINS_URL / JENKINS_USER / JENKINS_TOKEN 환경변수가 필요합니다.")
 
+        self.http = get_client("JENKINS")
+        self.auth = httpx.BasicAuth(self.username, self.token)
+
         # logger
         self.logger = logging.getLogger("JenkinsClient")
 
-    def trigger_build(
+    async def trigger_build(
         self,
         prefix: str,
         git_repo: str,
@@ -49,24 +153,14 @@ class JenkinsClient:
         if git_pat:
             data["GIT_PAT"] = git_pat  # 👈 PAT 있을 때만 전달
 
-        # Try to obtain CSRF crumb (if Jenkins requires it) and include in headers
-        headers = {}
-        try:
-            crumb_field, crumb = self._get_crumb()
-            if crumb_field and crumb:
-                headers[crumb_field] = crumb
-        except Exception as e:
-            # Log but continue; some Jenkins setups don't require crumb
-            self.logger.debug(f"Failed to get Jenkins crumb: {e}")
-
-        resp = requests.post(url, auth=HTTPBasicAuth(self.username, self.token), data=data, headers=headers, timeout=10, verify=True)
+        resp = await self._post_with_crumb(url, data)
         if resp.status_code not in (201, 202):
             # Log response for debugging (may include HTML error page)
             self.logger.error(
                 "Jenkins buildWithParameters failed",
                 extra={"status": resp.status_code, "body": resp.text[:4000]},
             )
-            raise RuntimeError(f"Jenkins 호출 실패 (status={resp.status_code}, body={resp.text})")
+            raise JenkinsError(f"Jenkins 호출 실패 (status={resp.status_code}, body={resp.text})", resp.status_code)
 
         location = resp.headers.get("Location", "")
         if not location:
@@ -78,36 +172,70 @@ class JenkinsClient:
             queue_id = -1
 
         return queue_id
-    
-    def get_build_number_from_queue(self, queue_id: int, timeout: int = 60, interval: float = 2.0) -> int:
+
+    async def get_recent_builds(self, limit: int = 50) -> list[dict]:
         """
-        queue_id로 해당 빌드의 build_number(예: 31)를 조회.
-        빌드가 시작되기 전까지는 executable이 없으므로, 일정 시간 폴링.
+        잡의 최근 빌드 목록을 한 번에 조회.
+        queueId로 트리거한 큐 아이템과 빌드 번호를 매칭하고, result로 완료 여부를 판단한다.
+        duration/timestamp는 예상 빌드 시간 계산에 쓴다.
+          GET /job/<job>/api/json?tree=builds[number,result,queueId,duration,timestamp]{0,N}
         """
-        url = f"{self.base_url}/queue/item/{queue_id}/api/json"
-
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            resp = requests.get(url, auth=HTTPBasicAuth(self.username, self.token), timeout=5, verify=True)
-            resp.raise_for_status()
-            data = resp.json()
+        url = f"{self.base_url}/job/{self.job_name}/api/json"
+        resp = await self.http.get(
+            url,
+            params={"tree": f"builds[number,result,queueId,duration,timestamp]{{0,{limit}}}"},
+            auth=self.auth,
+            timeout=10,
+        )
+        resp.raise_for_status()
+        return resp.json().get("builds") or []
 
-            executable = data.get("executable")
-            if executable and "number" in executable:
-                return int(executable["number"])
+    async def get_build(self, build_number: int) -> dict:
+        """
+        단일 빌드 상태 조회 (result가 None이면 아직 진행 중)
+          GET /job/<job>/<number>/api/json?tree=number,result,duration,timestamp
+        """
+        url = f"{self.base_url}/job/{self.job_name}/{build_number}/api/json"
+        resp = await self.http.get(
+            url,
+            params={"tree": "number,result,duration,timestamp"},
+            auth=self.auth,
+            timeout=10,
+        )
+        if resp.status_code != 200:
+            raise JenkinsError(f"빌드 조회 실패 (status={resp.status_code}, body={resp.text})", resp.status_code)
+        return resp.json()
 
-            # 아직 빌드가 안 붙은 상태 → 잠시 대기 후 재조회
-            time.sleep(interval)
+    async def iter_console_text(self, build_number: int):
+        """
+        빌드 전체 콘솔 로그를 메모리에 다 올리지 않고 받은 순서대로 bytes 조각으로 넘겨줌.
+          GET /job/<job>/<number>/consoleText
+        """
+        url = f"{self.base_url}/job/{self.job_name}/{build_number}/consoleText"
+        async with self.http.stream("GET", url, auth=self.auth, timeout=30) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                raise JenkinsError(f"콘솔 로그 조회 실패 (status={resp.status_code}, body={resp.text})", resp.status_code)
+            async for data in resp.aiter_bytes():
+                yield data
 
-        raise RuntimeError(f"빌드 번호를 가져오지 못했습니다. (queue_id={queue_id})")
+    async def get_queue_items(self) -> list[dict]:
+        """
+        아직 executor를 받지 못하고 대기 중인 큐 아이템 목록.
+          GET /queue/api/json?tree=items[id]
+        """
+        url = f"{self.base_url}/queue/api/json"
+        resp = await self.http.get(url, params={"tree": "items[id]"}, auth=self.auth, timeout=10)
+        resp.raise_for_status()
+        return resp.json().get("items") or []
 
-    def _get_crumb(self):
+    async def _get_crumb(self):
         """
         Jenkins CSRF crumb을 가져옵니다. 실패하면 (None, None)을 반환합니다.
         """
         url = f"{self.base_url}/crumbIssuer/api/json"
         try:
-            resp = requests.get(url, auth=HTTPBasicAuth(self.username, self.token), timeout=5, verify=True)
+            resp = await self.http.get(url, auth=self.auth, timeout=5)
             if resp.status_code == 200:
                 data = resp.json()
                 return data.get("crumbRequestField"), data.get("crumb")
@@ -115,50 +243,59 @@ class JenkinsClient:
             self.logger.debug(f"Error while fetching crumb: {e}")
         return None, None
 
-    def get_build_log_chunk(self, build_number: int, start: int = 0):
+    async def _crumb_headers(self) -> dict:
+        # Try to obtain CSRF crumb (if Jenkins requires it) and include in headers
+        headers = {}
+        try:
+            crumb_field, crumb = await crumb_cache.get_or_fetch(self.http, self._get_crumb)
+            if crumb_field and crumb:
+                headers[crumb_field] = crumb
+        except Exception as e:
+            # Log but continue; some Jenkins setups don't require crumb
+            self.logger.debug(f"Failed to get Jenkins crumb: {e}")
+        return headers
+
+    async def _post_with_crumb(self, url: str, data: dict) -> httpx.Response:
+        """
+        캐시된 crumb으로 POST. Jenkins가 403 "No valid crumb"을 주면
+        (세션 만료/재시작 등) crumb을 새로 받아 한 번만 재시도한다.
+        """
+        headers = await self._crumb_headers()
+        resp = await self.http.post(url, auth=self.auth, data=data, headers=headers, timeout=10)
+
+        if _is_crumb_error(resp):
+            self.logger.info("Jenkins crumb rejected, refreshing and retrying once")
+            crumb_cache.invalidate()
+            crumb_cache.retries += 1
+            headers = await self._crumb_headers()
+            resp = await self.http.post(url, auth=self.auth, data=data, headers=headers, timeout=10)
+
+        return resp
+
+    async def get_build_log_chunk(self, build_number: int, start: int = 0):
         """
         progressiveText API를 이용해 텍스트 로그 조각을 가져옴.
         """
         url = f"{self.base_url}/job/{self.job_name}/{build_number}/logText/progressiveText"
 
-        resp = requests.get(
+        resp = await self.http.get(
             url,
             params={"start": start},
-            auth=HTTPBasicAuth(self.username, self.token),
+            auth=self.auth,
             timeout=10,
-            verify=True,
         )
         if resp.status_code != 200:
-            raise RuntimeError(f"로그 조회 실패 (status={resp.status_code}, body={resp.text})")
+            raise JenkinsError(f"로그 조회 실패 (status={resp.status_code}, body={resp.text})", resp.status_code)
 
         text = resp.text
-        next_start = int(resp.headers.get("X-Text-Size", "0"))
+        # Jenkins가 헤더로 현재 log size를 내려줌 (없으면 받은 바이트만큼 전진)
+        size_header = resp.headers.get("X-Text-Size")
+        next_start = int(size_header) if size_header else start + len(resp.content)
         more_data = resp.headers.get("X-More-Data") == "true"
 
         return {
             "text": text,
+            "raw": resp.content,
             "next_start": next_start,
             "more_data": more_data,
         }
-    
-    def get_build_result(self, build_number: int):
-        """
-        Jenkins 빌드 완료될 때까지 result 필드 대기
-        """
-        url = f"{self.base_url}/job/{self.job_name}/{build_number}/api/json"
-
-        while True:
-            resp = requests.get(
-                url,
-                auth=HTTPBasicAuth(self.username, self.token),
-                timeout=10,
-                verify=True
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            result = data.get("result")
-            if result is not None:
-                return result
-
-            time.sleep(2)
\ No newline at end of file
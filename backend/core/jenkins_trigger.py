@@ -1,25 +1,21 @@
-import asyncio
-from sqlalchemy.orm import Session
+import logging
 from core.jenkins_client import JenkinsClient
+from core.build_watcher import build_watcher
 from crud.deploy import update_deploy_status
-from database.yoitang import SessionLocal
+from database.yoitang import AsyncSessionLocal
 from schemas.deploy import DeployRequest
 from models.deploy import DeployStatus
 
-def map_jenkins_result_to_status(result: str | None) -> DeployStatus:
-    if result is None:
-        return DeployStatus.IN_PROGRESS
-    r = result.upper()
-    if r == "SUCCESS":
-        return DeployStatus.SUCCESS 
-    # FAILURE / ABORTED / NOT_BUILT / UNSTABLE → 실패로 처리
-    return DeployStatus.FAILED
+logger = logging.getLogger("jenkins_trigger")
 
-async def trigger_jenkins_build(deploy_id: int, req: DeployRequest):
-    db = SessionLocal()
+async def trigger_jenkins_build(deploy_id: int, req: DeployRequest) -> int | None:
+    """
+    Jenkins 빌드만 트리거하고, 완료 대기는 build_watcher에 맡긴다.
+    트리거에 실패하면 배포를 FAILED로 바꾸고 None을 반환한다.
+    """
     try:
         jenkins = JenkinsClient()
-        queue_id = jenkins.trigger_build(
+        queue_id = await jenkins.trigger_build(
             prefix=req.prefix,
             git_repo=str(req.git_repo),
             branch=req.branch,
@@ -27,22 +23,13 @@ async def trigger_jenkins_build(deploy_id: int, req: DeployRequest):
             frontend_stack=req.frontend_stack,
             git_pat=req.git_pat
         )
-        
-        # queue_id → build_number 조회 (blocking → thread 로)
-        build_number = await asyncio.to_thread(
-            jenkins.get_build_number_from_queue,
-            queue_id
-        )
-
-        # 빌드 완료될 때까지 결과 polling (blocking → thread 로)
-        result = await asyncio.to_thread(
-            jenkins.get_build_result,
-            build_number
-        )
-
-        deploy_status = map_jenkins_result_to_status(result)
-        update_deploy_status(db, deploy_id, deploy_status.value)
+        if queue_id < 0:
+            raise RuntimeError("Jenkins 응답에 큐 아이템 위치(Location)가 없습니다.")
     except Exception as e:
-        update_deploy_status(db, deploy_id, DeployStatus.FAILED.value)
-    finally:
-        db.close()
\ No newline at end of file
+        logger.error(f"Jenkins 트리거 실패 (deploy_id={deploy_id}): {e}")
+        async with AsyncSessionLocal() as db:
+            await update_deploy_status(db, deploy_id, DeployStatus.FAILED.value)
+        return None
+
+    build_watcher.track(deploy_id, queue_id)
+    return queue_id
@@ -3,11 +3,29 @@ from typing import Any, Dict, List
 import httpx
 from fastapi import HTTPException
 
+from core.http_pool import get_client
+from core.metrics_cache import kubecost_cache
+
+
+def kubecost_http() -> httpx.AsyncClient:
+    return get_client("KUBECOST", http2=True, read_timeout=10.0)
+
 
 class KubecostClient:
+    """
+    요청마다 AsyncClient를 만들지 않고 프로세스 전역 keep-alive 커넥션 풀(core.http_pool, 이름 KUBECOST)을 공유한다.
+    풀 한도 / 타임아웃 / HTTP/2 는 KUBECOST_* 환경 변수로 설정 (core.http_pool 참고, 응답 타임아웃 default 10초).
+    응답은 core.metrics_cache 에 캐시되고 같은 조회의 동시 요청은 upstream 호출 하나로 합쳐진다.
+    """
+
     def __init__(self) -> None:
         self.base_url = "https://cost.yoitang.cloud"
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        # lifespan 종료 후 다시 만들어진 클라이언트도 쓰도록 매번 풀에서 가져옴
+        return kubecost_http()
+
     async def allocation(
         self,
         window: str,
@@ -29,16 +47,20 @@ class KubecostClient:
         if accumulate is not None:
             params["accumulate"] = str(accumulate).lower()
 
-        async with httpx.AsyncClient(verify=True) as client:
-            try:
-                resp = await client.get(
-                    f"{self.base_url}/model/allocation",
-                    params=params,
-                    timeout=10.0,
-                )
-                resp.raise_for_status()
-            except Exception as e:
-                raise HTTPException(status_code=502, detail=f"Kubecost allocation 호출 실패: {e}")
+        return await kubecost_cache.get_or_load(
+            (self.base_url, window, aggregation, namespace or None, accumulate),
+            lambda: self._allocation(params),
+        )
+
+    async def _allocation(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            resp = await self.http.get(
+                f"{self.base_url}/model/allocation",
+                params=params,
+            )
+            resp.raise_for_status()
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Kubecost allocation 호출 실패: {e}")
 
         data = resp.json()
         # Allocation API 표준 응답 형태: { "code": 200, "data": [ { ... }, { ... } ] }
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import os
+import tempfile
+
+from core.config import env_int
+from core.jenkins_client import JenkinsClient
+from crud.log import add_log_chunk, delete_log_chunks, get_or_create_log, is_log_archived
+from crud.log_search import trailing_line
+from database.yoitang import AsyncSessionLocal
+
+
+logger = logging.getLogger("log_archive")
+
+# 압축 전 기준 조각 크기 / codec
+CHUNK_SIZE = env_int("LOG_CHUNK_SIZE", 256 * 1024)
+CODEC = os.getenv("LOG_ARCHIVE_CODEC", "zlib")
+
+# 진행 중인 보관 작업 (GC 방지용 참조)
+_tasks: set[asyncio.Task] = set()
+
+
+async def archive_build_log(deploy_id: int, build_number: int) -> int:
+    """
+    끝난 빌드의 Jenkins 콘솔 로그 전체를 CHUNK_SIZE 단위로 잘라 압축해 log_chunks에 보관.
+    Jenkins가 오래된 빌드를 지워도 /log/{deploy_id} 로 다시 볼 수 있다.
+    보관한 원본 크기(bytes)를 반환.
+    """
+    # Jenkins에서 받는 동안에는 DB 커넥션을 잡지 않도록 임시 파일에 먼저 받아두고,
+    # DB에는 CHUNK_SIZE 씩 읽어 넣는다 (로그 전체를 메모리에 올리지 않음)
+    with tempfile.TemporaryFile() as spool:
+        jenkins = JenkinsClient()
+        async for data in jenkins.iter_console_text(build_number):
+            await asyncio.to_thread(spool.write, data)
+        size = spool.tell()
+        spool.seek(0)
+
+        async with AsyncSessionLocal() as db:
+            # 같은 배포를 다시 보관하면 기존 조각을 갈아끼운다 (한 트랜잭션, 같은 배포의 보관은 행 잠금으로 한 줄로)
+            await get_or_create_log(db, deploy_id, lock=True)
+            # 이미 object storage로 옮긴 배포에 새 logs 행을 만들면 옮긴 본문이 가려지므로 보관하지 않는다
+            if await is_log_archived(db, deploy_id):
+                await db.rollback()
+                logger.warning(f"이미 object storage로 옮긴 배포라 빌드 로그를 보관하지 않음 (deploy_id={deploy_id})")
+                return 0
+            await delete_log_chunks(db, deploy_id, "build")
+            seq, carry = 0, None
+            while raw := await asyncio.to_thread(spool.read, CHUNK_SIZE):
+                # 조각마다 flush 되므로 세션에 쌓이지 않는다
+                await add_log_chunk(db, deploy_id, "build", seq, raw, CODEC, carry)
+                carry = trailing_line(raw.decode("utf-8", errors="replace"))
+                seq += 1
+            await db.commit()
+
+    return size
+
+
+def schedule_build_log_archive(deploy_id: int, build_number: int) -> None:
+    """
+    빌드 완료 시점에 백그라운드로 로그 보관 (실패해도 배포 상태에는 영향 없음)
+    """
+    async def _run():
+        try:
+            size = await archive_build_log(deploy_id, build_number)
+            logger.info(f"빌드 로그 보관 완료 (deploy_id={deploy_id}, build_number={build_number}, size={size})")
+        except Exception as e:
+            logger.error(f"빌드 로그 보관 실패 (deploy_id={deploy_id}, build_number={build_number}): {e}")
+
+    task = asyncio.create_task(_run())
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
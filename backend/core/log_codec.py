@@ -0,0 +1,27 @@
+import lzma
+import zlib
+from typing import Callable, Dict, Tuple
+
+from core.config import env_int
+
+
+# codec 이름 → (compress, decompress)
+CODECS: Dict[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "none": (lambda b: b, lambda b: b),
+    "zlib": (lambda b: zlib.compress(b, env_int("LOG_ZLIB_LEVEL", 6)), zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    try:
+        return CODECS[codec][0](data)
+    except KeyError:
+        raise ValueError(f"지원하지 않는 codec: {codec}")
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    try:
+        return CODECS[codec][1](data)
+    except KeyError:
+        raise ValueError(f"지원하지 않는 codec: {codec}")
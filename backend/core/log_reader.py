@@ -0,0 +1,179 @@
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import env_int
+from crud.log import (
+    LOG_TYPES,
+    get_log_chunk_index,
+    get_log_column_size,
+    get_log_meta,
+    iter_log_column_bytes,
+    read_log_chunk_bytes,
+)
+from database.yoitang import AsyncSessionLocal
+
+
+# 텍스트 컬럼을 나눠 읽을 단위 (bytes)
+READ_WINDOW = env_int("LOG_READ_WINDOW", 1024 * 1024)
+# /log/{deploy_id} 응답에 담을 로그 종류별 최대 크기 (bytes, 넘으면 마지막 부분만)
+CONTENT_MAX_BYTES = env_int("LOG_CONTENT_MAX_BYTES", 1024 * 1024)
+
+
+@dataclass
+class LogLayout:
+    """
+    로그 하나의 바이트 배치: [텍스트 컬럼][조각 0][조각 1]...
+    chunks: (chunk_id, 시작 offset, 원본 크기)
+    """
+    deploy_id: int
+    log_type: str
+    column_size: int
+    chunks: list[tuple[int, int, int]] = field(default_factory=list)
+
+    @property
+    def size(self) -> int:
+        if self.chunks:
+            _, start, raw_size = self.chunks[-1]
+            return start + raw_size
+        return self.column_size
+
+
+async def get_log_layout(db: AsyncSession, deploy_id: int, log_type: str) -> LogLayout | None:
+    column_size = await get_log_column_size(db, deploy_id, log_type)
+    if column_size is None:
+        return None
+
+    chunks = []
+    pos = column_size
+    for chunk_id, raw_size in await get_log_chunk_index(db, deploy_id, log_type):
+        chunks.append((chunk_id, pos, raw_size))
+        pos += raw_size
+    return LogLayout(deploy_id=deploy_id, log_type=log_type, column_size=column_size, chunks=chunks)
+
+
+async def iter_log_pieces(db: AsyncSession, layout: LogLayout, start: int, end: int) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    [start, end) 구간을 (조각 시작 offset, bytes) 로 앞에서부터 나눠 읽음.
+    한 번에 메모리에 올라가는 크기는 READ_WINDOW 또는 압축 조각 하나로 제한된다.
+    텍스트 컬럼 구간은 cursor 하나로 읽으므로 그 구간이 끝날 때까지 같은 트랜잭션을 유지해야 한다.
+    """
+    pos = start
+    column_end = min(end, layout.column_size)
+    async for piece_start, data in iter_log_column_bytes(db, layout.deploy_id, layout.log_type, pos, column_end, READ_WINDOW):
+        yield piece_start, data
+    pos = max(pos, column_end)
+
+    for chunk_id, chunk_start, raw_size in layout.chunks:
+        if chunk_start + raw_size <= pos:
+            continue
+        if chunk_start >= end:
+            break
+        data = await read_log_chunk_bytes(db, chunk_id)
+        lo = max(pos - chunk_start, 0)
+        hi = min(end - chunk_start, raw_size)
+        yield chunk_start + lo, data[lo:hi]
+        pos = chunk_start + hi
+
+
+async def _iter_pieces_reversed(db: AsyncSession, layout: LogLayout) -> AsyncIterator[tuple[int, bytes]]:
+    for chunk_id, chunk_start, _ in reversed(layout.chunks):
+        yield chunk_start, await read_log_chunk_bytes(db, chunk_id)
+
+    async for piece_start, data in iter_log_column_bytes(
+        db, layout.deploy_id, layout.log_type, 0, layout.column_size, READ_WINDOW, reverse=True,
+    ):
+        yield piece_start, data
+
+
+async def find_tail_offset(db: AsyncSession, layout: LogLayout, lines: int) -> int:
+    """
+    마지막 lines 줄이 시작되는 바이트 offset (끝에서부터 줄바꿈을 세며 거꾸로 읽음)
+    """
+    return await scan_tail_offset(_iter_pieces_reversed(db, layout), layout.size, lines)
+
+
+async def scan_tail_offset(pieces: AsyncIterator[tuple[int, bytes]], total: int, lines: int) -> int:
+    """
+    뒤에서부터 주어지는 (시작 offset, bytes) 조각들로 마지막 lines 줄의 시작 offset 계산
+    """
+    count = 0
+    async for start, data in pieces:
+        idx = len(data)
+        while True:
+            idx = data.rfind(b"\n", 0, idx)
+            if idx < 0:
+                break
+            # 로그 맨 끝의 줄바꿈은 새 줄의 시작이 아님
+            if start + idx == total - 1:
+                continue
+            count += 1
+            if count == lines:
+                return start + idx + 1
+    return 0
+
+
+async def iter_log_range(layout: LogLayout, start: int, end: int) -> AsyncIterator[bytes]:
+    """
+    StreamingResponse용 generator.
+    요청 세션과 별개로 자체 세션을 쓰고, 압축 조각을 클라이언트가 받아가는 동안에는
+    커넥션을 풀에 돌려준다 (느린 클라이언트가 풀을 붙잡지 않도록).
+    텍스트 컬럼 구간을 보내는 동안에는 cursor 때문에 커넥션을 잡고 있다.
+    """
+    async with AsyncSessionLocal() as db:
+        async for piece_start, data in iter_log_pieces(db, layout, start, end):
+            # 텍스트 컬럼 구간은 cursor가 트랜잭션 안에 있어야 하므로 압축 조각부터 돌려준다
+            if piece_start >= layout.column_size:
+                await db.close()
+            if data:
+                yield data
+
+
+async def read_log_tail_text(db: AsyncSession, layout: LogLayout, max_bytes: int) -> str:
+    """
+    로그 마지막 max_bytes 이내를 줄 단위로 잘라 읽음 (첫 줄바꿈 이후부터, 필요한 조각만 풂)
+    """
+    start = max(0, layout.size - max_bytes)
+    data = b"".join([piece async for _, piece in iter_log_pieces(db, layout, start, layout.size)])
+    return trim_to_line(data, start > 0)
+
+
+def trim_to_line(data: bytes, cut: bool) -> str:
+    """
+    앞을 잘라낸 로그(cut=True)면 잘린 첫 줄을 버리고 첫 줄바꿈 이후부터 반환
+    """
+    if cut:
+        newline = data.find(b"\n")
+        data = data[newline + 1:] if newline >= 0 else b""
+    return data.decode("utf-8", errors="replace")
+
+
+async def read_log_content(db: AsyncSession, deploy_id: int, max_bytes: int = CONTENT_MAX_BYTES) -> dict | None:
+    """
+    /log/{deploy_id} 응답. 로그 종류별로 max_bytes 를 넘으면 마지막 부분만 담고
+    truncated 에 전체 크기를 남긴다 (전체는 /log/{deploy_id}/{log_type} 범위 조회로).
+    """
+    meta = await get_log_meta(db, deploy_id)
+    if meta is None:
+        return None
+
+    content: dict[str, str | None] = {}
+    truncated: dict[str, int] = {}
+    for t in LOG_TYPES:
+        layout = await get_log_layout(db, deploy_id, t)
+        if layout is None or layout.size == 0:
+            content[f"{t}_log"] = None
+            continue
+        content[f"{t}_log"] = await read_log_tail_text(db, layout, max_bytes)
+        if layout.size > max_bytes:
+            truncated[t] = layout.size
+
+    return {
+        "log_id": meta["log_id"],
+        "deploy_id": meta["deploy_id"],
+        **content,
+        "created_date": meta["created_date"],
+        "updated_date": meta["updated_date"],
+        "truncated": truncated,
+    }
@@ -0,0 +1,116 @@
+import re
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import env_int
+from core.log_reader import LogLayout, get_log_layout, iter_log_pieces
+from crud.log_search import COLUMN_SEQ, LINE_CARRY_MAX, get_matching_log_parts, search_deploys_by_log
+
+
+# 배포 하나당 돌려줄 최대 snippet 수 / snippet 한 줄 최대 길이
+MAX_SNIPPETS = env_int("LOG_SEARCH_MAX_SNIPPETS", 5)
+SNIPPET_WIDTH = env_int("LOG_SEARCH_SNIPPET_WIDTH", 300)
+
+
+def _terms(q: str) -> list[bytes]:
+    # plainto_tsquery('simple', ...) 와 같은 기준으로 단어를 나눔
+    return [t.encode("utf-8") for t in re.findall(r"\w+", q.lower())]
+
+
+async def _iter_part_lines(db: AsyncSession, layout: LogLayout, seq: int) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    색인 조각(seq) 하나에서 끝나는 줄을 (로그 전체 기준 바이트 offset, 줄 내용) 으로 읽음.
+    조각 앞에서 이어지는 줄은 앞 부분(LINE_CARRY_MAX 까지)을 붙여 읽고 (색인과 같은 기준),
+    조각 뒤로 넘어가는 줄은 다음 조각에서 읽는다 (로그 끝이면 여기서).
+    텍스트 컬럼도 READ_WINDOW 단위로 나눠 읽으므로 한 번에 메모리에 올라가는 크기가 제한된다.
+    아주 긴 줄은 색인과 마찬가지로 앞 LINE_CARRY_MAX 바이트만 본다.
+    """
+    if seq == COLUMN_SEQ:
+        part_start, part_end = 0, layout.column_size
+    elif seq < len(layout.chunks):
+        _, part_start, raw_size = layout.chunks[seq]
+        part_end = part_start + raw_size
+    else:
+        return
+
+    line_start = part_start
+    line = bytearray()
+    if part_start > 0:
+        head_start = max(0, part_start - LINE_CARRY_MAX)
+        head = b"".join([data async for _, data in iter_log_pieces(db, layout, head_start, part_start)])
+        cut = head.rfind(b"\n") + 1
+        line_start = head_start + cut
+        line.extend(head[cut:])
+
+    async for piece_start, data in iter_log_pieces(db, layout, part_start, part_end):
+        pos = 0
+        while pos < len(data):
+            newline = data.find(b"\n", pos)
+            stop = len(data) if newline < 0 else newline
+            line.extend(data[pos:min(stop, pos + LINE_CARRY_MAX - len(line))])
+            if newline < 0:
+                break
+            yield line_start, bytes(line)
+            line.clear()
+            line_start = piece_start + newline + 1
+            pos = newline + 1
+
+    if line and part_end >= layout.size:
+        yield line_start, bytes(line)
+
+
+def _match_line(line: bytes, terms: list[bytes]) -> str | None:
+    # 모든 검색어가 들어있으면 snippet, 아니면 None
+    lowered = line.lower()
+    if not all(t in lowered for t in terms):
+        return None
+    return line[:SNIPPET_WIDTH * 4].decode("utf-8", errors="replace").rstrip("\r")[:SNIPPET_WIDTH]
+
+
+async def search_logs(db: AsyncSession, q: str, log_type: str | None = None, limit: int = 20, offset: int = 0, **filters) -> list[dict]:
+    """
+    log_search_index(GIN)로 검색어가 들어있는 배포를 먼저 좁히고,
+    결과 배포들의 해당 조각만 풀어서 줄 단위 snippet을 만든다.
+    """
+    terms = _terms(q)
+    if not terms:
+        return []
+
+    deploys = await search_deploys_by_log(db, q, log_type=log_type, limit=limit, offset=offset, **filters)
+    if not deploys:
+        return []
+    parts = await get_matching_log_parts(db, q, [d.deploy_id for d in deploys], log_type)
+
+    results = []
+    for deploy in deploys:
+        matches = []
+        layouts: dict[str, LogLayout | None] = {}
+        for part_type, seq in parts.get(deploy.deploy_id, []):
+            if len(matches) >= MAX_SNIPPETS:
+                break
+            if part_type not in layouts:
+                layouts[part_type] = await get_log_layout(db, deploy.deploy_id, part_type)
+            layout = layouts[part_type]
+            if layout is None:
+                continue
+
+            # offset은 /log/{deploy_id}/{log_type}?offset= 으로 바로 이어볼 수 있다
+            async for line_start, line in _iter_part_lines(db, layout, seq):
+                snippet = _match_line(line, terms)
+                if snippet is None:
+                    continue
+                matches.append({"log_type": part_type, "offset": line_start, "line": snippet})
+                if len(matches) >= MAX_SNIPPETS:
+                    break
+
+        results.append({
+            "deploy_id": deploy.deploy_id,
+            "service_id": deploy.service_id,
+            "status": deploy.status.value,
+            "git_branch": deploy.git_branch,
+            "commit_id": deploy.commit_id,
+            "created_date": deploy.created_date,
+            "matches": matches,
+        })
+    return results
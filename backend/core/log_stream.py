@@ -0,0 +1,85 @@
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, Callable, Awaitable
+
+from core.build_watcher import map_jenkins_result_to_status
+from core.config import env_float
+from core.jenkins_client import JenkinsClient
+from core.log_tail_cache import log_tail_cache
+
+
+logger = logging.getLogger("log_stream")
+
+# SSE keep-alive 주기(초): 프록시가 idle 연결을 끊지 않도록 주석 라인을 보낸다
+KEEPALIVE_SEC = env_float("LOG_STREAM_KEEPALIVE_SEC", 15.0)
+
+
+def sse_event(event: str, data: dict, event_id: int | None = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_build_log(
+    build_number: int,
+    offset: int,
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """
+    Jenkins 빌드 로그를 Server-Sent Events로 흘려보낸다.
+
+      event: log    → {"chunk", "nextOffset"}  (id = nextOffset → Last-Event-ID로 이어받기)
+      event: result → {"result", "status"}     (X-More-Data가 false가 되면 마지막으로 한 번)
+      event: error  → {"detail"}
+
+    로그는 log_tail_cache를 통해 읽으므로 viewer 수와 상관없이 upstream 조회는 빌드당 하나다.
+    result 를 보낸 뒤에는 연결을 끝내므로 클라이언트는 result 를 받으면 close() 해야 한다.
+    그래도 Last-Event-ID로 다시 연결하면 route에서 204로 응답해 재연결을 멈춘다.
+    """
+    interval = log_tail_cache.fetch_interval
+    last_sent = time.monotonic()
+
+    yield f"retry: {int(interval * 1000)}\n\n"
+
+    while True:
+        if await is_disconnected():
+            return
+
+        try:
+            chunk, next_offset, has_more = await log_tail_cache.read(build_number, offset)
+        except Exception as e:
+            logger.warning(f"로그 스트림 조회 실패 (build_number={build_number}): {e}")
+            yield sse_event("error", {"detail": f"Jenkins 로그 조회 실패: {e}"})
+            return
+
+        if chunk or next_offset != offset:
+            offset = next_offset
+            yield sse_event("log", {"chunk": chunk, "nextOffset": offset}, event_id=offset)
+            last_sent = time.monotonic()
+
+        if not has_more:
+            break
+
+        if time.monotonic() - last_sent >= KEEPALIVE_SEC:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+
+        await asyncio.sleep(interval)
+
+    try:
+        build = await JenkinsClient().get_build(build_number)
+        result = build.get("result")
+    except Exception as e:
+        logger.warning(f"빌드 결과 조회 실패 (build_number={build_number}): {e}")
+        result = None
+
+    yield sse_event(
+        "result",
+        {"result": result, "status": map_jenkins_result_to_status(result).value},
+        event_id=offset,
+    )
@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from core.config import env_float, env_int
+from core.jenkins_client import JenkinsClient
+
+
+@dataclass
+class _Segment:
+    # Jenkins progressiveText 기준 offset 구간과 그 구간에서 받은 로그
+    start: int
+    end: int
+    data: bytes
+
+
+@dataclass
+class _BuildLog:
+    segments: list[_Segment] = field(default_factory=list)
+    next_start: int = 0
+    size: int = 0
+    finished: bool = False
+    last_fetch: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class LogTailCache:
+    """
+    빌드별 Jenkins 로그를 메모리에 쌓아두고, 여러 viewer가 같은 upstream 조회를 공유하는 캐시.
+
+      - 빌드당 JENKINS_LOG_FETCH_INTERVAL 초에 한 번만 Jenkins progressiveText를 호출
+      - 어떤 offset 요청이든 메모리에서 응답 (offset은 Jenkins X-Text-Size 기준)
+        단, console note 제거 등으로 받은 길이가 offset 구간과 다른 구간의 중간 offset은
+        잘라낼 위치를 알 수 없으므로 그 offset부터 upstream에서 직접 받는다 (캐시하지 않음)
+      - 빌드가 끝나면(X-More-Data=false) 더 이상 조회하지 않고 고정
+      - 전체 크기(JENKINS_LOG_CACHE_MAX_BYTES) / 빌드 수(JENKINS_LOG_CACHE_MAX_BUILDS)를 넘으면 LRU로 제거
+    """
+
+    def __init__(self) -> None:
+        self.fetch_interval = env_float("JENKINS_LOG_FETCH_INTERVAL", 1.0)
+        self.max_bytes = env_int("JENKINS_LOG_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+        self.max_builds = env_int("JENKINS_LOG_CACHE_MAX_BUILDS", 200)
+
+        self._logs: OrderedDict[int, _BuildLog] = OrderedDict()
+        self._bytes = 0
+
+        self.reads = 0
+        self.upstream_fetches = 0
+        self.offset_refetches = 0
+        self.evictions = 0
+
+    async def read(self, build_number: int, offset: int = 0) -> tuple[str, int, bool]:
+        """
+        offset 이후의 로그를 (chunk, next_offset, has_more) 로 반환
+        """
+        self.reads += 1
+        entry = self._logs.get(build_number)
+        if entry is None:
+            entry = _BuildLog()
+            self._logs[build_number] = entry
+        self._logs.move_to_end(build_number)
+
+        if self._is_stale(entry):
+            # 동시에 들어온 viewer들은 한 번의 upstream 조회 결과를 같이 쓴다
+            async with entry.lock:
+                if self._is_stale(entry):
+                    await self._fetch(build_number, entry)
+
+        chunk = self._slice(entry, offset)
+        if chunk is None:
+            return await self._read_upstream(build_number, offset)
+        next_offset = max(entry.next_start, offset)
+        return chunk.decode("utf-8", errors="replace"), next_offset, not entry.finished
+
+    async def _read_upstream(self, build_number: int, offset: int) -> tuple[str, int, bool]:
+        # 캐시된 구간으로 자를 수 없는 offset → 이미 보낸 로그를 다시 보내지 않도록 upstream에 그대로 요청
+        result = await JenkinsClient().get_build_log_chunk(build_number, start=offset)
+        self.upstream_fetches += 1
+        self.offset_refetches += 1
+        return result["raw"].decode("utf-8", errors="replace"), max(result["next_start"], offset), result["more_data"]
+
+    def _is_stale(self, entry: _BuildLog) -> bool:
+        return not entry.finished and time.monotonic() - entry.last_fetch >= self.fetch_interval
+
+    async def _fetch(self, build_number: int, entry: _BuildLog) -> None:
+        try:
+            jenkins = JenkinsClient()
+            result = await jenkins.get_build_log_chunk(build_number, start=entry.next_start)
+            self.upstream_fetches += 1
+        except BaseException:
+            # 한 번도 받지 못한 빌드(없는 빌드 번호, 취소된 요청 등)는 캐시에 남기지 않는다
+            if entry.last_fetch == 0 and self._logs.get(build_number) is entry:
+                self._logs.pop(build_number)
+            raise
+
+        data = result["raw"]
+        if data:
+            entry.segments.append(_Segment(start=entry.next_start, end=result["next_start"], data=data))
+            entry.size += len(data)
+            # 조회하는 동안 밀려난 항목이면 전체 크기에 더하지 않는다
+            if self._logs.get(build_number) is entry:
+                self._bytes += len(data)
+        entry.next_start = max(entry.next_start, result["next_start"])
+        entry.finished = not result["more_data"]
+        entry.last_fetch = time.monotonic()
+
+        self._evict(keep=build_number)
+
+    @staticmethod
+    def _slice(entry: _BuildLog, offset: int) -> bytes | None:
+        parts = []
+        for seg in entry.segments:
+            if seg.end <= offset:
+                continue
+            if seg.start >= offset:
+                parts.append(seg.data)
+            elif len(seg.data) == seg.end - seg.start:
+                parts.append(seg.data[offset - seg.start:])
+            else:
+                # console note 제거 등으로 길이가 달라 offset 위치를 알 수 없음
+                return None
+        return b"".join(parts)
+
+    def _evict(self, keep: int) -> None:
+        while self._logs and (self._bytes > self.max_bytes or len(self._logs) > self.max_builds):
+            build_number = next(iter(self._logs))
+            if build_number == keep:
+                # 지금 읽고 있는 빌드 하나만 남았으면 그대로 둔다
+                if len(self._logs) == 1:
+                    break
+                self._logs.move_to_end(build_number)
+                continue
+            entry = self._logs.pop(build_number)
+            self._bytes -= entry.size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "builds": len(self._logs),
+            "frozen": sum(1 for e in self._logs.values() if e.finished),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "reads": self.reads,
+            "upstream_fetches": self.upstream_fetches,
+            "offset_refetches": self.offset_refetches,
+            "evictions": self.evictions,
+        }
+
+
+# 프로세스 전역 로그 캐시
+log_tail_cache = LogTailCache()
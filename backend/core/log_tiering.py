@@ -0,0 +1,390 @@
+import asyncio
+import contextlib
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator, BinaryIO
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config import env_float, env_int
+from core.log_codec import compress, decompress
+from core.log_reader import CONTENT_MAX_BYTES, get_log_layout, iter_log_pieces, scan_tail_offset, trim_to_line
+from core.object_storage import ObjectStorage, get_object_storage
+from crud.archived_log import (
+    archived_object_key,
+    archived_object_keys,
+    delete_archived_logs,
+    delete_expired_logs,
+    get_archived_log,
+    get_log_fingerprint,
+    get_tiering_candidates,
+    lock_expired_archived_logs,
+    replace_log_with_archive,
+)
+from crud.log import LOG_TYPES, get_log
+from database.yoitang import AsyncSessionLocal
+from models.archived_log import ArchivedLog
+
+
+logger = logging.getLogger("log_tiering")
+
+# object storage 에 올릴 때 따로 압축하는 조각 크기 (원본 bytes, 읽을 때 이 단위로 ranged GET)
+CHUNK_SIZE = env_int("LOG_TIERING_CHUNK_SIZE", 1024 * 1024)
+
+
+class LogStorageError(Exception):
+    pass
+
+
+def get_log_storage() -> ObjectStorage:
+    storage = get_object_storage()
+    if storage is None:
+        raise LogStorageError("LOG_STORAGE_BACKEND 가 설정되지 않아 보관된 로그를 읽을 수 없습니다.")
+    return storage
+
+
+def archived_log_size(archived: ArchivedLog, log_type: str) -> int:
+    return getattr(archived, f"{log_type}_size")
+
+
+def _chunk_index(archived: ArchivedLog, log_type: str) -> list[tuple[int, int, int, int]]:
+    # (원본 시작 offset, 원본 크기, 객체 안 시작 offset, 압축 크기)
+    index = []
+    raw_pos = stored_pos = 0
+    for raw_size, stored_size in archived.chunks.get(log_type, []):
+        index.append((raw_pos, raw_size, stored_pos, stored_size))
+        raw_pos += raw_size
+        stored_pos += stored_size
+    return index
+
+
+async def _get_stored_chunk(storage: ObjectStorage, key: str, stored_start: int, stored_size: int) -> bytes:
+    data = await storage.get_range(key, stored_start, stored_start + stored_size)
+    if data is None or len(data) != stored_size:
+        raise LogStorageError(f"보관된 로그 객체가 없거나 잘렸습니다: {key}")
+    return data
+
+
+async def _read_chunk(storage: ObjectStorage, archived: ArchivedLog, log_type: str, stored_start: int, stored_size: int) -> bytes:
+    data = await _get_stored_chunk(storage, archived_object_key(archived, log_type), stored_start, stored_size)
+    # 압축 해제는 event loop를 막지 않도록 thread에서
+    return await asyncio.to_thread(decompress, data, archived.codec)
+
+
+async def iter_archived_log_pieces(
+    storage: ObjectStorage, archived: ArchivedLog, log_type: str, start: int, end: int,
+) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    object storage로 옮긴 로그의 [start, end) 구간을 (조각 시작 offset, bytes) 로 앞에서부터 나눠 읽음
+    (core.log_reader.iter_log_pieces 와 같은 형태). 걸치는 조각만 ranged GET 으로 받아 하나씩 풀므로
+    한 번에 메모리에 올라가는 크기는 조각 하나(CHUNK_SIZE)로 제한된다.
+    """
+    for raw_start, raw_size, stored_start, stored_size in _chunk_index(archived, log_type):
+        if raw_start + raw_size <= start:
+            continue
+        if raw_start >= end:
+            break
+        data = await _read_chunk(storage, archived, log_type, stored_start, stored_size)
+        lo = max(start - raw_start, 0)
+        hi = min(end - raw_start, raw_size)
+        yield raw_start + lo, data[lo:hi]
+
+
+async def iter_archived_log_range(storage: ObjectStorage, archived: ArchivedLog, log_type: str, start: int, end: int) -> AsyncIterator[bytes]:
+    # StreamingResponse용 (DB 커넥션은 쓰지 않음)
+    async for _, data in iter_archived_log_pieces(storage, archived, log_type, start, end):
+        if data:
+            yield data
+
+
+async def _iter_archived_pieces_reversed(storage: ObjectStorage, archived: ArchivedLog, log_type: str) -> AsyncIterator[tuple[int, bytes]]:
+    for raw_start, _, stored_start, stored_size in reversed(_chunk_index(archived, log_type)):
+        yield raw_start, await _read_chunk(storage, archived, log_type, stored_start, stored_size)
+
+
+async def find_archived_tail_offset(storage: ObjectStorage, archived: ArchivedLog, log_type: str, lines: int) -> int:
+    """
+    옮긴 로그에서 마지막 lines 줄이 시작되는 바이트 offset (core.log_reader.find_tail_offset 과 같은 기준)
+    """
+    pieces = _iter_archived_pieces_reversed(storage, archived, log_type)
+    return await scan_tail_offset(pieces, archived_log_size(archived, log_type), lines)
+
+
+async def read_archived_log(db: AsyncSession, deploy_id: int, max_bytes: int = CONTENT_MAX_BYTES) -> dict | None:
+    """
+    object storage로 옮긴 로그를 /log/{deploy_id} 응답 형태로 읽음 (옮긴 적 없으면 None).
+    read_log_content 와 같이 로그 종류별로 max_bytes 를 넘으면 마지막 부분만 담는다 (필요한 조각만 받음).
+    객체를 받는 동안에는 DB 커넥션을 풀에 돌려준다.
+    """
+    archived = await get_archived_log(db, deploy_id)
+    if archived is None:
+        return None
+    await db.close()
+
+    storage = get_log_storage()
+    content: dict[str, str | None] = {}
+    truncated: dict[str, int] = {}
+    for t in LOG_TYPES:
+        size = archived_log_size(archived, t)
+        if size == 0:
+            content[f"{t}_log"] = None
+            continue
+        start = max(0, size - max_bytes)
+        data = b"".join([piece async for _, piece in iter_archived_log_pieces(storage, archived, t, start, size)])
+        content[f"{t}_log"] = trim_to_line(data, start > 0)
+        if size > max_bytes:
+            truncated[t] = size
+
+    return {
+        "log_id": archived.log_id,
+        "deploy_id": archived.deploy_id,
+        **content,
+        "created_date": archived.log_created_date,
+        "updated_date": archived.log_updated_date,
+        "truncated": truncated,
+    }
+
+
+class LogTiering:
+    """
+    오래된 로그를 object storage로 옮기고 보존 기간이 지난 로그를 지우는 주기 작업.
+    logs / log_chunks 를 작게 유지해 vacuum / 인덱스 유지 비용을 줄인다.
+
+      - ARCHIVED 배포의 로그, 또는 LOG_TIERING_AGE_DAYS 보다 오래된 로그를
+        로그 종류별 객체({LOG_STORAGE_PREFIX}{deploy_id}/{log_id}/{log_type}.log)로 올리고
+        logs / log_chunks / 검색 색인 행을 지운 뒤 archived_logs 에 위치와 조각 크기 목록만 남긴다.
+        객체는 LOG_TIERING_CHUNK_SIZE 단위로 따로 압축(LOG_TIERING_CODEC)한 조각을 이어붙인 것이라
+        범위 / tail 조회는 걸치는 조각만 ranged GET 으로 받아 푼다.
+        옮긴 로그는 /log/{deploy_id} 에서 그대로 읽히지만 전문 검색 대상에서는 빠진다.
+        옮긴 배포에는 로그를 새로 만들거나 이어붙일 수 없다 (새 logs 행이 옮긴 본문을 가리므로).
+      - 로그는 조각 단위로 임시 파일에 압축해 두고 올리므로 로그 크기와 상관없이 메모리는 조각 하나 정도만 쓴다.
+        객체를 올리는 동안에는 DB 커넥션을 잡지 않고, 그 사이 로그가 바뀌었으면 이번에는 건너뛴다.
+      - LOG_RETENTION_DAYS 가 지난 로그는 (옮긴 것 / 못 옮긴 것 모두) LOG_TIERING_BATCH_SIZE 개씩 지운다.
+      - 행 잠금은 SKIP LOCKED 이므로 API / worker.py 여러 곳에서 같이 돌아도 된다.
+
+    환경 변수:
+      - LOG_STORAGE_BACKEND      : none / local / s3 (core.object_storage 참고, default none → 옮기지 않음)
+      - LOG_STORAGE_PREFIX       : object key prefix (default deploy-logs/)
+      - LOG_TIERING_AGE_DAYS     : 이 기간보다 오래된 로그를 옮김 (default 30)
+      - LOG_TIERING_CODEC        : 객체 압축 codec (default lzma)
+      - LOG_TIERING_CHUNK_SIZE   : 따로 압축하는 조각 크기(bytes) (default 1MiB)
+      - LOG_RETENTION_DAYS       : 로그 보존 기간, 0이면 지우지 않음 (default 0)
+      - LOG_TIERING_BATCH_SIZE   : 한 번에 처리할 로그 수 (default 100)
+      - LOG_TIERING_INTERVAL_SEC : 실행 주기(초) (default 3600)
+    """
+
+    def __init__(self) -> None:
+        self.prefix = os.getenv("LOG_STORAGE_PREFIX", "deploy-logs/")
+        self.age_days = env_int("LOG_TIERING_AGE_DAYS", 30)
+        self.codec = os.getenv("LOG_TIERING_CODEC", "lzma")
+        self.retention_days = env_int("LOG_RETENTION_DAYS", 0)
+        self.batch_size = max(1, env_int("LOG_TIERING_BATCH_SIZE", 100))
+        self.interval = env_float("LOG_TIERING_INTERVAL_SEC", 3600.0)
+
+        self._task: asyncio.Task | None = None
+
+        self.runs = 0
+        self.moved = 0
+        self.moved_bytes = 0
+        self.stored_bytes = 0
+        self.skipped = 0
+        self.failed = 0
+        self.expired_archived = 0
+        self.expired_logs = 0
+        self.last_run_at: datetime | None = None
+        self.last_run_sec: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return get_object_storage() is not None or self.retention_days > 0
+
+    def start(self) -> None:
+        if not self.enabled:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.warning(f"로그 보관/정리 실패: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> None:
+        started = time.monotonic()
+        storage = get_object_storage()
+        # 보존 기간이 지난 로그는 옮기지 않고 바로 지우도록 정리를 먼저
+        if self.retention_days > 0:
+            await self._expire_all(storage)
+        if storage is not None:
+            await self._move_all(storage)
+        self.runs += 1
+        self.last_run_at = datetime.now()
+        self.last_run_sec = round(time.monotonic() - started, 3)
+
+    async def _move_all(self, storage: ObjectStorage) -> None:
+        older_than = datetime.now() - timedelta(days=self.age_days)
+        after_log_id = 0
+        while True:
+            async with AsyncSessionLocal() as db:
+                candidates = await get_tiering_candidates(db, older_than, self.batch_size, after_log_id)
+            for log_id, deploy_id in candidates:
+                try:
+                    if await self._move(storage, deploy_id):
+                        self.moved += 1
+                    else:
+                        self.skipped += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(f"로그 object storage 이동 실패 (deploy_id={deploy_id}): {e}")
+                after_log_id = log_id
+            if len(candidates) < self.batch_size:
+                return
+
+    async def _move(self, storage: ObjectStorage, deploy_id: int) -> bool:
+        async with AsyncSessionLocal() as db:
+            previous = await get_archived_log(db, deploy_id)
+
+        with contextlib.ExitStack() as stack:
+            spools = {t: stack.enter_context(tempfile.TemporaryFile()) for t in LOG_TYPES}
+            chunks: dict[str, list[list[int]]] = {t: [] for t in LOG_TYPES}
+
+            # 이미 옮긴 뒤 새로 쌓인 로그면 기존 객체의 조각을 앞에 그대로 붙인다 (codec 이 같으면 풀지 않음)
+            if previous is not None:
+                for t in LOG_TYPES:
+                    for _, raw_size, stored_start, stored_size in _chunk_index(previous, t):
+                        data = await _get_stored_chunk(storage, archived_object_key(previous, t), stored_start, stored_size)
+                        if previous.codec != self.codec:
+                            raw = await asyncio.to_thread(decompress, data, previous.codec)
+                            data = await asyncio.to_thread(compress, raw, self.codec)
+                        await self._write_chunk(spools[t], chunks[t], raw_size, data)
+
+            # 텍스트 컬럼은 cursor 로 읽으므로 다 읽을 때까지 같은 트랜잭션 (올리기 전에 닫음)
+            async with AsyncSessionLocal() as db:
+                log = await get_log(db, deploy_id)
+                fingerprint = await get_log_fingerprint(db, deploy_id)
+                if log is None or fingerprint is None:
+                    return False
+                for t in LOG_TYPES:
+                    layout = await get_log_layout(db, deploy_id, t)
+                    await self._spool_log(spools[t], chunks[t], iter_log_pieces(db, layout, 0, layout.size))
+                log_id, created_date, updated_date = log.log_id, log.created_date, log.updated_date
+
+            archived = ArchivedLog(
+                deploy_id=deploy_id,
+                log_id=previous.log_id if previous is not None else log_id,
+                object_key=f"{self.prefix}{deploy_id}/{log_id}/",
+                codec=self.codec,
+                **{f"{t}_size": sum(raw for raw, _ in chunks[t]) for t in LOG_TYPES},
+                object_size=sum(stored for t in LOG_TYPES for _, stored in chunks[t]),
+                chunks=chunks,
+                log_created_date=previous.log_created_date if previous is not None else created_date,
+                log_updated_date=updated_date,
+                archived_date=datetime.now(),
+            )
+            keys = archived_object_keys(archived)
+            try:
+                for t in LOG_TYPES:
+                    if chunks[t]:
+                        spools[t].seek(0)
+                        await storage.put_file(archived_object_key(archived, t), spools[t])
+            except Exception:
+                await storage.delete(keys)
+                raise
+
+        async with AsyncSessionLocal() as db:
+            replaced = await replace_log_with_archive(db, fingerprint, archived)
+            await db.commit()
+        if not replaced:
+            # 올리는 사이 로그가 바뀜 → 다음 실행에서 다시 옮긴다
+            if previous is None or previous.object_key != archived.object_key:
+                await storage.delete(keys)
+            return False
+
+        if previous is not None and previous.object_key != archived.object_key:
+            await storage.delete(archived_object_keys(previous))
+        self.moved_bytes += sum(archived_log_size(archived, t) for t in LOG_TYPES)
+        self.stored_bytes += archived.object_size
+        return True
+
+    async def _spool_log(self, spool: BinaryIO, chunks: list[list[int]], pieces: AsyncIterator[tuple[int, bytes]]) -> None:
+        # CHUNK_SIZE 씩 모아 따로 압축해 임시 파일에 이어 쓴다
+        buffer = bytearray()
+        async for _, data in pieces:
+            buffer.extend(data)
+            while len(buffer) >= CHUNK_SIZE:
+                raw = bytes(buffer[:CHUNK_SIZE])
+                del buffer[:CHUNK_SIZE]
+                await self._write_chunk(spool, chunks, len(raw), await asyncio.to_thread(compress, raw, self.codec))
+        if buffer:
+            raw = bytes(buffer)
+            await self._write_chunk(spool, chunks, len(raw), await asyncio.to_thread(compress, raw, self.codec))
+
+    @staticmethod
+    async def _write_chunk(spool: BinaryIO, chunks: list[list[int]], raw_size: int, data: bytes) -> None:
+        await asyncio.to_thread(spool.write, data)
+        chunks.append([raw_size, len(data)])
+
+    async def _expire_all(self, storage: ObjectStorage | None) -> None:
+        before = datetime.now() - timedelta(days=self.retention_days)
+        while True:
+            async with AsyncSessionLocal() as db:
+                deleted = await delete_expired_logs(db, before, self.batch_size)
+                await db.commit()
+            self.expired_logs += deleted
+            if deleted < self.batch_size:
+                break
+
+        # object storage 설정이 없으면 객체를 지울 수 없으므로 archived_logs 행도 남겨둔다
+        if storage is None:
+            return
+        while True:
+            async with AsyncSessionLocal() as db:
+                expired = await lock_expired_archived_logs(db, before, self.batch_size)
+                if not expired:
+                    return
+                # 객체 삭제가 실패하면 rollback → 다음 실행에서 다시 시도
+                await storage.delete([key for a in expired for key in archived_object_keys(a)])
+                await delete_archived_logs(db, [a.deploy_id for a in expired])
+                await db.commit()
+            self.expired_archived += len(expired)
+            if len(expired) < self.batch_size:
+                return
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "storage": type(get_object_storage()).__name__ if get_object_storage() else None,
+            "age_days": self.age_days,
+            "retention_days": self.retention_days,
+            "runs": self.runs,
+            "moved": self.moved,
+            "moved_bytes": self.moved_bytes,
+            "stored_bytes": self.stored_bytes,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "expired_archived": self.expired_archived,
+            "expired_logs": self.expired_logs,
+            "last_run_at": self.last_run_at,
+            "last_run_sec": self.last_run_sec,
+        }
+
+
+# 프로세스 전역 로그 보관 작업 (API lifespan 또는 worker.py에서 시작/종료)
+log_tiering = LogTiering()
@@ -0,0 +1,44 @@
+from core.config import env_float, env_int
+from core.series_store import SeriesStore
+from core.ttl_cache import TTLCache
+
+
+# Prometheus / Kubecost 응답 캐시 (core.prometheus_client / core.kubecost_client 에서 사용).
+# 같은 namespace를 보는 viewer들이 같은 키로 모이도록 query_range 는 start/end 를 step 단위로,
+# 시각을 지정하지 않은 query_instant 는 PROMETHEUS_INSTANT_CACHE_TTL_SEC 단위로 맞춘다.
+# 동시에 들어온 같은 조회는 upstream 호출 하나를 같이 기다린다 (TTLCache single-flight / SeriesStore 키별 lock).
+# 값(응답 JSON)은 여러 요청이 공유하므로 호출한 쪽에서 수정하지 않는다.
+# query_range 는 (query, step) 별로 점을 쌓아두고 새 tail / 빠진 구간만 다시 묻는다 (core.series_store).
+#   - PROMETHEUS_RANGE_CACHE_TTL_SEC   : 아직 확정되지 않은 query_range tail을 다시 받는 주기(초) (default 30)
+#   - PROMETHEUS_SERIES_SETTLE_SEC     : 이보다 오래된 점은 확정 값으로 보고 다시 받지 않음 (default 120)
+#   - PROMETHEUS_SERIES_MAX_AGE_SEC    : 이보다 오래된 점은 버림 (default 90000, 조회 가능한 24시간 + 여유)
+#   - PROMETHEUS_SERIES_IDLE_SEC       : 이 시간 동안 조회가 없던 query는 버림 (default 1800)
+#   - PROMETHEUS_SERIES_MAX_POINTS     : 쌓아둘 전체 점 수, 넘으면 오래 안 쓰인 query부터 버림 (default 200000)
+#   - PROMETHEUS_INSTANT_CACHE_TTL_SEC : query_instant 캐시 TTL(초) (default 15)
+#   - KUBECOST_CACHE_TTL_SEC           : allocation 캐시 TTL(초) (default 300, Kubecost 집계 주기 수준)
+#   - METRICS_CACHE_MAX_ITEMS          : 캐시별 최대 항목 수 (default 2000)
+
+_MAX_ITEMS = env_int("METRICS_CACHE_MAX_ITEMS", 2000)
+
+# (base_url, promql, step) → 쌓아둔 시리즈
+prometheus_series_store = SeriesStore(
+    "prometheus_series",
+    settle=env_float("PROMETHEUS_SERIES_SETTLE_SEC", 120.0),
+    tail_ttl=env_float("PROMETHEUS_RANGE_CACHE_TTL_SEC", 30.0),
+    max_age=env_float("PROMETHEUS_SERIES_MAX_AGE_SEC", 90000.0),
+    idle=env_float("PROMETHEUS_SERIES_IDLE_SEC", 1800.0),
+    max_points=env_int("PROMETHEUS_SERIES_MAX_POINTS", 200000),
+)
+# (base_url, promql, ts) → result
+prometheus_instant_cache = TTLCache("prometheus_instant", env_float("PROMETHEUS_INSTANT_CACHE_TTL_SEC", 15.0), _MAX_ITEMS)
+# (base_url, window, aggregation, namespace, accumulate) → 응답 전체
+kubecost_cache = TTLCache("kubecost_allocation", env_float("KUBECOST_CACHE_TTL_SEC", 300.0), _MAX_ITEMS)
+
+
+def align_down(ts: int, unit: float) -> int:
+    unit = int(unit)
+    return ts - ts % unit if unit > 0 else ts
+
+
+def metrics_cache_stats() -> dict:
+    return {cache.name: cache.stats() for cache in (prometheus_series_store, prometheus_instant_cache, kubecost_cache)}
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+
+logger = logging.getLogger("object_storage")
+
+# S3 DeleteObjects 한 번에 지울 수 있는 최대 개수
+S3_DELETE_BATCH = 1000
+
+
+class LocalObjectStorage:
+    """
+    로컬 디렉터리를 object storage처럼 쓰는 구현 (개발 / 테스트용 대체재).
+    key 의 '/' 는 하위 디렉터리가 된다.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if self.root.resolve() not in path.parents:
+            raise ValueError(f"잘못된 object key: {key}")
+        return path
+
+    def _put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 쓰는 도중에 읽혀도 반쯤 쓴 파일이 보이지 않도록 임시 파일 → rename
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _put_file(self, key: str, file: BinaryIO) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as out:
+            shutil.copyfileobj(file, out)
+        os.replace(tmp, path)
+
+    def _get(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _get_range(self, key: str, start: int, end: int) -> bytes | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                f.seek(start)
+                return f.read(end - start)
+        except FileNotFoundError:
+            return None
+
+    def _delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._put, key, data)
+
+    async def put_file(self, key: str, file: BinaryIO) -> None:
+        await asyncio.to_thread(self._put_file, key, file)
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def get_range(self, key: str, start: int, end: int) -> bytes | None:
+        return await asyncio.to_thread(self._get_range, key, start, end)
+
+    async def delete(self, keys: list[str]) -> None:
+        await asyncio.to_thread(self._delete, keys)
+
+
+class S3ObjectStorage:
+    """
+    S3 호환 object storage (AWS S3 / MinIO 등).
+    인증 정보는 boto3 기본 방식(AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY, IAM role 등)을 따른다.
+    boto3 호출은 blocking 이므로 스레드에서 실행한다.
+    """
+
+    def __init__(self, bucket: str, endpoint_url: str | None = None, region: str | None = None) -> None:
+        import boto3
+
+        self.bucket = bucket
+        self._client = boto3.client("s3", endpoint_url=endpoint_url or None, region_name=region or None)
+
+    def _put(self, key: str, data: bytes) -> None:
+        self._client.put_object(Bucket=self.bucket, Key=key, Body=data)
+
+    def _put_file(self, key: str, file: BinaryIO) -> None:
+        # 큰 파일은 multipart 로 나눠 올린다 (파일 전체를 메모리에 올리지 않음)
+        self._client.upload_fileobj(file, self.bucket, key)
+
+    def _get(self, key: str) -> bytes | None:
+        try:
+            return self._client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+        except self._client.exceptions.NoSuchKey:
+            return None
+
+    def _get_range(self, key: str, start: int, end: int) -> bytes | None:
+        try:
+            return self._client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end - 1}")["Body"].read()
+        except self._client.exceptions.NoSuchKey:
+            return None
+
+    def _delete(self, keys: list[str]) -> None:
+        for i in range(0, len(keys), S3_DELETE_BATCH):
+            result = self._client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": k} for k in keys[i:i + S3_DELETE_BATCH]], "Quiet": True},
+            )
+            errors = result.get("Errors") or []
+            if errors:
+                raise RuntimeError(f"object 삭제 실패 {len(errors)}건: {errors[0].get('Key')} {errors[0].get('Message')}")
+
+    async def put(self, key: str, data: bytes) -> None:
+        await asyncio.to_thread(self._put, key, data)
+
+    async def put_file(self, key: str, file: BinaryIO) -> None:
+        await asyncio.to_thread(self._put_file, key, file)
+
+    async def get(self, key: str) -> bytes | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def get_range(self, key: str, start: int, end: int) -> bytes | None:
+        return await asyncio.to_thread(self._get_range, key, start, end)
+
+    async def delete(self, keys: list[str]) -> None:
+        await asyncio.to_thread(self._delete, keys)
+
+
+ObjectStorage = LocalObjectStorage | S3ObjectStorage
+
+_storage: ObjectStorage | None = None
+
+
+def get_object_storage() -> ObjectStorage | None:
+    """
+    LOG_STORAGE_BACKEND 에 따라 로그 보관용 object storage를 만든다 (프로세스당 하나).
+      - none  : 사용 안 함 (default, 로그는 DB에만 남는다)
+      - local : LOG_STORAGE_DIR 디렉터리 (default ./log-storage)
+      - s3    : LOG_STORAGE_BUCKET, LOG_STORAGE_ENDPOINT (MinIO 등, 선택), LOG_STORAGE_REGION (선택)
+    """
+    global _storage
+    if _storage is not None:
+        return _storage
+
+    backend = os.getenv("LOG_STORAGE_BACKEND", "none").strip().lower()
+    if backend == "local":
+        _storage = LocalObjectStorage(os.getenv("LOG_STORAGE_DIR", "./log-storage"))
+    elif backend == "s3":
+        bucket = os.getenv("LOG_STORAGE_BUCKET")
+        if not bucket:
+            raise RuntimeError("LOG_STORAGE_BUCKET 환경변수가 설정되지 않았습니다.")
+        _storage = S3ObjectStorage(bucket, os.getenv("LOG_STORAGE_ENDPOINT"), os.getenv("LOG_STORAGE_REGION"))
+    elif backend not in ("", "none"):
+        logger.warning(f"알 수 없는 LOG_STORAGE_BACKEND: {backend} (object storage 사용 안 함)")
+    return _storage
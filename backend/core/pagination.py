@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException, Query, Response, status
+
+
+# 다음 페이지 cursor를 담는 응답 헤더 (마지막 페이지면 없음)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_date: datetime, row_id: int) -> str:
+    """
+    (created_date, id) keyset을 클라이언트에 넘길 불투명한 문자열로 변환
+    """
+    raw = json.dumps([created_date.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    encode_cursor의 역변환. 형식이 맞지 않으면 ValueError
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_date, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_date), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 cursor 입니다: {cursor}") from e
+
+
+def cursor_param(
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 값 (없으면 첫 페이지)"),
+) -> tuple[datetime, int] | None:
+    """
+    라우터 의존성: cursor 쿼리 파라미터 → (created_date, id)
+    """
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def paginate(rows: list, limit: int, response: Response, key) -> list:
+    """
+    limit + 1 개를 조회한 결과에서 한 페이지를 잘라내고, 다음 페이지가 있으면 cursor 헤더를 단다.
+    key: 행 → (created_date, id)
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*key(rows[-1]))
+    return rows
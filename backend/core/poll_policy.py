@@ -0,0 +1,93 @@
+import os
+import json
+import random
+import logging
+import statistics
+from dataclasses import dataclass, fields, replace
+from typing import Iterable
+
+
+logger = logging.getLogger("poll_policy")
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """
+    Jenkins 큐/빌드 결과 대기용 polling 전략 (단위: 초)
+
+    - 큐 대기: queue_interval 부터 backoff 배수로 queue_max_interval 까지 늘림
+    - 빌드 진행: initial_interval 부터 backoff + jitter 로 max_interval 까지 늘리되,
+      과거 빌드 시간으로 계산한 예상 완료 시각 근처에서는 near_finish_interval 로 좁힘
+    - queue_deadline / build_deadline 을 넘기면 더 기다리지 않고 실패 처리
+    """
+    queue_interval: float = 1.0
+    queue_max_interval: float = 5.0
+    queue_deadline: float = 300.0
+    initial_interval: float = 2.0
+    max_interval: float = 30.0
+    backoff: float = 1.5
+    jitter: float = 0.2
+    near_finish_interval: float = 2.0
+    near_finish_window: float = 0.15   # 예상 시간 대비 비율 (±15% 구간)
+    build_deadline: float = 3600.0
+    history_size: int = 20             # 예상 시간 계산에 쓸 최근 성공 빌드 수
+
+    def _jittered(self, interval: float) -> float:
+        if self.jitter <= 0:
+            return interval
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def queue_wait(self, polls: int) -> float:
+        interval = min(self.queue_max_interval, self.queue_interval * self.backoff ** polls)
+        return self._jittered(interval)
+
+    def build_wait(self, polls: int, elapsed: float, expected: float | None) -> float:
+        interval = min(self.max_interval, self.initial_interval * self.backoff ** polls)
+
+        if expected:
+            window = expected * self.near_finish_window
+            remaining = expected - elapsed
+            if abs(remaining) <= window:
+                # 예상 완료 시각 근처 → 촘촘하게
+                return self._jittered(self.near_finish_interval)
+            if remaining > window:
+                # 예상 완료 구간 시작을 지나치지 않도록 자름
+                interval = min(interval, max(self.near_finish_interval, remaining - window))
+
+        return self._jittered(max(interval, self.near_finish_interval))
+
+
+def expected_duration(durations_ms: Iterable[int]) -> float | None:
+    """
+    최근 성공 빌드들의 duration(ms) 중앙값을 초 단위로 반환
+    """
+    values = [d / 1000 for d in durations_ms if d and d > 0]
+    if not values:
+        return None
+    return statistics.median(values)
+
+
+def load_poll_policy(job_name: str) -> PollPolicy:
+    """
+    잡별 polling 전략 로드.
+      - JENKINS_POLL_POLICY : 잡 이름 → 필드 override JSON
+          예) {"yoitang-autodeploy": {"max_interval": 20, "build_deadline": 1800},
+               "*": {"jitter": 0.1}}
+    "*" 는 모든 잡의 기본값으로 먼저 적용된다.
+    """
+    policy = PollPolicy()
+    raw = os.getenv("JENKINS_POLL_POLICY")
+    if not raw:
+        return policy
+
+    try:
+        config = json.loads(raw)
+    except ValueError as e:
+        logger.warning(f"JENKINS_POLL_POLICY 파싱 실패, 기본값 사용: {e}")
+        return policy
+
+    known = {f.name for f in fields(PollPolicy)}
+    for key in ("*", job_name):
+        overrides = config.get(key) or {}
+        policy = replace(policy, **{k: v for k, v in overrides.items() if k in known})
+    return policy
@@ -4,11 +4,29 @@ from typing import Any, Dict, List
 import httpx
 from fastapi import HTTPException
 
+from core.http_pool import get_client
+from core.metrics_cache import align_down, prometheus_instant_cache, prometheus_series_store
+
+
+def prometheus_http() -> httpx.AsyncClient:
+    return get_client("PROMETHEUS", http2=True, read_timeout=5.0)
+
 
 class PrometheusClient:
+    """
+    요청마다 AsyncClient를 만들지 않고 프로세스 전역 keep-alive 커넥션 풀(core.http_pool, 이름 PROMETHEUS)을 공유한다.
+    풀 한도 / 타임아웃 / HTTP/2 는 PROMETHEUS_* 환경 변수로 설정 (core.http_pool 참고, 응답 타임아웃 default 5초).
+    응답은 core.metrics_cache 에 캐시되고 같은 조회의 동시 요청은 upstream 호출 하나로 합쳐진다.
+    """
+
     def __init__(self) -> None:
         self.base_url = "https://prometheus.yoitang.cloud"
 
+    @property
+    def http(self) -> httpx.AsyncClient:
+        # lifespan 종료 후 다시 만들어진 클라이언트도 쓰도록 매번 풀에서 가져옴
+        return prometheus_http()
+
     async def query_range(
         self,
         promql: str,
@@ -17,23 +35,29 @@ class PrometheusClient:
         step: int,
     ) -> List[Dict[str, Any]]:
         """
-        GET /api/v1/query_range
+        GET /api/v1/query_range (start/end 는 step 단위로 내림)
+        이미 받아둔 점은 다시 묻지 않고 빠진 구간만 받아 합친다 (core.series_store).
         """
-        async with httpx.AsyncClient(verify=True) as client:
-            try:
-                resp = await client.get(
-                    f"{self.base_url}/api/v1/query_range",
-                    params={
-                        "query": promql,
-                        "start": start,
-                        "end": end,
-                        "step": step,
-                    },
-                    timeout=5.0,
-                )
-                resp.raise_for_status()
-            except Exception as e:
-                raise HTTPException(status_code=502, detail=f"Prometheus query_range 실패: {e}")
+        start, end = align_down(start, step), align_down(end, step)
+        return await prometheus_series_store.get_range(
+            (self.base_url, promql, step), start, end, step,
+            lambda a, b: self._query_range(promql, a, b, step),
+        )
+
+    async def _query_range(self, promql: str, start: int, end: int, step: int) -> List[Dict[str, Any]]:
+        try:
+            resp = await self.http.get(
+                f"{self.base_url}/api/v1/query_range",
+                params={
+                    "query": promql,
+                    "start": start,
+                    "end": end,
+                    "step": step,
+                },
+            )
+            resp.raise_for_status()
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Prometheus query_range 실패: {e}")
 
         data = resp.json()
         if data.get("status") != "success":
@@ -43,24 +67,28 @@ class PrometheusClient:
 
     async def query_instant(self, promql: str, ts: int | None = None) -> List[Dict[str, Any]]:
         """
-        GET /api/v1/query
+        GET /api/v1/query (ts 가 없으면 현재 시각을 instant 캐시 TTL 단위로 내림)
         """
         if ts is None:
-            ts = int(time.time())
-
-        async with httpx.AsyncClient(verify=True) as client:
-            try:
-                resp = await client.get(
-                    f"{self.base_url}/api/v1/query",
-                    params={
-                        "query": promql,
-                        "time": ts,
-                    },
-                    timeout=5.0,
-                )
-                resp.raise_for_status()
-            except Exception as e:
-                raise HTTPException(status_code=502, detail=f"Prometheus query 실패: {e}")
+            ts = align_down(int(time.time()), prometheus_instant_cache.ttl)
+
+        return await prometheus_instant_cache.get_or_load(
+            (self.base_url, promql, ts),
+            lambda: self._query_instant(promql, ts),
+        )
+
+    async def _query_instant(self, promql: str, ts: int) -> List[Dict[str, Any]]:
+        try:
+            resp = await self.http.get(
+                f"{self.base_url}/api/v1/query",
+                params={
+                    "query": promql,
+                    "time": ts,
+                },
+            )
+            resp.raise_for_status()
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Prometheus query 실패: {e}")
 
         data = resp.json()
         if data.get("status") != "success":
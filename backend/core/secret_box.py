@@ -0,0 +1,40 @@
+import os
+
+from cryptography.fernet import Fernet, InvalidToken
+
+_fernet: Fernet | None = None
+
+
+def _get_fernet() -> Fernet:
+    """
+    DEPLOY_SECRET_KEY (Fernet 키, `Fernet.generate_key()` 값) 로 만든 암호화 객체 (프로세스당 하나).
+    API 와 워커(worker.py)가 같은 키를 써야 대기열에 넣은 값을 다시 풀 수 있다.
+    """
+    global _fernet
+    if _fernet is not None:
+        return _fernet
+
+    key = os.getenv("DEPLOY_SECRET_KEY")
+    if not key:
+        raise RuntimeError("DEPLOY_SECRET_KEY 환경변수가 설정되지 않았습니다.")
+    try:
+        _fernet = Fernet(key)
+    except ValueError as e:
+        raise RuntimeError(f"DEPLOY_SECRET_KEY 가 올바른 Fernet 키가 아닙니다: {e}")
+    return _fernet
+
+
+def check_secret_key() -> None:
+    # 키가 없거나 잘못됐으면 RuntimeError (요청 처리 전에 미리 확인할 때)
+    _get_fernet()
+
+
+def encrypt_secret(value: str) -> str:
+    return _get_fernet().encrypt(value.encode()).decode()
+
+
+def decrypt_secret(token: str) -> str:
+    try:
+        return _get_fernet().decrypt(token.encode()).decode()
+    except InvalidToken:
+        raise ValueError("암호화된 값을 풀 수 없습니다 (DEPLOY_SECRET_KEY 가 다르거나 값이 손상됨).")
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+RangeLoader = Callable[[int, int], Awaitable[list[dict[str, Any]]]]
+
+
+class _Entry:
+    # (query, step) 하나에 대해 받아둔 시리즈와 받아둔 구간
+    def __init__(self, step: int) -> None:
+        self.step = step
+        self.lock = asyncio.Lock()   # 같은 키의 동시 요청은 하나만 upstream에 묻고 나머지는 그 결과를 씀
+        # metric label → {timestamp: value}
+        self.series: dict[tuple, dict[int, str]] = {}
+        self.metrics: dict[tuple, dict] = {}
+        # [lo, hi] 구간은 빠짐없이 받아둔 확정 값, (hi, tail_end] 는 아직 바뀔 수 있는 값
+        self.lo = 0
+        self.hi = -step
+        self.tail_end = -step
+        self.tail_fetched_at = 0.0
+        self.points = 0
+        self.used_at = time.monotonic()
+
+    @property
+    def empty(self) -> bool:
+        return self.hi < self.lo and self.tail_end < self.lo
+
+    def reset(self, lo: int) -> None:
+        self.series.clear()
+        self.metrics.clear()
+        self.lo, self.hi, self.tail_end = lo, lo - self.step, lo - self.step
+        self.points = 0
+
+    def merge(self, start: int, end: int, result: list[dict[str, Any]]) -> None:
+        # [start, end] 를 새로 받은 값으로 교체 (그 사이 사라진 시리즈 / 점도 반영)
+        for points in self.series.values():
+            for ts in [ts for ts in points if start <= ts <= end]:
+                del points[ts]
+        for s in result:
+            metric = s.get("metric") or {}
+            label = tuple(sorted(metric.items()))
+            self.metrics[label] = metric
+            points = self.series.setdefault(label, {})
+            for ts, value in s.get("values", []):
+                points[int(ts)] = value
+        self._drop_empty()
+
+    def prune(self, before: int) -> None:
+        if before <= self.lo:
+            return
+        for points in self.series.values():
+            for ts in [ts for ts in points if ts < before]:
+                del points[ts]
+        self._drop_empty()
+        self.lo = before
+        self.hi = max(self.hi, before - self.step)
+        self.tail_end = max(self.tail_end, before - self.step)
+
+    def _drop_empty(self) -> None:
+        for label in [label for label, points in self.series.items() if not points]:
+            del self.series[label]
+            del self.metrics[label]
+        self.points = sum(len(points) for points in self.series.values())
+
+    def result(self, start: int, end: int) -> list[dict[str, Any]]:
+        # query_range 응답과 같은 모양 ([{metric, values: [[ts, value], ...]}])
+        out = []
+        for label, points in self.series.items():
+            values = [[ts, points[ts]] for ts in sorted(points) if start <= ts <= end]
+            if values:
+                out.append({"metric": self.metrics[label], "values": values})
+        return out
+
+
+class SeriesStore:
+    """
+    Prometheus query_range 결과를 (query, step) 별로 쌓아두고, 새로 필요한 구간만 upstream에 묻는 store.
+    start/end 는 step 단위로 맞춰져 있다고 가정한다 (같은 step이면 점의 timestamp가 항상 같음).
+
+      - settle 초보다 오래된 점은 확정 값으로 보고 다시 받지 않는다
+      - 그보다 최근 점(tail)은 tail_ttl 초가 지나면 다시 받아 덮어쓴다
+      - 요청 구간이 받아둔 구간 앞/뒤로 벗어난 부분(gap)만 받아 합친다.
+        받아둔 구간과 이어지지 않는 요청이면 기존 값을 버리고 요청 구간을 새로 받는다
+      - max_age 초보다 오래된 점, idle 초 동안 안 쓰인 키는 버리고
+        전체 점 수가 max_points 를 넘으면 가장 오래 안 쓰인 키부터 버린다
+    """
+
+    def __init__(self, name: str, settle: float, tail_ttl: float, max_age: float, idle: float, max_points: int) -> None:
+        self.name = name
+        self.settle = settle
+        self.tail_ttl = tail_ttl
+        self.max_age = max_age
+        self.idle = idle
+        self.max_points = max_points
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+        self.requests = 0
+        self.hits = 0
+        self.fetches = 0
+        self.fetched_points = 0
+        self.served_points = 0
+        self.resets = 0
+        self.evictions = 0
+
+    async def get_range(self, key: Hashable, start: int, end: int, step: int, loader: RangeLoader) -> list[dict[str, Any]]:
+        """
+        key 의 [start, end] 구간 시리즈. 모자란 구간만 loader(start, end) 로 받아 합친다.
+        """
+        self.requests += 1
+        self._evict_idle()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _Entry(step)
+        self._entries.move_to_end(key)
+        entry.used_at = time.monotonic()
+
+        async with entry.lock:
+            now = int(time.time())
+            entry.prune(min(start, now - int(self.max_age)) // step * step)
+            stable = (now - int(self.settle)) // step * step
+
+            ranges = self._missing(entry, start, end)
+            if not ranges:
+                self.hits += 1
+            for a, b in ranges:
+                result = await loader(a, b)
+                self.fetches += 1
+                self.fetched_points += sum(len(s.get("values", [])) for s in result)
+                if entry.empty or not (entry.lo - step <= b and a <= entry.tail_end + step):
+                    # 받아둔 구간과 이어지지 않음 → 요청 구간으로 새로 시작
+                    if not entry.empty:
+                        self.resets += 1
+                    entry.reset(a)
+                entry.merge(a, b, result)
+                entry.lo = min(entry.lo, a)
+                if a <= entry.hi + step:
+                    entry.hi = max(entry.hi, min(b, stable))
+                if b >= entry.tail_end:
+                    entry.tail_end = b
+                    entry.tail_fetched_at = time.monotonic()
+
+            out = entry.result(start, end)
+
+        self.served_points += sum(len(s["values"]) for s in out)
+        self._evict_oversize()
+        return out
+
+    def _missing(self, entry: _Entry, start: int, end: int) -> list[tuple[int, int]]:
+        step = entry.step
+        if entry.empty or start > entry.tail_end + step or end < entry.lo - step:
+            return [(start, end)]
+
+        ranges = []
+        if start < entry.lo:
+            ranges.append((start, entry.lo - step))
+        # 확정되지 않은 tail은 tail_ttl 마다 다시 받는다
+        tail_fresh = time.monotonic() - entry.tail_fetched_at < self.tail_ttl
+        if end > entry.hi and not (tail_fresh and end <= entry.tail_end):
+            ranges.append((entry.hi + step, end))
+        return ranges
+
+    def _evict_idle(self) -> None:
+        idle_before = time.monotonic() - self.idle
+        for key in [key for key, entry in self._entries.items() if entry.used_at < idle_before and not entry.lock.locked()]:
+            del self._entries[key]
+            self.evictions += 1
+
+    def _evict_oversize(self) -> None:
+        total = sum(entry.points for entry in self._entries.values())
+        for key in list(self._entries):
+            if total <= self.max_points:
+                return
+            entry = self._entries[key]
+            if entry.lock.locked():
+                continue
+            total -= entry.points
+            del self._entries[key]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._entries),
+            "points": sum(entry.points for entry in self._entries.values()),
+            "max_points": self.max_points,
+            "settle_sec": self.settle,
+            "tail_ttl_sec": self.tail_ttl,
+            "requests": self.requests,
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "fetched_points": self.fetched_points,
+            "served_points": self.served_points,
+            "resets": self.resets,
+            "evictions": self.evictions,
+        }
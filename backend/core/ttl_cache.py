@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Flight:
+    # 같은 키를 동시에 조회하는 요청들이 같이 기다리는 한 번의 load
+    def __init__(self) -> None:
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.stale = False   # load 도중 invalidate 되면 결과를 캐시에 넣지 않는다 (이미 기다리던 요청에는 그대로 돌려줌)
+
+
+class TTLCache:
+    """
+    프로세스 메모리 read-through 캐시 (TTL + LRU 크기 제한 + single-flight).
+
+      - get_or_load(key, loader): 캐시에 없거나 만료됐으면 loader()로 읽어 저장
+      - 같은 키의 동시 miss는 첫 요청의 loader 결과를 같이 기다린다
+      - invalidate(key): 쓰기 쪽에서 commit 후 호출. 진행 중인 load 결과도 버리고,
+        그 뒤에 온 요청은 진행 중인 load를 같이 기다리지 않고 새로 읽는다
+      - loader가 None을 돌려주면 캐시하지 않는다
+    """
+
+    def __init__(self, name: str, ttl: float, max_items: int) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.max_items = max_items
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._flights: dict[Hashable, _Flight] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.hits += 1
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+            flight = self._flights.get(key)
+            if flight is None:
+                return await self._load(key, loader)
+
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(flight.future)
+            except asyncio.CancelledError:
+                # 먼저 load 하던 요청이 취소됐으면 다시 시도 (내가 취소된 경우는 그대로 전파)
+                if flight.future.cancelled():
+                    continue
+                raise
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        self.misses += 1
+        flight = _Flight()
+        self._flights[key] = flight
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            flight.future.cancel()
+            raise
+        except Exception as e:
+            flight.future.set_exception(e)
+            # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록
+            flight.future.exception()
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+        if value is not None and not flight.stale:
+            self._store(key, value)
+        flight.future.set_result(value)
+        return value
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        for key in keys:
+            self.invalidations += 1
+            self._entries.pop(key, None)
+            flight = self._flights.pop(key, None)
+            if flight is not None:
+                flight.stale = True
+
+    def clear(self) -> None:
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        for flight in self._flights.values():
+            flight.stale = True
+        self._flights.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "max_items": self.max_items,
+            "ttl_sec": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
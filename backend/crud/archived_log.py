@@ -0,0 +1,115 @@
+from datetime import datetime
+from sqlalchemy import delete, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.archived_log import ArchivedLog
+from models.deploy import Deploy, DeployStatus
+from models.deploy_job import DeployJob
+from models.log import Log
+from models.log_chunk import LogChunk
+from models.log_search import LogSearchIndex
+from crud.log import LOG_TYPES
+from crud.deploy_job import ACTIVE_JOB_STATUSES
+
+# 빌드가 끝난 배포의 로그인지 (IN_PROGRESS 가 아니고, 대기 / 진행 중인 deploy_jobs 작업도 없음)
+# redeploy 는 빌드 중인 최근 배포도 ARCHIVED 로 바꾸므로 배포 상태만으로는 알 수 없다
+def _build_settled():
+    active_job = select(DeployJob.job_id).where(
+        DeployJob.deploy_id == Log.deploy_id,
+        DeployJob.status.in_(ACTIVE_JOB_STATUSES),
+    ).exists()
+    return or_(Deploy.status.is_(None), Deploy.status != DeployStatus.IN_PROGRESS) & ~active_job
+
+# object storage로 옮길 로그의 deploy_id 목록 (log_id 순, after_log_id 이후부터)
+# ARCHIVED 배포이거나 older_than 보다 오래된 로그. 아직 빌드 중인 배포는 제외
+async def get_tiering_candidates(db: AsyncSession, older_than: datetime, limit: int, after_log_id: int = 0) -> list[tuple[int, int]]:
+    return (await db.execute(select(Log.log_id, Log.deploy_id).outerjoin(
+        Deploy, Deploy.deploy_id == Log.deploy_id
+    ).where(
+        Log.log_id > after_log_id,
+        or_(Deploy.status == DeployStatus.ARCHIVED, Log.created_date < older_than),
+        _build_settled(),
+    ).order_by(Log.log_id).limit(limit))).all()
+
+# 옮기는 동안 로그가 바뀌었는지 확인하는 값 (logs 행 수정 시각 + 조각 수 / 마지막 조각)
+async def get_log_fingerprint(db: AsyncSession, deploy_id: int) -> tuple | None:
+    row = (await db.execute(select(
+        Log.log_id,
+        Log.updated_date,
+        select(func.count(LogChunk.chunk_id)).where(LogChunk.deploy_id == deploy_id).scalar_subquery(),
+        select(func.max(LogChunk.chunk_id)).where(LogChunk.deploy_id == deploy_id).scalar_subquery(),
+    ).where(Log.deploy_id == deploy_id).limit(1))).first()
+    return None if row is None else tuple(row)
+
+async def get_archived_log(db: AsyncSession, deploy_id: int) -> ArchivedLog | None:
+    return await db.scalar(select(ArchivedLog).where(ArchivedLog.deploy_id == deploy_id))
+
+# deploy_ids 중 object storage로 옮긴 로그가 있는 배포
+async def get_archived_deploy_ids(db: AsyncSession, deploy_ids: list[int]) -> set[int]:
+    if not deploy_ids:
+        return set()
+    return set((await db.scalars(select(ArchivedLog.deploy_id).where(ArchivedLog.deploy_id.in_(deploy_ids)))).all())
+
+async def _delete_hot_rows(db: AsyncSession, deploy_ids: list[int]) -> None:
+    # 조각 / 검색 색인까지 같이 지운다 (object storage로 옮긴 로그는 전문 검색 대상에서 빠짐)
+    await db.execute(delete(LogChunk).where(LogChunk.deploy_id.in_(deploy_ids)))
+    await db.execute(delete(LogSearchIndex).where(LogSearchIndex.deploy_id.in_(deploy_ids)))
+    await db.execute(delete(Log).where(Log.deploy_id.in_(deploy_ids)))
+
+# logs / log_chunks 행을 지우고 archived_logs 행으로 바꿈 → 읽은 뒤 로그가 바뀌었으면 False (commit은 호출한 쪽에서)
+async def replace_log_with_archive(db: AsyncSession, fingerprint: tuple, archived: ArchivedLog) -> bool:
+    # append_log_chunk 와 같은 logs 행 잠금으로 이어붙이기와 직렬화
+    locked = await db.scalar(select(Log.log_id).where(Log.deploy_id == archived.deploy_id).limit(1).with_for_update(skip_locked=True))
+    if locked is None or await get_log_fingerprint(db, archived.deploy_id) != fingerprint:
+        return False
+
+    await _delete_hot_rows(db, [archived.deploy_id])
+    await db.merge(archived)
+    return True
+
+# 보존 기간이 지난 archived_logs 행 (다른 작업과 겹치지 않도록 잠금, 잠긴 행은 건너뜀)
+async def lock_expired_archived_logs(db: AsyncSession, before: datetime, limit: int) -> list[ArchivedLog]:
+    return (await db.scalars(select(ArchivedLog).where(
+        ArchivedLog.log_created_date < before,
+    ).order_by(ArchivedLog.log_created_date).limit(limit).with_for_update(skip_locked=True))).all()
+
+async def delete_archived_logs(db: AsyncSession, deploy_ids: list[int]) -> None:
+    await db.execute(delete(ArchivedLog).where(ArchivedLog.deploy_id.in_(deploy_ids)))
+
+# 보존 기간이 지난 (옮기지 못한) logs 행 삭제 → 지운 수 (commit은 호출한 쪽에서)
+async def delete_expired_logs(db: AsyncSession, before: datetime, limit: int) -> int:
+    deploy_ids = (await db.scalars(select(Log.deploy_id).outerjoin(
+        Deploy, Deploy.deploy_id == Log.deploy_id
+    ).where(
+        Log.created_date < before,
+        _build_settled(),
+    ).order_by(Log.log_id).limit(limit).with_for_update(of=Log, skip_locked=True))).all()
+    if deploy_ids:
+        await _delete_hot_rows(db, list(deploy_ids))
+    return len(deploy_ids)
+
+# 옮긴 로그의 로그 종류별 객체 key
+def archived_object_key(archived: ArchivedLog, log_type: str) -> str:
+    return f"{archived.object_key}{log_type}.log"
+
+# 옮긴 로그의 객체 key 목록 (내용이 있는 로그 종류만 객체가 있음)
+def archived_object_keys(archived: ArchivedLog) -> list[str]:
+    return [archived_object_key(archived, t) for t in LOG_TYPES if archived.chunks.get(t)]
+
+# archived_logs 행으로 /log/{deploy_id}/meta 응답 (object storage는 읽지 않음)
+def archived_log_meta(archived: ArchivedLog) -> dict:
+    return {
+        "log_id": archived.log_id,
+        "deploy_id": archived.deploy_id,
+        "logs": {
+            t: {
+                "size": getattr(archived, f"{t}_size"),
+                "chunks": len(archived.chunks.get(t, [])),
+                "stored_size": sum(stored for _, stored in archived.chunks.get(t, [])),
+            }
+            for t in LOG_TYPES
+        },
+        "created_date": archived.log_created_date,
+        "updated_date": archived.log_updated_date,
+        "archived_date": archived.archived_date,
+        "object_size": archived.object_size,
+    }
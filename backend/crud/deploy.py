@@ -1,39 +1,103 @@
-from sqlalchemy.orm import Session
-from datetime import date
+import json
+from sqlalchemy import insert, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
 from models.deploy import Deploy, DeployStatus
-from models.service import Service
-from schemas.deploy import DeployCreate
+from schemas.deploy import DeployCreate, DeployResponse
+from crud.user_summary import tracking_deploys
+from core.entity_cache import deploy_cache, invalidate_deploys, latest_deploy_cache
 
-def create_deploy(db: Session, deploy_data: DeployCreate) -> Deploy:
+# 배포 상태 변경 NOTIFY 채널 (core.deploy_events 가 LISTEN)
+DEPLOY_EVENTS_CHANNEL = "deploy_status"
+
+# 상태 변경 이벤트 발행: (deploy_id, service_id, status, previous_status)
+# 트랜잭션 안에서 호출하면 commit 될 때 한 번에 전달되고 rollback 되면 버려진다
+async def notify_deploy_status(db: AsyncSession, owners: dict[int, int], changes: list[tuple[int, int, DeployStatus, DeployStatus | None]]) -> None:
+    payloads = [
+        json.dumps({
+            "deploy_id": deploy_id,
+            "service_id": service_id,
+            "user_id": owners.get(service_id),
+            "status": status.value,
+            "previous_status": previous.value if previous else None,
+        })
+        for deploy_id, service_id, status, previous in changes
+        if status != previous
+    ]
+    if payloads:
+        await db.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": DEPLOY_EVENTS_CHANNEL, "payloads": payloads},
+        )
+
+async def create_deploy(db: AsyncSession, deploy_data: DeployCreate) -> Deploy:
     new_deploy = Deploy(**deploy_data.model_dump())
-    db.add(new_deploy)
-    db.commit()
-    db.refresh(new_deploy)
+    async with tracking_deploys(db, [new_deploy.service_id], created=True) as owners:
+        db.add(new_deploy)
+        await db.flush()
+        await notify_deploy_status(db, owners, [(new_deploy.deploy_id, new_deploy.service_id, new_deploy.status, None)])
+    await db.commit()
+    await db.refresh(new_deploy)
+    invalidate_deploys(service_ids=[new_deploy.service_id])
     return new_deploy
 
-def get_deploy(db: Session, deploy_id: int) -> Deploy:
-    return db.query(Deploy).filter(Deploy.deploy_id == deploy_id).first()
+# 여러 배포를 한 트랜잭션에서 multi-row INSERT ... RETURNING 으로 생성 → 요청 순서대로 deploy_id 반환
+async def create_deploys(db: AsyncSession, deploys: list[DeployCreate]) -> list[int]:
+    if not deploys:
+        return []
+    # ORM insert는 None 컬럼 조합별로 문장을 나누므로 테이블 기준 insert 사용
+    stmt = insert(Deploy.__table__).returning(Deploy.__table__.c.deploy_id, sort_by_parameter_order=True)
+    async with tracking_deploys(db, [d.service_id for d in deploys], created=True) as owners:
+        deploy_ids = (await db.scalars(stmt, [d.model_dump() for d in deploys])).all()
+        await notify_deploy_status(db, owners, [
+            (deploy_id, d.service_id, d.status, None) for deploy_id, d in zip(deploy_ids, deploys)
+        ])
+    await db.commit()
+    invalidate_deploys(service_ids={d.service_id for d in deploys})
+    return list(deploy_ids)
+
+async def get_deploy(db: AsyncSession, deploy_id: int) -> Deploy:
+    return await db.scalar(select(Deploy).where(Deploy.deploy_id == deploy_id))
+
+async def get_latest_deploy_by_service(db: AsyncSession, service_id: int) -> Deploy:
+    return await db.scalar(
+        select(Deploy).where(Deploy.service_id == service_id).order_by(Deploy.created_date.desc(), Deploy.deploy_id.desc()).limit(1)
+    )
 
-def get_latest_deploy_by_service(db: Session, service_id: int) -> Deploy:
-    return db.query(Deploy).filter(Deploy.service_id == service_id).order_by(Deploy.created_date.desc()).first()
+# 조회 전용 (캐시된 응답 스키마, 수정하려면 get_deploy / get_latest_deploy_by_service 사용)
+async def get_deploy_cached(db: AsyncSession, deploy_id: int) -> DeployResponse | None:
+    async def load():
+        deploy = await get_deploy(db, deploy_id)
+        return DeployResponse.model_validate(deploy, from_attributes=True) if deploy else None
+    return await deploy_cache.get_or_load(deploy_id, load)
 
-def get_deploys_by_service(db: Session, service_id: int, limit: int = 4):
-    return db.query(Deploy).filter(Deploy.service_id == service_id).order_by(Deploy.created_date.desc()).limit(limit).all()
+async def get_latest_deploy_by_service_cached(db: AsyncSession, service_id: int) -> DeployResponse | None:
+    async def load():
+        deploy = await get_latest_deploy_by_service(db, service_id)
+        return DeployResponse.model_validate(deploy, from_attributes=True) if deploy else None
+    return await latest_deploy_cache.get_or_load(service_id, load)
 
-def get_today_user_deploys_count(db: Session, user_id: int) -> int:
-    today = date.today()
-    return db.query(Deploy).join(Service, Deploy.service_id == Service.service_id).filter(
-        Service.user_id == user_id,
-        Deploy.created_date >= today
-    ).count()
+# 최근 배포 순, (created_date, deploy_id) keyset 페이지네이션 (after: 이전 페이지 마지막 행의 키)
+async def get_deploys_by_service(db: AsyncSession, service_id: int, limit: int = 4, after: tuple[datetime, int] | None = None):
+    query = select(Deploy).where(Deploy.service_id == service_id)
+    if after is not None:
+        query = query.where(tuple_(Deploy.created_date, Deploy.deploy_id) < tuple_(*after))
+    result = await db.scalars(
+        query.order_by(Deploy.created_date.desc(), Deploy.deploy_id.desc()).limit(limit)
+    )
+    return result.all()
 
-def update_deploy_status(db: Session, deploy_id: int, status: str) -> Deploy:
-    deploy = db.query(Deploy).filter(Deploy.deploy_id == deploy_id).first()
+async def update_deploy_status(db: AsyncSession, deploy_id: int, status: str) -> Deploy:
+    deploy = await get_deploy(db, deploy_id)
     if deploy:
         try:
-            deploy.status = DeployStatus(status)
+            new_status = DeployStatus(status)
         except ValueError:
             raise ValueError(f"Invalid status value: {status}")
-        db.commit()
-        db.refresh(deploy)
-    return deploy
\ No newline at end of file
+        async with tracking_deploys(db, [deploy.service_id]) as owners:
+            await notify_deploy_status(db, owners, [(deploy.deploy_id, deploy.service_id, new_status, deploy.status)])
+            deploy.status = new_status
+        await db.commit()
+        await db.refresh(deploy)
+        invalidate_deploys([deploy.deploy_id], [deploy.service_id])
+    return deploy
@@ -0,0 +1,244 @@
+from datetime import timedelta
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.deploy import Deploy, DeployStatus
+from models.deploy_job import DeployJob, DeployJobStatus, DeployLane
+from schemas.deploy import DeployRequest
+from crud.deploy import notify_deploy_status
+from crud.user_summary import tracking_deploys
+from core.entity_cache import invalidate_deploys
+from core.secret_box import decrypt_secret, encrypt_secret
+
+ACTIVE_JOB_STATUSES = (DeployJobStatus.QUEUED, DeployJobStatus.CLAIMED, DeployJobStatus.TRIGGERED)
+
+# 고아 배포 복구용 advisory lock 키
+ORPHAN_RECOVERY_LOCK_ID = 7_310_001
+
+# 진행 중인 작업 없이 IN_PROGRESS로 남은 배포의 마지막 작업 상태 → 배포 상태 (작업 기록이 없으면 FAILED)
+_ORPHAN_DEPLOY_STATUS = {
+    DeployJobStatus.DONE: DeployStatus.SUCCESS,
+    DeployJobStatus.FAILED: DeployStatus.FAILED,
+    DeployJobStatus.CANCELLED: DeployStatus.ARCHIVED,
+}
+
+def _coalesce_key(service_id: int, branch: str) -> str:
+    return f"{service_id}:{branch}"
+
+# DeployRequest → payload (git_pat 은 암호화해서 보관)
+def dump_deploy_payload(req: DeployRequest) -> str:
+    if req.git_pat:
+        req = req.model_copy(update={"git_pat": encrypt_secret(req.git_pat)})
+    return req.model_dump_json()
+
+def load_deploy_payload(payload: str) -> DeployRequest:
+    req = DeployRequest.model_validate_json(payload)
+    if req.git_pat:
+        req = req.model_copy(update={"git_pat": decrypt_secret(req.git_pat)})
+    return req
+
+# 배포 작업 등록 (같은 서비스/브랜치의 대기 중인 재배포는 새 요청으로 대체)
+async def enqueue_deploy_job(db: AsyncSession, deploy_id: int, service_id: int, req: DeployRequest, lane: DeployLane) -> DeployJob:
+    coalesce_key = _coalesce_key(service_id, req.branch) if lane == DeployLane.REDEPLOY else None
+    created_date = None
+    replaced = []
+
+    if coalesce_key:
+        # 워커가 claim 중인 행은 잠금이 풀린 뒤 status 조건으로 다시 걸러진다
+        replaced = (await db.scalars(select(DeployJob).where(
+            DeployJob.coalesce_key == coalesce_key,
+            DeployJob.status == DeployJobStatus.QUEUED,
+        ).with_for_update())).all()
+        for job in replaced:
+            job.status = DeployJobStatus.CANCELLED
+            job.payload = None
+            # 대기열 순서는 기존 요청 자리를 유지
+            created_date = min(created_date or job.created_date, job.created_date)
+            async with tracking_deploys(db, [job.service_id]) as owners:
+                previous = await db.scalar(select(Deploy.status).where(Deploy.deploy_id == job.deploy_id))
+                await db.execute(
+                    update(Deploy).where(Deploy.deploy_id == job.deploy_id).values(status=DeployStatus.ARCHIVED)
+                )
+                await notify_deploy_status(db, owners, [(job.deploy_id, job.service_id, DeployStatus.ARCHIVED, previous)])
+
+    new_job = DeployJob(
+        deploy_id=deploy_id,
+        service_id=service_id,
+        lane=lane.value,
+        coalesce_key=coalesce_key,
+        payload=dump_deploy_payload(req),
+        status=DeployJobStatus.QUEUED,
+    )
+    if created_date is not None:
+        new_job.created_date = created_date
+    db.add(new_job)
+    await db.commit()
+    await db.refresh(new_job)
+    if replaced:
+        invalidate_deploys([job.deploy_id for job in replaced], [service_id])
+    return new_job
+
+# 대기 중인 작업을 우선순위 순으로 가져감 (여러 워커가 동시에 호출해도 겹치지 않음)
+async def claim_deploy_jobs(db: AsyncSession, worker_id: str, limit: int, lane_max_wait: float) -> list[DeployJob]:
+    lanes = list(DeployLane)
+    lane_rank = case(
+        *[(DeployJob.lane == lane.value, i) for i, lane in enumerate(lanes)],
+        else_=len(lanes),
+    )
+    # 너무 오래 기다린 작업은 lane과 상관없이 먼저
+    starving = DeployJob.created_date <= func.now() - timedelta(seconds=lane_max_wait)
+    priority = case((starving, -1), else_=lane_rank)
+
+    jobs = (await db.scalars(select(DeployJob).where(
+        DeployJob.status == DeployJobStatus.QUEUED
+    ).order_by(priority, DeployJob.created_date, DeployJob.job_id).limit(limit).with_for_update(skip_locked=True))).all()
+
+    for job in jobs:
+        job.status = DeployJobStatus.CLAIMED
+        job.locked_by = worker_id
+        job.locked_at = func.now()
+        job.claimed_date = func.now()
+        job.attempts += 1
+    await db.commit()
+    for job in jobs:
+        await db.refresh(job)
+    return jobs
+
+async def mark_deploy_job_triggered(db: AsyncSession, job_id: int, queue_id: int) -> None:
+    # 트리거 직후 build_watcher가 먼저 완료 처리했다면 그대로 둔다
+    await db.execute(update(DeployJob).where(
+        DeployJob.job_id == job_id,
+        DeployJob.status == DeployJobStatus.CLAIMED,
+    ).values({
+        DeployJob.status: DeployJobStatus.TRIGGERED,
+        DeployJob.queue_id: queue_id,
+        DeployJob.payload: None,   # PAT 등 민감 정보는 트리거 후 보관하지 않음
+        DeployJob.locked_at: func.now(),
+    }))
+    await db.commit()
+
+# 빌드 결과가 나온 배포의 작업 종료 처리
+async def finish_deploy_job(db: AsyncSession, deploy_id: int, succeeded: bool, build_number: int | None = None) -> None:
+    values = {
+        DeployJob.status: DeployJobStatus.DONE if succeeded else DeployJobStatus.FAILED,
+        DeployJob.payload: None,
+        DeployJob.locked_by: None,
+        DeployJob.locked_at: None,
+    }
+    if build_number is not None:
+        values[DeployJob.build_number] = build_number
+    await db.execute(update(DeployJob).where(
+        DeployJob.deploy_id == deploy_id,
+        DeployJob.status.in_(ACTIVE_JOB_STATUSES),
+    ).values(values))
+    await db.commit()
+
+# 워커가 살아있음을 표시 (lease 갱신)
+async def heartbeat_deploy_jobs(db: AsyncSession, worker_id: str) -> None:
+    await db.execute(update(DeployJob).where(
+        DeployJob.locked_by == worker_id,
+        DeployJob.status.in_((DeployJobStatus.CLAIMED, DeployJobStatus.TRIGGERED)),
+    ).values({DeployJob.locked_at: func.now()}))
+    await db.commit()
+
+# 트리거 도중 죽은 워커의 작업을 다시 대기열로
+async def requeue_stale_deploy_jobs(db: AsyncSession, lease_sec: float) -> int:
+    result = await db.execute(update(DeployJob).where(
+        DeployJob.status == DeployJobStatus.CLAIMED,
+        DeployJob.locked_at < func.now() - timedelta(seconds=lease_sec),
+    ).values({
+        DeployJob.status: DeployJobStatus.QUEUED,
+        DeployJob.locked_by: None,
+        DeployJob.locked_at: None,
+    }))
+    await db.commit()
+    return result.rowcount
+
+# 빌드 추적 중 죽은 워커의 작업을 이 워커가 이어받음
+async def adopt_stale_deploy_jobs(db: AsyncSession, worker_id: str, lease_sec: float) -> list[DeployJob]:
+    jobs = (await db.scalars(select(DeployJob).where(
+        DeployJob.status == DeployJobStatus.TRIGGERED,
+        (DeployJob.locked_by.is_(None)) | (DeployJob.locked_at < func.now() - timedelta(seconds=lease_sec)),
+    ).with_for_update(skip_locked=True))).all()
+    for job in jobs:
+        job.locked_by = worker_id
+        job.locked_at = func.now()
+    await db.commit()
+    for job in jobs:
+        await db.refresh(job)
+    return jobs
+
+# 진행 중인 작업 없이 IN_PROGRESS로 남은 배포(프로세스 재시작 등)를 마무리
+async def recover_orphaned_deploys(db: AsyncSession, grace_sec: float) -> int:
+    """
+    빌드 옵션을 추측해서 다시 빌드하지 않는다.
+    스케줄러를 거친 배포는 마지막 작업 결과대로 상태를 맞추고,
+    작업 기록이 없는 배포(POST /deploy/ 로 등록된 배포, 대기열 도입 전 배포 등)는 FAILED 로 닫는다.
+    """
+    # 여러 워커가 동시에 시작해도 같은 배포를 두 번 처리하지 않도록 트랜잭션 단위 advisory lock
+    await db.execute(select(func.pg_advisory_xact_lock(ORPHAN_RECOVERY_LOCK_ID)))
+    active_job = select(DeployJob.job_id).where(
+        DeployJob.deploy_id == Deploy.deploy_id,
+        DeployJob.status.in_(ACTIVE_JOB_STATUSES),
+    ).exists()
+    last_job_status = select(DeployJob.status).where(
+        DeployJob.deploy_id == Deploy.deploy_id
+    ).order_by(DeployJob.job_id.desc()).limit(1).scalar_subquery()
+    orphans = (await db.execute(select(Deploy.deploy_id, Deploy.service_id, last_job_status).where(
+        Deploy.status == DeployStatus.IN_PROGRESS,
+        Deploy.created_date < func.now() - timedelta(seconds=grace_sec),
+        ~active_job,
+    ))).all()
+    if not orphans:
+        await db.commit()
+        return 0
+
+    targets: dict[DeployStatus, list[int]] = {}
+    for deploy_id, _, job_status in orphans:
+        targets.setdefault(_ORPHAN_DEPLOY_STATUS.get(job_status, DeployStatus.FAILED), []).append(deploy_id)
+
+    changes = []
+    async with tracking_deploys(db, [service_id for _, service_id, _ in orphans]) as owners:
+        # 조회 뒤에 build_watcher 등이 먼저 상태를 바꿨다면 건드리지 않는다
+        for status, deploy_ids in targets.items():
+            rows = (await db.execute(update(Deploy).where(
+                Deploy.deploy_id.in_(deploy_ids),
+                Deploy.status == DeployStatus.IN_PROGRESS,
+            ).values(status=status).returning(Deploy.deploy_id, Deploy.service_id))).all()
+            changes += [(deploy_id, service_id, status, DeployStatus.IN_PROGRESS) for deploy_id, service_id in rows]
+        await notify_deploy_status(db, owners, changes)
+    await db.commit()
+    if changes:
+        invalidate_deploys([c[0] for c in changes], [c[1] for c in changes])
+    return len(changes)
+
+# 대기열 깊이 / 대기 시간 통계
+async def get_deploy_job_stats(db: AsyncSession, window_sec: float = 3600) -> dict:
+    lanes = {}
+    oldest_wait = func.extract("epoch", func.localtimestamp() - func.min(DeployJob.created_date))
+    rows = (await db.execute(select(DeployJob.lane, func.count(), oldest_wait).where(
+        DeployJob.status == DeployJobStatus.QUEUED
+    ).group_by(DeployJob.lane))).all()
+    queued = {lane: (count, wait) for lane, count, wait in rows}
+    for lane in DeployLane:
+        count, wait = queued.get(lane.value, (0, None))
+        lanes[lane.value] = {
+            "depth": count,
+            "oldest_wait_sec": float(wait or 0.0),
+        }
+
+    status_counts = dict((await db.execute(select(DeployJob.status, func.count()).group_by(DeployJob.status))).all())
+
+    wait = func.extract("epoch", DeployJob.claimed_date - DeployJob.created_date)
+    avg_wait, max_wait = (await db.execute(select(func.avg(wait), func.max(wait)).where(
+        DeployJob.claimed_date >= func.now() - timedelta(seconds=window_sec)
+    ))).one()
+
+    return {
+        "lanes": lanes,
+        "status": {s.value: status_counts.get(s, 0) for s in DeployJobStatus},
+        "wait_sec": {
+            "window_sec": window_sec,
+            "avg": float(avg_wait or 0.0),
+            "max": float(max_wait or 0.0),
+        },
+    }
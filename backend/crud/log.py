@@ -1,15 +1,240 @@
-from sqlalchemy.orm import Session
+import asyncio
+import itertools
+from typing import AsyncIterator
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.archived_log import ArchivedLog
 from models.log import Log
+from models.log_chunk import LogChunk
 from schemas.log import LogCreate
+from core.log_codec import compress, decompress
+from crud.log_search import COLUMN_SEQ, LINE_CARRY_MAX, delete_log_chunk_index, index_log_rows, index_log_text, trailing_line
+
+# 로그 종류 → logs 테이블 컬럼
+LOG_TYPES = ("build", "deploy", "application")
+
+# 텍스트 컬럼 cursor 이름 (같은 트랜잭션에서 겹치지 않도록 번호를 붙임)
+_column_cursor_ids = itertools.count()
 
 # 로그 생성
-def create_log(db: Session, log_data: LogCreate) -> Log:
+async def create_log(db: AsyncSession, log_data: LogCreate) -> Log:
     new_log = Log(**log_data.model_dump())
     db.add(new_log)
-    db.commit()
-    db.refresh(new_log)
+    for t in LOG_TYPES:
+        await index_log_text(db, new_log.deploy_id, t, COLUMN_SEQ, getattr(new_log, f"{t}_log"))
+    await db.commit()
+    await db.refresh(new_log)
     return new_log
 
+# 여러 로그를 한 트랜잭션에서 multi-row INSERT ... RETURNING 으로 생성 → 요청 순서대로 log_id 반환
+async def create_logs(db: AsyncSession, logs: list[LogCreate]) -> list[int]:
+    if not logs:
+        return []
+    # ORM insert는 None 컬럼 조합별로 문장을 나누므로 테이블 기준 insert 사용
+    stmt = insert(Log.__table__).returning(Log.__table__.c.log_id, sort_by_parameter_order=True)
+    log_ids = list((await db.scalars(stmt, [l.model_dump() for l in logs])).all())
+    await index_log_rows(db, log_ids)
+    await db.commit()
+    return log_ids
+
 # 로그 정보 조회
-def get_log(db: Session, deploy_id: int) -> Log:
-    return db.query(Log).filter(Log.deploy_id == deploy_id).first()
\ No newline at end of file
+async def get_log(db: AsyncSession, deploy_id: int) -> Log:
+    return await db.scalar(select(Log).where(Log.deploy_id == deploy_id).limit(1))
+
+# 배포의 로그 행 조회 (없으면 생성, commit은 호출한 쪽에서)
+# 동시에 불려도 행이 하나만 생기도록 INSERT ... ON CONFLICT DO NOTHING 후 조회 (uq_logs_deploy_id)
+# lock=True 면 트랜잭션이 끝날 때까지 행을 잠근다 (같은 배포의 이어붙이기를 한 줄로 세움)
+async def get_or_create_log(db: AsyncSession, deploy_id: int, lock: bool = False) -> Log:
+    await db.execute(
+        pg_insert(Log.__table__).values(deploy_id=deploy_id).on_conflict_do_nothing(index_elements=["deploy_id"])
+    )
+    stmt = select(Log).where(Log.deploy_id == deploy_id)
+    if lock:
+        stmt = stmt.with_for_update()
+    return await db.scalar(stmt)
+
+# 기존 압축 조각 삭제 (같은 로그를 다시 보관할 때)
+async def delete_log_chunks(db: AsyncSession, deploy_id: int, log_type: str) -> None:
+    await db.execute(delete(LogChunk).where(
+        LogChunk.deploy_id == deploy_id,
+        LogChunk.log_type == log_type,
+    ))
+    await delete_log_chunk_index(db, deploy_id, log_type)
+
+# 조각 seq 바로 앞 부분(앞 조각, seq 0이면 텍스트 컬럼)의 마지막 줄 → 경계에 걸친 줄 색인용
+async def get_log_line_carry(db: AsyncSession, deploy_id: int, log_type: str, seq: int) -> str:
+    if seq > 0:
+        chunk = (await db.execute(select(LogChunk.data, LogChunk.codec).where(
+            LogChunk.deploy_id == deploy_id,
+            LogChunk.log_type == log_type,
+            LogChunk.seq == seq - 1,
+        ))).first()
+        if chunk is None:
+            return ""
+        raw = await asyncio.to_thread(decompress, chunk.data, chunk.codec)
+        return trailing_line(raw[-LINE_CARRY_MAX * 4:].decode("utf-8", errors="replace"))
+
+    column = getattr(Log, f"{log_type}_log")
+    tail = await db.scalar(select(func.right(column, LINE_CARRY_MAX)).where(Log.deploy_id == deploy_id).limit(1))
+    return trailing_line(tail or "")
+
+# 압축 조각 하나 추가 (commit은 호출한 쪽에서)
+# 압축/해제는 event loop를 막지 않도록 thread에서
+# carry: 앞 조각의 마지막 줄 (없으면 DB에서 읽음, get_log_line_carry)
+async def add_log_chunk(
+    db: AsyncSession, deploy_id: int, log_type: str, seq: int, raw: bytes, codec: str, carry: str | None = None,
+) -> LogChunk:
+    if carry is None:
+        carry = await get_log_line_carry(db, deploy_id, log_type, seq)
+    chunk = LogChunk(
+        deploy_id=deploy_id,
+        log_type=log_type,
+        seq=seq,
+        codec=codec,
+        raw_size=len(raw),
+        data=await asyncio.to_thread(compress, raw, codec),
+    )
+    db.add(chunk)
+    await db.flush()
+    await index_log_text(db, deploy_id, log_type, seq, raw.decode("utf-8", errors="replace"), carry)
+    return chunk
+
+# object storage로 옮긴 로그인지 (archived_logs 행이 있는지)
+async def is_log_archived(db: AsyncSession, deploy_id: int) -> bool:
+    return await db.scalar(select(ArchivedLog.deploy_id).where(ArchivedLog.deploy_id == deploy_id)) is not None
+
+# 로그 뒤에 새 조각을 이어붙임 (기존 행/조각은 건드리지 않음) → (seq, 이어붙인 뒤 로그 전체 크기)
+# 이미 object storage로 옮긴 로그면 None (새 logs 행이 생기면 옮긴 본문이 가려지므로 이어붙이지 않음)
+async def append_log_chunk(db: AsyncSession, deploy_id: int, log_type: str, raw: bytes, codec: str) -> tuple[int, int] | None:
+    # 같은 배포에 동시에 이어붙여도 seq가 겹치지 않도록 logs 행을 잠근다 (행이 없던 요청끼리도 같은 행을 잠금)
+    # 옮기는 작업(replace_log_with_archive)도 같은 행을 잠그므로, 잠근 뒤에 옮겼는지 확인한다
+    await get_or_create_log(db, deploy_id, lock=True)
+    if await is_log_archived(db, deploy_id):
+        await db.rollback()
+        return None
+
+    last_seq, chunk_size = (await db.execute(select(
+        func.coalesce(func.max(LogChunk.seq), -1),
+        func.coalesce(func.sum(LogChunk.raw_size), 0),
+    ).where(
+        LogChunk.deploy_id == deploy_id,
+        LogChunk.log_type == log_type,
+    ))).one()
+
+    seq = int(last_seq) + 1
+    await add_log_chunk(db, deploy_id, log_type, seq, raw, codec)
+    size = await get_log_column_size(db, deploy_id, log_type) + int(chunk_size) + len(raw)
+    await db.commit()
+    return seq, size
+
+async def get_log_chunks(db: AsyncSession, deploy_id: int, log_type: str) -> list[LogChunk]:
+    return (await db.scalars(select(LogChunk).where(
+        LogChunk.deploy_id == deploy_id,
+        LogChunk.log_type == log_type,
+    ).order_by(LogChunk.seq))).all()
+
+# 컬럼에 저장된 텍스트 + 압축 보관된 조각을 이어붙인 전체 로그
+async def read_log_text(db: AsyncSession, log: Log, log_type: str) -> str | None:
+    text = getattr(log, f"{log_type}_log")
+    chunks = await get_log_chunks(db, log.deploy_id, log_type)
+    if not chunks:
+        return text
+
+    raw = b"".join([await asyncio.to_thread(decompress, c.data, c.codec) for c in chunks])
+    return (text or "") + raw.decode("utf-8", errors="replace")
+
+# 텍스트 컬럼 없이 로그 메타데이터만 조회 (컬럼/조각별 크기)
+async def get_log_meta(db: AsyncSession, deploy_id: int) -> dict | None:
+    row = (await db.execute(select(
+        Log.log_id,
+        Log.deploy_id,
+        *[func.coalesce(func.octet_length(getattr(Log, f"{t}_log")), 0) for t in LOG_TYPES],
+        Log.created_date,
+        Log.updated_date,
+    ).where(Log.deploy_id == deploy_id).limit(1))).first()
+    if row is None:
+        return None
+
+    log_id, deploy_id, *column_sizes, created_date, updated_date = row
+    chunk_rows = (await db.execute(select(
+        LogChunk.log_type,
+        func.count(),
+        func.coalesce(func.sum(LogChunk.raw_size), 0),
+        func.coalesce(func.sum(func.octet_length(LogChunk.data)), 0),
+    ).where(LogChunk.deploy_id == deploy_id).group_by(LogChunk.log_type))).all()
+    chunks = {log_type: (count, raw, stored) for log_type, count, raw, stored in chunk_rows}
+
+    logs = {}
+    for log_type, column_size in zip(LOG_TYPES, column_sizes):
+        count, raw, stored = chunks.get(log_type, (0, 0, 0))
+        logs[log_type] = {
+            "size": int(column_size) + int(raw),
+            "chunks": count,
+            "stored_size": int(column_size) + int(stored),
+        }
+
+    return {
+        "log_id": log_id,
+        "deploy_id": deploy_id,
+        "logs": logs,
+        "created_date": created_date,
+        "updated_date": updated_date,
+    }
+
+# 텍스트 컬럼의 UTF-8 바이트 크기
+async def get_log_column_size(db: AsyncSession, deploy_id: int, log_type: str) -> int | None:
+    column = getattr(Log, f"{log_type}_log")
+    row = (await db.execute(
+        select(func.coalesce(func.octet_length(column), 0)).where(Log.deploy_id == deploy_id).limit(1)
+    )).first()
+    return None if row is None else int(row[0])
+
+# 텍스트 컬럼의 [start, end) 구간을 window 바이트씩 (시작 offset, bytes) 로 읽음 (reverse=True 면 뒤에서부터)
+# window마다 substring(convert_to(...)) 를 따로 실행하면 매번 컬럼 전체를 풀고 변환하므로(O(n²)),
+# 변환은 한 번만 하는 쿼리를 cursor로 열고 window 하나씩 FETCH 한다.
+# cursor는 트랜잭션 안에서만 살아 있으므로 다 읽을 때까지 세션을 닫지 않아야 한다 (중간에 멈추면 트랜잭션 끝날 때 닫힘)
+async def iter_log_column_bytes(
+    db: AsyncSession, deploy_id: int, log_type: str, start: int, end: int, window: int, reverse: bool = False,
+) -> AsyncIterator[tuple[int, bytes]]:
+    if log_type not in LOG_TYPES:
+        raise ValueError(f"지원하지 않는 로그 종류: {log_type}")
+    # DECLARE 에는 bind parameter를 쓸 수 없으므로 정수만 그대로 넣는다
+    deploy_id, start, end, window = int(deploy_id), int(start), int(end), max(1, int(window))
+    if start >= end:
+        return
+
+    if reverse:
+        windows = (
+            f"SELECT greatest(p, {start}) AS pos, p + {window} - greatest(p, {start}) AS len "
+            f"FROM generate_series({end - window}, {start - window + 1}, {-window}) AS p"
+        )
+    else:
+        windows = f"SELECT p AS pos, least({window}, {end} - p) AS len FROM generate_series({start}, {end - 1}, {window}) AS p"
+
+    cursor = f"log_column_{next(_column_cursor_ids)}"
+    await db.execute(text(f"""
+        DECLARE {cursor} NO SCROLL CURSOR FOR
+        WITH c AS MATERIALIZED (
+            SELECT convert_to({log_type}_log, 'UTF8') AS data FROM logs WHERE deploy_id = {deploy_id} LIMIT 1
+        )
+        SELECT w.pos, substring(c.data FROM w.pos + 1 FOR w.len) FROM c CROSS JOIN ({windows}) AS w
+    """))
+    while True:
+        row = (await db.execute(text(f"FETCH NEXT FROM {cursor}"))).first()
+        if row is None:
+            break
+        yield int(row[0]), bytes(row[1] or b"")
+    await db.execute(text(f"CLOSE {cursor}"))
+
+# 압축 조각 목록 (data 제외)
+async def get_log_chunk_index(db: AsyncSession, deploy_id: int, log_type: str) -> list[tuple[int, int]]:
+    return (await db.execute(select(LogChunk.chunk_id, LogChunk.raw_size).where(
+        LogChunk.deploy_id == deploy_id,
+        LogChunk.log_type == log_type,
+    ).order_by(LogChunk.seq))).all()
+
+# 압축 조각 하나를 풀어서 반환
+async def read_log_chunk_bytes(db: AsyncSession, chunk_id: int) -> bytes:
+    chunk = (await db.execute(select(LogChunk.data, LogChunk.codec).where(LogChunk.chunk_id == chunk_id))).one()
+    return await asyncio.to_thread(decompress, chunk.data, chunk.codec)
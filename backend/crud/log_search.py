@@ -0,0 +1,122 @@
+from datetime import datetime
+from sqlalchemy import Integer, delete, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.deploy import Deploy, DeployStatus
+from models.log import Log
+from models.log_search import LogSearchIndex
+
+# 로그 컬럼 텍스트의 seq (압축 조각은 0부터)
+COLUMN_SEQ = -1
+
+# tsvector 한 행 최대 1MB 제한을 넘지 않도록 나눠서 색인할 글자 수
+INDEX_PIECE_SIZE = 256 * 1024
+# 조각 경계에 걸친 줄도 한 문서에서 찾도록 앞 부분의 마지막 (줄바꿈 없는) 줄을 함께 색인하는 최대 길이
+# (core.log_search 도 같은 기준으로 앞 조각의 마지막 줄을 이어붙여 읽음)
+LINE_CARRY_MAX = 64 * 1024
+
+def _document(text: str):
+    # 'simple' 설정: 형태소 변환 없이 소문자 단어 그대로, 위치 정보는 쓰지 않으므로 제거
+    return func.strip(func.to_tsvector("simple", text.replace("\x00", "")))
+
+def _query(q: str):
+    return func.plainto_tsquery("simple", q)
+
+# 텍스트의 마지막 (줄바꿈으로 끝나지 않은) 줄 (LINE_CARRY_MAX 글자까지)
+def trailing_line(text: str) -> str:
+    tail = text[-LINE_CARRY_MAX:]
+    return tail[tail.rfind("\n") + 1:]
+
+# 로그 텍스트 색인 (commit은 호출한 쪽에서)
+# carry: 이 텍스트 바로 앞 부분의 마지막 줄 (앞 조각에서 이어지는 줄)
+async def index_log_text(db: AsyncSession, deploy_id: int, log_type: str, seq: int, text: str | None, carry: str = "") -> None:
+    if not text:
+        return
+    for i in range(0, len(text), INDEX_PIECE_SIZE):
+        head = carry if i == 0 else trailing_line(text[max(0, i - LINE_CARRY_MAX):i])
+        db.add(LogSearchIndex(
+            deploy_id=deploy_id,
+            log_type=log_type,
+            seq=seq,
+            document=_document(head + text[i:i + INDEX_PIECE_SIZE]),
+        ))
+    await db.flush()
+
+# 이미 들어간 logs 행들의 컬럼 텍스트를 한 번에 색인 (로그 종류당 INSERT ... SELECT 한 번)
+async def index_log_rows(db: AsyncSession, log_ids: list[int]) -> None:
+    if not log_ids:
+        return
+    for log_type in ("build", "deploy", "application"):
+        column = getattr(Log, f"{log_type}_log")
+        # 긴 텍스트는 INDEX_PIECE_SIZE 글자씩 나눠 여러 행으로 (앞 piece의 마지막 줄을 앞에 붙임, index_log_text 와 같은 기준)
+        pieces = select(
+            Log.deploy_id,
+            column.label("text"),
+            func.generate_series(0, (func.length(column, type_=Integer) - 1) // INDEX_PIECE_SIZE).label("n"),
+        ).where(
+            Log.log_id.in_(log_ids),
+            func.length(column) > 0,
+        ).subquery()
+        piece_start = pieces.c.n * INDEX_PIECE_SIZE + 1
+        carry = func.substring(
+            func.substr(pieces.c.text, func.greatest(1, piece_start - LINE_CARRY_MAX), func.least(LINE_CARRY_MAX, piece_start - 1)),
+            literal("[^\n]*$"),
+        )
+        rows = select(
+            pieces.c.deploy_id,
+            literal(log_type),
+            literal(COLUMN_SEQ),
+            func.strip(func.to_tsvector("simple", carry.concat(func.substr(pieces.c.text, piece_start, INDEX_PIECE_SIZE)))),
+        )
+        await db.execute(insert(LogSearchIndex).from_select(["deploy_id", "log_type", "seq", "document"], rows))
+
+# 압축 조각 색인 삭제 (같은 로그를 다시 보관할 때)
+async def delete_log_chunk_index(db: AsyncSession, deploy_id: int, log_type: str) -> None:
+    await db.execute(delete(LogSearchIndex).where(
+        LogSearchIndex.deploy_id == deploy_id,
+        LogSearchIndex.log_type == log_type,
+        LogSearchIndex.seq != COLUMN_SEQ,
+    ))
+
+# 검색어가 들어있는 배포 목록 (최신순)
+async def search_deploys_by_log(
+    db: AsyncSession,
+    q: str,
+    service_id: int | None = None,
+    status: DeployStatus | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    log_type: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> list[Deploy]:
+    matched = select(LogSearchIndex.deploy_id).where(LogSearchIndex.document.op("@@")(_query(q)))
+    if log_type:
+        matched = matched.where(LogSearchIndex.log_type == log_type)
+
+    query = select(Deploy).where(Deploy.deploy_id.in_(matched))
+    if service_id is not None:
+        query = query.where(Deploy.service_id == service_id)
+    if status is not None:
+        query = query.where(Deploy.status == status)
+    if date_from is not None:
+        query = query.where(Deploy.created_date >= date_from)
+    if date_to is not None:
+        query = query.where(Deploy.created_date < date_to)
+
+    query = query.order_by(Deploy.created_date.desc(), Deploy.deploy_id.desc()).offset(offset).limit(limit)
+    return (await db.scalars(query)).all()
+
+# 배포들 중 검색어가 들어있는 로그 조각 위치 → {deploy_id: [(log_type, seq), ...]}
+async def get_matching_log_parts(db: AsyncSession, q: str, deploy_ids: list[int], log_type: str | None = None) -> dict[int, list[tuple[str, int]]]:
+    query = select(LogSearchIndex.deploy_id, LogSearchIndex.log_type, LogSearchIndex.seq).where(
+        LogSearchIndex.deploy_id.in_(deploy_ids),
+        LogSearchIndex.document.op("@@")(_query(q)),
+    )
+    if log_type:
+        query = query.where(LogSearchIndex.log_type == log_type)
+
+    query = query.distinct().order_by(LogSearchIndex.deploy_id, LogSearchIndex.log_type, LogSearchIndex.seq)
+    parts: dict[int, list[tuple[str, int]]] = {}
+    for deploy_id, part_type, seq in await db.execute(query):
+        parts.setdefault(deploy_id, []).append((part_type, seq))
+    return parts
@@ -1,55 +1,34 @@
-from sqlalchemy.orm import Session
-from datetime import date
-from crud.deploy import get_latest_deploy_by_service
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
 from models.service import Service
-from schemas.service import ServiceCreate
+from crud.user_summary import record_service_created
+from core.entity_cache import service_cache
+from schemas.service import ServiceCreate, ServiceResponse
 
-def create_service(db: Session, service_data: ServiceCreate) -> Service:
+async def create_service(db: AsyncSession, service_data: ServiceCreate) -> Service:
     new_service = Service(**service_data.model_dump())
     db.add(new_service)
-    db.commit()
-    db.refresh(new_service)
+    await record_service_created(db, new_service.user_id)
+    await db.commit()
+    await db.refresh(new_service)
+    service_cache.invalidate(new_service.service_id)
     return new_service
 
-def get_service(db: Session, service_id: int) -> Service:
-    return db.query(Service).filter(Service.service_id == service_id).first()
-
-def get_services_by_user(db: Session, user_id: int) -> list[Service]:
-    return db.query(Service).filter(Service.user_id == user_id).all()
-
-def get_services_count_by_user(db: Session, user_id: int) -> int:
-    return db.query(Service).filter(Service.user_id == user_id).count()
-
-def get_success_services_count_by_user(db: Session, user_id: int) -> int:
-    services = get_services_by_user(db, user_id)
-    count = 0
-    for service in services:
-        latest_deploy = get_latest_deploy_by_service(db, service.service_id)
-        if latest_deploy and latest_deploy.status == "SUCCESS":
-            count += 1
-    return count
-
-def get_today_user_services_count(db: Session, user_id: int) -> int:
-    today = date.today()
-    return db.query(Service).filter(
-        Service.user_id == user_id,
-        Service.created_date >= today
-    ).count()
-
-def get_today_user_success_services_count(db: Session, user_id: int) -> int:
-    today = date.today()
-    services = get_services_by_user(db, user_id)
-    count = 0
-    for service in services:
-        latest_deploy = get_latest_deploy_by_service(db, service.service_id)
-        if latest_deploy and latest_deploy.status == "SUCCESS" and latest_deploy.created_date.date() == today:
-            count += 1
-    return count
-
-def get_user_service_success_rate(db: Session, user_id: int) -> int:
-    total_services = get_today_user_services_count(db, user_id)
-    if total_services == 0:
-        return 0
-    
-    success_services = get_today_user_success_services_count(db, user_id)
-    return int((success_services / total_services) * 100)
+async def get_service(db: AsyncSession, service_id: int) -> Service:
+    return await db.scalar(select(Service).where(Service.service_id == service_id))
+
+# 조회 전용 (캐시된 응답 스키마, 수정하려면 get_service 사용)
+async def get_service_cached(db: AsyncSession, service_id: int) -> ServiceResponse | None:
+    async def load():
+        service = await get_service(db, service_id)
+        return ServiceResponse.model_validate(service, from_attributes=True) if service else None
+    return await service_cache.get_or_load(service_id, load)
+
+# 최근 생성 순, (created_date, service_id) keyset 페이지네이션 (after: 이전 페이지 마지막 행의 키)
+async def get_services_by_user(db: AsyncSession, user_id: int, limit: int | None = None, after: tuple[datetime, int] | None = None) -> list[Service]:
+    query = select(Service).where(Service.user_id == user_id)
+    if after is not None:
+        query = query.where(tuple_(Service.created_date, Service.service_id) < tuple_(*after))
+    query = query.order_by(Service.created_date.desc(), Service.service_id.desc()).limit(limit)
+    return (await db.scalars(query)).all()
@@ -0,0 +1,174 @@
+import os
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import Date, and_, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import TIMESTAMP, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.deploy import Deploy, DeployStatus
+from models.service import Service
+from models.user_summary import UserDailySummary, UserSummary
+
+# 대시보드 "오늘" 기준 시간대
+DASHBOARD_TZ = os.getenv("DASHBOARD_TZ", "Asia/Seoul")
+
+_TOTAL_FIELDS = ("services_count", "active_services_count")
+_DAILY_FIELDS = ("services_created", "deploys_created", "active_services")
+
+
+def local_today() -> date:
+    return datetime.now(ZoneInfo(DASHBOARD_TZ)).date()
+
+
+def _local_day(column):
+    # timestamp 컬럼(DB 세션 시간대 기준)을 DASHBOARD_TZ 날짜로 변환
+    return cast(func.timezone(DASHBOARD_TZ, cast(column, TIMESTAMP(timezone=True))), Date)
+
+
+async def _bump(db: AsyncSession, user_id: int, day: date | None = None, **deltas: int) -> None:
+    totals = {k: v for k, v in deltas.items() if k in _TOTAL_FIELDS and v}
+    daily = {k: v for k, v in deltas.items() if k in _DAILY_FIELDS and v}
+
+    if totals:
+        stmt = insert(UserSummary).values(user_id=user_id, **totals)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[UserSummary.user_id],
+            set_={
+                **{k: getattr(UserSummary, k) + v for k, v in totals.items()},
+                "updated_date": func.now(),
+            },
+        ))
+    if daily and day is not None:
+        stmt = insert(UserDailySummary).values(user_id=user_id, day=day, **daily)
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[UserDailySummary.user_id, UserDailySummary.day],
+            set_={k: getattr(UserDailySummary, k) + v for k, v in daily.items()},
+        ))
+
+
+async def record_service_created(db: AsyncSession, user_id: int) -> None:
+    # 서비스 INSERT와 같은 트랜잭션에서 호출
+    await _bump(db, user_id, local_today(), services_count=1, services_created=1)
+
+
+async def _latest_deploys(db: AsyncSession, service_ids) -> dict[int, tuple[DeployStatus, date]]:
+    rows = await db.execute(
+        select(Deploy.service_id, Deploy.status, _local_day(Deploy.created_date)).where(
+            Deploy.service_id.in_(service_ids)
+        ).distinct(Deploy.service_id).order_by(
+            Deploy.service_id, Deploy.created_date.desc(), Deploy.deploy_id.desc()
+        )
+    )
+    return {service_id: (status, day) for service_id, status, day in rows}
+
+
+@asynccontextmanager
+async def tracking_deploys(db: AsyncSession, service_ids: list[int], created: bool = False):
+    """
+    배포 생성/상태 변경을 감싸서 유저 요약을 같은 트랜잭션 안에서 갱신 (commit은 호출 쪽에서).
+
+    서비스 행을 FOR UPDATE로 잠가 같은 서비스의 배포 변경을 직렬화하고,
+    변경 전후의 서비스별 최근 배포를 비교해 활성 서비스 수를 옮긴다.
+    created=True 이면 service_ids 한 항목을 새 배포 하나로 센다.
+    서비스가 없는 배포는 집계하지 않는다. service_id → user_id 를 yield 한다.
+    """
+    owners = dict((await db.execute(
+        select(Service.service_id, Service.user_id).where(
+            Service.service_id.in_(set(service_ids))
+        ).order_by(Service.service_id).with_for_update()
+    )).all())
+    before = await _latest_deploys(db, owners) if owners else {}
+
+    yield owners
+
+    if not owners:
+        return
+    await db.flush()
+    after = await _latest_deploys(db, owners)
+
+    changes: Counter[tuple[int, date]] = Counter()
+    for service_id, user_id in owners.items():
+        for latest, sign in ((before.get(service_id), -1), (after.get(service_id), 1)):
+            if latest and latest[0] == DeployStatus.SUCCESS:
+                changes[user_id, latest[1]] += sign
+    for (user_id, day), delta in changes.items():
+        if delta:
+            await _bump(db, user_id, day, active_services_count=delta, active_services=delta)
+
+    if created:
+        today = local_today()
+        per_user = Counter(owners[s] for s in service_ids if s in owners)
+        for user_id, count in per_user.items():
+            await _bump(db, user_id, today, deploys_created=count)
+
+
+async def get_user_summary(db: AsyncSession, user_id: int, day: date | None = None) -> dict:
+    # (user_id) + (user_id, day) 기본 키 조회 한 번
+    day = day or local_today()
+    row = (await db.execute(
+        select(
+            UserSummary.services_count,
+            UserSummary.active_services_count,
+            func.coalesce(UserDailySummary.services_created, 0),
+            func.coalesce(UserDailySummary.deploys_created, 0),
+            func.coalesce(UserDailySummary.active_services, 0),
+        ).outerjoin(UserDailySummary, and_(
+            UserDailySummary.user_id == UserSummary.user_id,
+            UserDailySummary.day == day,
+        )).where(UserSummary.user_id == user_id)
+    )).first()
+
+    services, active, today_services, today_deploys, today_active = row or (0, 0, 0, 0, 0)
+    return {
+        "user_id": user_id,
+        "date": day,
+        "timezone": DASHBOARD_TZ,
+        "services_count": services,
+        "active_services_count": active,
+        "today_services_count": today_services,
+        "today_deploys_count": today_deploys,
+        "success_rate": int(today_active / today_services * 100) if today_services else 0,
+    }
+
+
+async def rebuild_user_summary(db: AsyncSession, user_id: int) -> None:
+    """
+    services / deploys 테이블에서 한 유저의 요약을 다시 계산 (직접 INSERT한 데이터 보정용)
+    """
+    await db.execute(delete(UserSummary).where(UserSummary.user_id == user_id))
+    await db.execute(delete(UserDailySummary).where(UserDailySummary.user_id == user_id))
+
+    latest = select(Deploy.service_id, Deploy.status, Deploy.created_date).join(
+        Service, Deploy.service_id == Service.service_id
+    ).where(Service.user_id == user_id).distinct(Deploy.service_id).order_by(
+        Deploy.service_id, Deploy.created_date.desc(), Deploy.deploy_id.desc()
+    ).subquery()
+
+    services = select(func.count()).select_from(Service).where(Service.user_id == user_id).scalar_subquery()
+    active = select(func.count()).select_from(latest).where(latest.c.status == DeployStatus.SUCCESS).scalar_subquery()
+    await db.execute(insert(UserSummary).from_select(
+        ["user_id", "services_count", "active_services_count"],
+        select(literal(user_id), services, active),
+    ))
+
+    service_day = _local_day(Service.created_date)
+    deploy_day = _local_day(Deploy.created_date)
+    latest_day = _local_day(latest.c.created_date)
+    daily = [
+        ("services_created", select(service_day, func.count()).where(
+            Service.user_id == user_id
+        ).group_by(service_day)),
+        ("deploys_created", select(deploy_day, func.count()).join(
+            Service, Deploy.service_id == Service.service_id
+        ).where(Service.user_id == user_id).group_by(deploy_day)),
+        ("active_services", select(latest_day, func.count()).where(
+            latest.c.status == DeployStatus.SUCCESS
+        ).group_by(latest_day)),
+    ]
+    for column, query in daily:
+        for day, count in await db.execute(query):
+            await _bump(db, user_id, day, **{column: count})
+    await db.commit()
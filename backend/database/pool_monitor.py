@@ -0,0 +1,71 @@
+import time
+from collections import deque
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.config import env_int
+
+
+class PoolMonitor:
+    """
+    커넥션 풀 checkout 대기 시간 / timeout 횟수 기록.
+    최근 DB_POOL_WAIT_SAMPLES 건의 대기 시간으로 분위수를 계산한다.
+    """
+
+    def __init__(self) -> None:
+        self._waits: deque[float] = deque(maxlen=env_int("DB_POOL_WAIT_SAMPLES", 1000))
+        self.checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self._waits.append(wait)
+        self.max_wait = max(self.max_wait, wait)
+
+    def _percentile(self, values: list[float], p: float) -> float:
+        if not values:
+            return 0.0
+        return values[min(len(values) - 1, int(len(values) * p))]
+
+    def stats(self, pool: AsyncAdaptedQueuePool) -> dict:
+        waits = sorted(self._waits)
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # QueuePool은 기본 크기 미만일 때 음수를 돌려준다
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": pool._max_overflow,
+            "timeout_sec": pool.timeout(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms": {
+                "p50": self._percentile(waits, 0.50) * 1000,
+                "p95": self._percentile(waits, 0.95) * 1000,
+                "p99": self._percentile(waits, 0.99) * 1000,
+                "max": self.max_wait * 1000,
+                "samples": len(waits),
+            },
+        }
+
+
+# 프로세스 전역 풀 모니터 (async_engine 풀에 연결됨)
+pool_monitor = PoolMonitor()
+
+
+class MonitoredAsyncPool(AsyncAdaptedQueuePool):
+    """
+    checkout 한 번에 걸린 시간(풀 대기 + 새 커넥션 생성 + pre-ping)을 pool_monitor에 기록하는 풀
+    """
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_monitor.timeouts += 1
+            raise
+        finally:
+            pool_monitor.record(time.perf_counter() - started)
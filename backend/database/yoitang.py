@@ -1,7 +1,11 @@
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+
+from core.config import env_bool, env_int
+from database.pool_monitor import MonitoredAsyncPool
 
 load_dotenv()
 
@@ -11,16 +15,33 @@ password = os.getenv("DB_PASSWORD")
 database = os.getenv("DB_NAME")
 
 DB_URL = f'postgresql://{username}:{password}@{host}/{database}'
+ASYNC_DB_URL = f'postgresql+asyncpg://{username}:{password}@{host}/{database}'
 
+# 동기 엔진: alembic 마이그레이션 전용
 engine = create_engine(DB_URL)
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# API / 워커는 asyncpg 기반 비동기 세션만 사용 (쿼리가 event loop를 막지 않음)
+# 풀 설정:
+#   - DB_POOL_SIZE      : 유지할 커넥션 수 (default 10)
+#   - DB_MAX_OVERFLOW   : 풀이 모자랄 때 추가로 여는 커넥션 수 (default 10)
+#   - DB_POOL_TIMEOUT   : 커넥션을 기다리는 최대 시간(초) (default 30)
+#   - DB_POOL_RECYCLE   : 이 시간(초)보다 오래된 커넥션은 새로 연결 (default 1800, -1이면 끔)
+#   - DB_POOL_PRE_PING  : checkout 때 커넥션이 살아있는지 확인 (default true)
+async_engine = create_async_engine(
+    ASYNC_DB_URL,
+    poolclass=MonitoredAsyncPool,
+    pool_size=env_int("DB_POOL_SIZE", 10),
+    max_overflow=env_int("DB_MAX_OVERFLOW", 10),
+    pool_timeout=env_int("DB_POOL_TIMEOUT", 30),
+    pool_recycle=env_int("DB_POOL_RECYCLE", 1800),
+    pool_pre_ping=env_bool("DB_POOL_PRE_PING", True),
+)
+
+# commit 후에도 객체 속성을 다시 읽지 않도록 expire_on_commit=False (비동기 세션에서는 lazy load 불가)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
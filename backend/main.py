@@ -1,9 +1,41 @@
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from api import main
+from core import http_pool
+from core.config import env_bool
+from core.build_watcher import build_watcher
+from core.deploy_scheduler import deploy_scheduler
+from core.deploy_events import deploy_event_hub
+from core.log_tiering import log_tiering
+from core.prometheus_client import prometheus_http
+from core.kubecost_client import kubecost_http
 from starlette.middleware.cors import CORSMiddleware
 
-app = FastAPI(root_path="/api")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Jenkins / Prometheus / Kubecost 외부 호출용 keep-alive 커넥션 풀은 앱 수명 동안 공유
+    http_pool.get_client("JENKINS")
+    prometheus_http()
+    kubecost_http()
+    # 진행 중인 모든 빌드를 하나의 루프로 추적
+    build_watcher.start()
+    # 배포 상태 변경 LISTEN → SSE 구독자 / 조회 캐시 무효화
+    deploy_event_hub.start()
+    # 배포 대기열 워커 (별도 worker.py 프로세스만 쓰려면 DEPLOY_WORKER_EMBEDDED=false)
+    if env_bool("DEPLOY_WORKER_EMBEDDED", True):
+        deploy_scheduler.start()
+        log_tiering.start()
+    yield
+    await deploy_scheduler.stop()
+    await log_tiering.stop()
+    await build_watcher.stop()
+    await deploy_event_hub.stop()
+    await http_pool.close_all()
+
+
+app = FastAPI(root_path="/api", lifespan=lifespan)
 
 origins = ['*']
 
@@ -13,10 +45,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 페이지 cursor / 로그 구간 정보 헤더를 브라우저에서 읽을 수 있도록
+    expose_headers=["X-Next-Cursor", "X-Log-Size", "X-Range-Start", "X-Range-End"],
 )
 
 app.include_router(main.api_router)
 
 @app.get("/")
 def read_root():
-    return {"Hello": "World"}
\ No newline at end of file
+    return {"Hello": "World"}
@@ -0,0 +1,43 @@
+import glob
+import importlib
+import os
+from logging.config import fileConfig
+
+from alembic import context
+
+from database.yoitang import Base, DB_URL, engine
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# autogenerate가 모든 테이블을 보도록 models/*.py 를 전부 import
+for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "..", "models", "*.py"))):
+    importlib.import_module(f"models.{os.path.basename(path)[:-3]}")
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    # alembic upgrade head --sql : DB 접속 없이 SQL만 출력
+    context.configure(
+        url=DB_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
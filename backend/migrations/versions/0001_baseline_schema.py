@@ -0,0 +1,77 @@
+"""baseline schema
+
+지금까지 Base 모델로 직접 만들던 테이블들. 이미 테이블이 있는 DB에서도
+그대로 upgrade 할 수 있도록 없는 테이블/타입만 만든다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+deploy_status = postgresql.ENUM("IN_PROGRESS", "SUCCESS", "FAILED", "ARCHIVED", name="deploy_status", create_type=False)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    deploy_status.create(bind, checkfirst=True)
+
+    op.create_table(
+        "users",
+        sa.Column("user_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(100), unique=True, nullable=False),
+        sa.Column("password", sa.String(255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "services",
+        sa.Column("service_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("domain", sa.String(200), nullable=False),
+        sa.Column("git_repo", sa.Text(), nullable=False),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "deploys",
+        sa.Column("deploy_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("service_id", sa.BigInteger(), nullable=False),
+        sa.Column("git_branch", sa.String(100), nullable=False),
+        sa.Column("commit_id", sa.String(50), nullable=False),
+        sa.Column("commit_message", sa.Text(), nullable=False),
+        sa.Column("status", deploy_status, nullable=False),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "logs",
+        sa.Column("log_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("deploy_id", sa.BigInteger(), nullable=False),
+        sa.Column("build_log", sa.Text(), nullable=True),
+        sa.Column("deploy_log", sa.Text(), nullable=True),
+        sa.Column("application_log", sa.Text(), nullable=True),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+
+def downgrade() -> None:
+    for table in ("logs", "deploys", "services", "users"):
+        op.drop_table(table, if_exists=True)
+    bind = op.get_bind()
+    deploy_status.drop(bind, checkfirst=True)
@@ -0,0 +1,52 @@
+"""deploy jobs
+
+배포 요청을 DB 대기열로 처리하는 deploy_jobs 테이블 (core.deploy_scheduler, worker.py).
+baseline 이후에 추가된 테이블이므로 baseline과 분리한다.
+이미 테이블이 있는 DB에서도 그대로 upgrade 할 수 있도록 없을 때만 만든다.
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0001a"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+deploy_job_status = postgresql.ENUM(
+    "QUEUED", "CLAIMED", "TRIGGERED", "DONE", "FAILED", "CANCELLED", name="deploy_job_status", create_type=False
+)
+
+
+def upgrade() -> None:
+    deploy_job_status.create(op.get_bind(), checkfirst=True)
+    op.create_table(
+        "deploy_jobs",
+        sa.Column("job_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("deploy_id", sa.BigInteger(), nullable=False),
+        sa.Column("service_id", sa.BigInteger(), nullable=False),
+        sa.Column("lane", sa.String(20), nullable=False),
+        sa.Column("coalesce_key", sa.String(200), nullable=True),
+        sa.Column("payload", sa.Text(), nullable=True),
+        sa.Column("status", deploy_job_status, nullable=False),
+        sa.Column("queue_id", sa.BigInteger(), nullable=True),
+        sa.Column("build_number", sa.BigInteger(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("locked_by", sa.String(100), nullable=True),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("claimed_date", sa.DateTime(), nullable=True),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_date", sa.DateTime(), nullable=True),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("deploy_jobs", if_exists=True)
+    deploy_job_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,36 @@
+"""log chunks
+
+빌드 로그를 압축 조각으로 보관하는 log_chunks 테이블 (core.log_archive, 이어붙이기).
+이미 테이블이 있는 DB에서도 그대로 upgrade 할 수 있도록 없을 때만 만든다.
+
+Revision ID: 0001b
+Revises: 0001a
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001b"
+down_revision = "0001a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "log_chunks",
+        sa.Column("chunk_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("deploy_id", sa.BigInteger(), nullable=False),
+        sa.Column("log_type", sa.String(20), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("codec", sa.String(20), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("log_chunks", if_exists=True)
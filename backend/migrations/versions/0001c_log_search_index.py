@@ -0,0 +1,39 @@
+"""log search index
+
+로그 검색용 tsvector 색인 log_search_index 테이블 (crud.log_search).
+이미 테이블이 있는 DB에서도 그대로 upgrade 할 수 있도록 없을 때만 만든다.
+
+Revision ID: 0001c
+Revises: 0001b
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0001c"
+down_revision = "0001b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "log_search_index",
+        sa.Column("entry_id", sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column("deploy_id", sa.BigInteger(), nullable=False),
+        sa.Column("log_type", sa.String(20), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("document", postgresql.TSVECTOR(), nullable=False),
+        sa.Column("created_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        if_not_exists=True,
+    )
+    op.create_index("ix_log_search_index_deploy_id", "log_search_index", ["deploy_id"], if_not_exists=True)
+    op.create_index(
+        "ix_log_search_index_document", "log_search_index", ["document"], postgresql_using="gin", if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("log_search_index", if_exists=True)
@@ -0,0 +1,52 @@
+"""hot path indexes
+
+crud 모듈의 자주 쓰는 조회에 맞춘 인덱스.
+  - deploys(service_id, created_date DESC, deploy_id DESC)
+      최근 배포/배포 이력 (get_latest_deploy_by_service, get_deploys_by_service),
+      서비스별 최근 배포 DISTINCT ON (crud.service), 유저별 오늘 배포 수 join
+  - services(user_id, created_date)
+      유저별 서비스 목록/개수, 오늘 생성된 서비스 수
+  - logs(deploy_id)
+      배포별 로그 조회 (get_log 등)
+  - log_chunks(deploy_id, log_type, seq)
+      압축 조각 목록/이어붙이기
+  - deploy_jobs(status, created_date), deploy_jobs(deploy_id)
+      대기열 claim, 배포별 작업 완료 처리
+
+운영 중인 테이블을 잠그지 않도록 CREATE INDEX CONCURRENTLY 로 만든다.
+
+Revision ID: 0002
+Revises: 0001c
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001c"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_deploys_service_id_created_date", "deploys",
+     ["service_id", sa.text("created_date DESC"), sa.text("deploy_id DESC")]),
+    ("ix_services_user_id_created_date", "services", ["user_id", "created_date"]),
+    ("ix_logs_deploy_id", "logs", ["deploy_id"]),
+    ("ix_log_chunks_deploy_id_log_type_seq", "log_chunks", ["deploy_id", "log_type", "seq"]),
+    ("ix_deploy_jobs_status_created_date", "deploy_jobs", ["status", "created_date"]),
+    ("ix_deploy_jobs_deploy_id", "deploy_jobs", ["deploy_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
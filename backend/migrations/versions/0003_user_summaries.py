@@ -0,0 +1,88 @@
+"""user dashboard summaries
+
+대시보드 카운트를 요청마다 집계하지 않도록 유저별 요약 테이블을 만든다.
+  - user_summaries        : 유저별 서비스 수 / 활성 서비스 수
+  - user_daily_summaries  : 유저별·날짜별(DASHBOARD_TZ) 생성 서비스 수 / 배포 수 / 활성 서비스 수
+기존 services / deploys 데이터로 한 번 채운 뒤에는 crud.user_summary가 쓰기 시점에 갱신한다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+import os
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+# 서비스별 최근 배포 (crud.user_summary 와 같은 정렬)
+LATEST_DEPLOYS = """
+    SELECT DISTINCT ON (d.service_id) d.service_id, d.status, d.created_date
+    FROM deploys d
+    ORDER BY d.service_id, d.created_date DESC, d.deploy_id DESC
+"""
+
+BACKFILL_TOTALS = f"""
+    INSERT INTO user_summaries (user_id, services_count, active_services_count)
+    SELECT s.user_id, count(*), count(*) FILTER (WHERE l.status = 'SUCCESS')
+    FROM services s
+    LEFT JOIN ({LATEST_DEPLOYS}) l ON l.service_id = s.service_id
+    GROUP BY s.user_id
+"""
+
+BACKFILL_DAILY = {
+    "services_created": """
+        SELECT s.user_id, (s.created_date::timestamptz AT TIME ZONE :tz)::date AS day, count(*)
+        FROM services s
+        GROUP BY 1, 2
+    """,
+    "deploys_created": """
+        SELECT s.user_id, (d.created_date::timestamptz AT TIME ZONE :tz)::date AS day, count(*)
+        FROM deploys d JOIN services s ON s.service_id = d.service_id
+        GROUP BY 1, 2
+    """,
+    "active_services": f"""
+        SELECT s.user_id, (l.created_date::timestamptz AT TIME ZONE :tz)::date AS day, count(*)
+        FROM ({LATEST_DEPLOYS}) l JOIN services s ON s.service_id = l.service_id
+        WHERE l.status = 'SUCCESS'
+        GROUP BY 1, 2
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_summaries",
+        sa.Column("user_id", sa.BigInteger(), primary_key=True, autoincrement=False, nullable=False),
+        sa.Column("services_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("active_services_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("updated_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_table(
+        "user_daily_summaries",
+        sa.Column("user_id", sa.BigInteger(), primary_key=True, autoincrement=False, nullable=False),
+        sa.Column("day", sa.Date(), primary_key=True, nullable=False),
+        sa.Column("services_created", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("deploys_created", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("active_services", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    tz = os.getenv("DASHBOARD_TZ", "Asia/Seoul")
+    op.execute(BACKFILL_TOTALS)
+    for column, query in BACKFILL_DAILY.items():
+        op.execute(sa.text(f"""
+            INSERT INTO user_daily_summaries (user_id, day, {column})
+            {query}
+            ON CONFLICT (user_id, day) DO UPDATE SET {column} = EXCLUDED.{column}
+        """).bindparams(tz=tz))
+
+
+def downgrade() -> None:
+    op.drop_table("user_daily_summaries")
+    op.drop_table("user_summaries")
@@ -0,0 +1,38 @@
+"""service list keyset index
+
+유저별 서비스 목록을 (created_date, service_id) keyset으로 페이지네이션 하므로
+services(user_id, created_date) 인덱스를 정렬 순서까지 포함한
+services(user_id, created_date DESC, service_id DESC) 로 바꾼다.
+오늘 생성 수 집계는 user_daily_summaries로 옮겨가 기존 인덱스는 더 쓰지 않는다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_services_user_id_created_date_service_id", "services",
+            ["user_id", sa.text("created_date DESC"), sa.text("service_id DESC")],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index("ix_services_user_id_created_date", table_name="services", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_services_user_id_created_date", "services", ["user_id", "created_date"],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index("ix_services_user_id_created_date_service_id", table_name="services", postgresql_concurrently=True, if_exists=True)
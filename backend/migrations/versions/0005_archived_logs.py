@@ -0,0 +1,44 @@
+"""archived logs
+
+오래된 로그 / ARCHIVED 배포의 로그를 object storage로 옮기고(core.log_tiering)
+logs / log_chunks 에는 남기지 않는다. archived_logs 에는 객체 위치와 크기,
+로그 종류별 압축 조각 크기 목록(chunks, 범위 조회 시 ranged GET 위치 계산용)만 남는다.
+보존 기간이 지난 행은 log_created_date 기준으로 나눠서 지운다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "archived_logs",
+        sa.Column("deploy_id", sa.BigInteger(), primary_key=True, autoincrement=False, nullable=False),
+        sa.Column("log_id", sa.BigInteger(), nullable=False),
+        sa.Column("object_key", sa.String(length=512), nullable=False),
+        sa.Column("codec", sa.String(length=20), nullable=False),
+        sa.Column("build_size", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("deploy_size", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("application_size", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("object_size", sa.BigInteger(), nullable=False),
+        sa.Column("chunks", postgresql.JSONB(), server_default="{}", nullable=False),
+        sa.Column("log_created_date", sa.DateTime(), nullable=False),
+        sa.Column("log_updated_date", sa.DateTime(), nullable=True),
+        sa.Column("archived_date", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_archived_logs_log_created_date", "archived_logs", ["log_created_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_archived_logs_log_created_date", table_name="archived_logs")
+    op.drop_table("archived_logs")
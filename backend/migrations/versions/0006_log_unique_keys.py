@@ -0,0 +1,151 @@
+"""log unique keys
+
+배포 하나에 logs 행 하나, (배포, 로그 종류) 하나에 같은 seq 조각 하나만 있도록 UNIQUE 제약을 건다.
+동시에 이어붙이던 요청이 행/조각을 겹쳐 만들었을 수 있으므로 먼저 정리한다.
+  - 같은 배포의 logs 행은 log_id 순으로 텍스트를 이어붙여 가장 앞 행 하나로 합친다
+  - seq가 겹치는 (배포, 로그 종류) 의 조각은 (seq, chunk_id) 순으로 다시 번호를 매긴다
+  - 정리한 배포의 검색 색인(log_search_index)은 지우고 합친 텍스트 / 새 seq 기준으로 다시 만든다
+    (압축 조각은 풀어서 색인하므로 --sql 오프라인 모드에서는 조각 색인은 그대로 두고 컬럼 색인만 다시 만든다)
+같은 컬럼의 일반 인덱스는 UNIQUE 인덱스로 대신한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+import lzma
+import zlib
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+# crud.log_search 와 같은 기준 (색인 piece 크기 / 앞 부분 마지막 줄 최대 길이, 컬럼 텍스트 seq)
+INDEX_PIECE_SIZE = 256 * 1024
+LINE_CARRY_MAX = 64 * 1024
+COLUMN_SEQ = -1
+
+# core.log_codec 의 해제 함수
+DECOMPRESS = {"none": lambda b: b, "zlib": zlib.decompress, "lzma": lzma.decompress}
+
+# 행 / 조각이 겹친 배포 (정리 전에 모아둠)
+COLLECT_TOUCHED = """
+    CREATE TEMPORARY TABLE _touched_deploys AS
+    SELECT deploy_id FROM logs GROUP BY deploy_id HAVING count(*) > 1
+    UNION
+    SELECT deploy_id FROM log_chunks GROUP BY deploy_id, log_type, seq HAVING count(*) > 1
+"""
+
+# 컬럼 텍스트 색인 (crud.log_search.index_log_rows 와 같은 SQL)
+INDEX_COLUMN = """
+    INSERT INTO log_search_index (deploy_id, log_type, seq, document)
+    SELECT p.deploy_id, '{log_type}', {column_seq}, strip(to_tsvector('simple',
+        substring(substr(p.text, greatest(1, p.start - {carry}), least({carry}, p.start - 1)), '[^' || chr(10) || ']*$')
+        || substr(p.text, p.start, {piece})
+    ))
+    FROM (
+        SELECT l.deploy_id, l.{log_type}_log AS text, generate_series(0, (length(l.{log_type}_log) - 1) / {piece}) * {piece} + 1 AS start
+        FROM logs l
+        WHERE l.deploy_id IN (SELECT deploy_id FROM _touched_deploys) AND length(l.{log_type}_log) > 0
+    ) p
+"""
+
+INSERT_DOCUMENT = sa.text("""
+    INSERT INTO log_search_index (deploy_id, log_type, seq, document)
+    VALUES (:deploy_id, :log_type, :seq, strip(to_tsvector('simple', :text)))
+""")
+
+
+def _trailing_line(text: str) -> str:
+    tail = text[-LINE_CARRY_MAX:]
+    return tail[tail.rfind("\n") + 1:]
+
+
+def _index_chunks(bind) -> None:
+    # 압축 조각 색인 (crud.log.add_log_chunk / crud.log_search.index_log_text 와 같은 기준)
+    # 조각은 하나씩 읽어 푼다
+    groups = bind.execute(sa.text("""
+        SELECT DISTINCT c.deploy_id, c.log_type FROM log_chunks c
+        WHERE c.deploy_id IN (SELECT deploy_id FROM _touched_deploys)
+        ORDER BY 1, 2
+    """)).all()
+    for deploy_id, log_type in groups:
+        column = bind.execute(sa.text(
+            f"SELECT right({log_type}_log, {LINE_CARRY_MAX}) FROM logs WHERE deploy_id = :deploy_id"
+        ), {"deploy_id": deploy_id}).scalar()
+        carry = _trailing_line(column or "")
+        chunk_ids = bind.execute(sa.text("""
+            SELECT chunk_id, seq FROM log_chunks WHERE deploy_id = :deploy_id AND log_type = :log_type ORDER BY seq
+        """), {"deploy_id": deploy_id, "log_type": log_type}).all()
+        for chunk_id, seq in chunk_ids:
+            data, codec = bind.execute(sa.text(
+                "SELECT data, codec FROM log_chunks WHERE chunk_id = :chunk_id"
+            ), {"chunk_id": chunk_id}).one()
+            text = DECOMPRESS[codec](bytes(data)).decode("utf-8", errors="replace").replace("\x00", "")
+            for i in range(0, len(text), INDEX_PIECE_SIZE):
+                head = carry if i == 0 else _trailing_line(text[max(0, i - LINE_CARRY_MAX):i])
+                bind.execute(INSERT_DOCUMENT, {
+                    "deploy_id": deploy_id, "log_type": log_type, "seq": seq,
+                    "text": head + text[i:i + INDEX_PIECE_SIZE],
+                })
+            carry = _trailing_line(text)
+
+
+def upgrade() -> None:
+    op.execute(COLLECT_TOUCHED)
+    op.execute("""
+        UPDATE logs l
+        SET build_log = m.build_log, deploy_log = m.deploy_log, application_log = m.application_log
+        FROM (
+            SELECT min(log_id) AS log_id,
+                   string_agg(build_log, '' ORDER BY log_id) AS build_log,
+                   string_agg(deploy_log, '' ORDER BY log_id) AS deploy_log,
+                   string_agg(application_log, '' ORDER BY log_id) AS application_log
+            FROM logs GROUP BY deploy_id HAVING count(*) > 1
+        ) m
+        WHERE l.log_id = m.log_id
+    """)
+    op.execute("DELETE FROM logs l USING logs k WHERE l.deploy_id = k.deploy_id AND l.log_id > k.log_id")
+    op.execute("""
+        UPDATE log_chunks c
+        SET seq = r.seq
+        FROM (
+            SELECT chunk_id, row_number() OVER (PARTITION BY deploy_id, log_type ORDER BY seq, chunk_id) - 1 AS seq
+            FROM log_chunks
+            WHERE (deploy_id, log_type) IN (
+                SELECT deploy_id, log_type FROM log_chunks GROUP BY deploy_id, log_type, seq HAVING count(*) > 1
+            )
+        ) r
+        WHERE c.chunk_id = r.chunk_id AND c.seq <> r.seq
+    """)
+
+    # 지워진 행의 색인 / 예전 seq 의 색인을 버리고 다시 만든다
+    online = not context.is_offline_mode()
+    op.execute(
+        "DELETE FROM log_search_index WHERE deploy_id IN (SELECT deploy_id FROM _touched_deploys)"
+        + ("" if online else f" AND seq = {COLUMN_SEQ}")
+    )
+    for log_type in ("build", "deploy", "application"):
+        op.execute(INDEX_COLUMN.format(
+            log_type=log_type, column_seq=COLUMN_SEQ, carry=LINE_CARRY_MAX, piece=INDEX_PIECE_SIZE,
+        ))
+    if online:
+        _index_chunks(op.get_bind())
+    op.execute("DROP TABLE _touched_deploys")
+
+    op.drop_index("ix_logs_deploy_id", table_name="logs", if_exists=True)
+    op.create_unique_constraint("uq_logs_deploy_id", "logs", ["deploy_id"])
+    op.drop_index("ix_log_chunks_deploy_id_log_type_seq", table_name="log_chunks", if_exists=True)
+    op.create_unique_constraint("uq_log_chunks_deploy_id_log_type_seq", "log_chunks", ["deploy_id", "log_type", "seq"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_log_chunks_deploy_id_log_type_seq", "log_chunks", type_="unique")
+    op.create_index("ix_log_chunks_deploy_id_log_type_seq", "log_chunks", ["deploy_id", "log_type", "seq"])
+    op.drop_constraint("uq_logs_deploy_id", "logs", type_="unique")
+    op.create_index("ix_logs_deploy_id", "logs", ["deploy_id"])
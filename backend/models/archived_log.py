@@ -0,0 +1,25 @@
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from database.yoitang import Base
+
+# object storage로 옮긴 로그의 위치 (logs / log_chunks 행은 지우고 이 행만 남김)
+class ArchivedLog(Base):
+    __tablename__ = "archived_logs"
+
+    deploy_id = Column(BigInteger, primary_key=True, autoincrement=False, nullable=False)
+    log_id = Column(BigInteger, nullable=False)               # 옮기기 전 logs.log_id
+    object_key = Column(String(512), nullable=False)          # 로그 종류별 객체 key 의 prefix ({object_key}{log_type}.log)
+    codec = Column(String(20), nullable=False)                # zlib / lzma / none
+    build_size = Column(BigInteger, server_default="0", nullable=False)        # 원본 크기 (bytes)
+    deploy_size = Column(BigInteger, server_default="0", nullable=False)
+    application_size = Column(BigInteger, server_default="0", nullable=False)
+    object_size = Column(BigInteger, nullable=False)          # 압축된 객체 크기 합 (bytes)
+    chunks = Column(JSONB, server_default="{}", nullable=False)  # 로그 종류별 [[원본 크기, 압축 크기], ...] (객체 안 순서대로)
+    log_created_date = Column(DateTime, nullable=False)       # 보존 기간 기준
+    log_updated_date = Column(DateTime, nullable=True)
+    archived_date = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_archived_logs_log_created_date", log_created_date),
+    )
@@ -1,5 +1,5 @@
 import enum
-from sqlalchemy import Column, BigInteger, Text, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, BigInteger, Text, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 from database.yoitang import Base
 
@@ -23,4 +23,9 @@ class Deploy(Base):
         nullable=False
     )
     created_date = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
\ No newline at end of file
+    updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        # 서비스별 최근 배포 / 배포 이력
+        Index("ix_deploys_service_id_created_date", service_id, created_date.desc(), deploy_id.desc()),
+    )
\ No newline at end of file
@@ -0,0 +1,47 @@
+import enum
+from sqlalchemy import Column, BigInteger, Integer, Text, String, DateTime, Enum, Index
+from sqlalchemy.sql import func
+from database.yoitang import Base
+
+class DeployLane(str, enum.Enum):
+    # 우선순위 순서대로 선언 (앞에 있을수록 먼저 처리)
+    NEW = "new"
+    REDEPLOY = "redeploy"
+
+class DeployJobStatus(enum.Enum):
+    QUEUED = "QUEUED"          # 워커가 가져가기를 대기
+    CLAIMED = "CLAIMED"        # 워커가 가져가서 Jenkins 트리거 중
+    TRIGGERED = "TRIGGERED"    # Jenkins 큐에 들어감 → 빌드 결과 추적 중
+    DONE = "DONE"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"    # 같은 서비스/브랜치의 새 재배포 요청으로 대체됨
+
+class DeployJob(Base):
+    __tablename__ = "deploy_jobs"
+
+    job_id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    deploy_id = Column(BigInteger, nullable=False)
+    service_id = Column(BigInteger, nullable=False)
+    lane = Column(String(20), nullable=False)
+    coalesce_key = Column(String(200), nullable=True)
+    # DeployRequest JSON (git_pat 은 DEPLOY_SECRET_KEY 로 암호화) → 트리거 후에는 비운다
+    payload = Column(Text, nullable=True)
+    status = Column(
+        Enum(DeployJobStatus, name="deploy_job_status"),
+        default=DeployJobStatus.QUEUED,
+        nullable=False
+    )
+    queue_id = Column(BigInteger, nullable=True)
+    build_number = Column(BigInteger, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    locked_by = Column(String(100), nullable=True)
+    locked_at = Column(DateTime, nullable=True)
+    claimed_date = Column(DateTime, nullable=True)
+    created_date = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        # 대기열 claim / 배포별 작업 조회
+        Index("ix_deploy_jobs_status_created_date", status, created_date),
+        Index("ix_deploy_jobs_deploy_id", deploy_id),
+    )
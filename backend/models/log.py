@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Text, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Text, DateTime, ForeignKey, UniqueConstraint
 from sqlalchemy.sql import func
 from database.yoitang import Base
 
@@ -11,4 +11,8 @@ class Log(Base):
     deploy_log = Column(Text, nullable=True)
     application_log = Column(Text, nullable=True)
     created_date = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
\ No newline at end of file
+    updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(deploy_id, name="uq_logs_deploy_id"),    # 배포 하나에 행 하나
+    )
\ No newline at end of file
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, BigInteger, Integer, String, LargeBinary, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from database.yoitang import Base
+
+class LogChunk(Base):
+    __tablename__ = "log_chunks"
+
+    chunk_id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    deploy_id = Column(BigInteger, nullable=False)
+    log_type = Column(String(20), nullable=False)     # build / deploy / application
+    seq = Column(Integer, nullable=False)             # 0부터 시작하는 조각 순서
+    codec = Column(String(20), nullable=False)        # zlib / lzma / none
+    raw_size = Column(Integer, nullable=False)        # 압축 전 크기 (bytes)
+    data = Column(LargeBinary, nullable=False)
+    created_date = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(deploy_id, log_type, seq, name="uq_log_chunks_deploy_id_log_type_seq"),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.sql import func
+from database.yoitang import Base
+
+class LogSearchIndex(Base):
+    __tablename__ = "log_search_index"
+
+    entry_id = Column(BigInteger, primary_key=True, autoincrement=True, nullable=False)
+    deploy_id = Column(BigInteger, nullable=False, index=True)
+    log_type = Column(String(20), nullable=False)     # build / deploy / application
+    seq = Column(Integer, nullable=False)             # -1: logs 테이블 컬럼, 0~: log_chunks 조각 순서
+    document = Column(TSVECTOR, nullable=False)       # to_tsvector('simple', ...) (위치 정보 제거)
+    created_date = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_log_search_index_document", "document", postgresql_using="gin"),
+    )
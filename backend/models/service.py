@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, Text, String, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Text, String, DateTime, ForeignKey, Index
 from sqlalchemy.sql import func
 from database.yoitang import Base
 
@@ -12,3 +12,8 @@ class Service(Base):
     git_repo = Column(Text, nullable=False)
     created_date = Column(DateTime, server_default=func.now(), nullable=False)
     updated_date = Column(DateTime, onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        # 유저별 서비스 목록 (최근 생성 순 keyset 페이지네이션)
+        Index("ix_services_user_id_created_date_service_id", user_id, created_date.desc(), service_id.desc()),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, BigInteger, Integer, Date, DateTime
+from sqlalchemy.sql import func
+from database.yoitang import Base
+
+class UserSummary(Base):
+    __tablename__ = "user_summaries"
+
+    user_id = Column(BigInteger, primary_key=True, autoincrement=False, nullable=False)
+    services_count = Column(Integer, server_default="0", nullable=False)
+    # 최근 배포가 SUCCESS인 서비스 수
+    active_services_count = Column(Integer, server_default="0", nullable=False)
+    updated_date = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+class UserDailySummary(Base):
+    __tablename__ = "user_daily_summaries"
+
+    user_id = Column(BigInteger, primary_key=True, autoincrement=False, nullable=False)
+    day = Column(Date, primary_key=True, nullable=False)      # DASHBOARD_TZ 기준 날짜
+    services_created = Column(Integer, server_default="0", nullable=False)
+    deploys_created = Column(Integer, server_default="0", nullable=False)
+    # 최근 배포가 SUCCESS이고 그 배포가 이 날짜에 만들어진 서비스 수
+    active_services = Column(Integer, server_default="0", nullable=False)
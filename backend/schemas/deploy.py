@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 import re
@@ -48,4 +48,6 @@ class DeployResponse(BaseModel):
 
     class Config:
         orm_mode = True
-    
\ No newline at end of file
+    
+class DeployBulkResponse(BaseModel):
+    deploy_ids: List[int]   # 요청 순서와 같은 순서
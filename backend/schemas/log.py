@@ -1,6 +1,12 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
+from enum import Enum
+
+class LogType(str, Enum):
+    BUILD = "build"
+    DEPLOY = "deploy"
+    APPLICATION = "application"
 
 class LogCreate(BaseModel):
     deploy_id: int
@@ -16,6 +22,50 @@ class LogResponse(BaseModel):
     application_log: Optional[str]
     created_date: datetime
     updated_date: Optional[datetime]
+    # LOG_CONTENT_MAX_BYTES 를 넘어 마지막 부분만 담은 로그 종류 → 전체 크기 (bytes)
+    truncated: Dict[LogType, int] = {}
 
     class Config:
         orm_mode = True
+
+class LogBulkResponse(BaseModel):
+    log_ids: List[int]      # 요청 순서와 같은 순서
+
+class LogAppendResponse(BaseModel):
+    deploy_id: int
+    log_type: LogType
+    seq: int            # 이번에 추가된 조각 순서
+    size: int           # 이어붙인 뒤 로그 전체 크기 (bytes)
+
+class LogSizeInfo(BaseModel):
+    size: int           # 원본 크기 (bytes)
+    chunks: int         # 압축 보관된 조각 수
+    stored_size: int    # 실제 저장 크기 (bytes)
+
+class LogMetaResponse(BaseModel):
+    log_id: int
+    deploy_id: int
+    logs: Dict[LogType, LogSizeInfo]
+    created_date: datetime
+    updated_date: Optional[datetime]
+    # object storage로 옮긴 로그 (이때 logs 의 chunks / stored_size 는 객체 안 압축 조각 기준, object_size 는 그 합)
+    archived_date: Optional[datetime] = None
+    object_size: Optional[int] = None
+
+class LogSearchMatch(BaseModel):
+    log_type: LogType
+    offset: int         # 줄 시작 바이트 offset (/log/{deploy_id}/{log_type}?offset= 로 이어보기)
+    line: str
+
+class LogSearchHit(BaseModel):
+    deploy_id: int
+    service_id: int
+    status: str
+    git_branch: str
+    commit_id: str
+    created_date: datetime
+    matches: List[LogSearchMatch]
+
+class LogSearchResponse(BaseModel):
+    query: str
+    results: List[LogSearchHit]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
 class ServiceCreate(BaseModel):
     user_id: int
@@ -26,4 +26,14 @@ class ServiceDeployInfo(BaseModel):
     domain: str
     git_repo: str
     git_branch: str
-    git_pat: Optional[str] = None 
+    git_pat: Optional[str] = None
+
+class UserSummaryResponse(BaseModel):
+    user_id: int
+    date: date
+    timezone: str
+    services_count: int
+    active_services_count: int
+    today_services_count: int
+    today_deploys_count: int
+    success_rate: int
@@ -0,0 +1,91 @@
+"""
+core.pagination 동작 (cursor 인코딩 / 잘못된 cursor → 400 / 다음 페이지 헤더)
+
+    cd backend
+    python -m pytest tests/test_pagination.py
+"""
+import base64
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from core.pagination import NEXT_CURSOR_HEADER, cursor_param, decode_cursor, encode_cursor, paginate
+
+
+def b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+MALFORMED = [
+    "!!!",                              # base64 아님
+    b64(b"not json"),
+    b64(b"[1]"),                        # 항목 수가 다름
+    b64(b'{"a": 1}'),
+    b64(b'["yesterday", 1]'),           # 날짜 형식 아님
+    b64(b'["2026-10-18T12:00:00", "x"]'),
+    b64(b'[null, 1]'),
+]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/items")
+    def items(after: tuple | None = Depends(cursor_param)):
+        return {"after": None if after is None else [after[0].isoformat(), after[1]]}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("created_date", [
+    datetime(2026, 10, 18, 12, 30, 1, 123456),
+    datetime(2026, 1, 1),
+])
+def test_cursor_round_trip(created_date):
+    cursor = encode_cursor(created_date, 2 ** 62)
+
+    assert decode_cursor(cursor) == (created_date, 2 ** 62)
+    # 쿼리 파라미터에 그대로 넣을 수 있도록 padding / '+' '/' 없음
+    assert not set(cursor) & set("=+/")
+
+
+@pytest.mark.parametrize("cursor", MALFORMED)
+def test_decode_malformed_cursor_raises_value_error(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED)
+def test_malformed_cursor_is_400(client, cursor):
+    r = client.get("/items", params={"cursor": cursor})
+    assert r.status_code == 400
+    assert "cursor" in r.json()["detail"]
+
+
+def test_cursor_param(client):
+    assert client.get("/items").json() == {"after": None}
+
+    cursor = encode_cursor(datetime(2026, 10, 18, 9, 0), 7)
+    assert client.get("/items", params={"cursor": cursor}).json() == {"after": ["2026-10-18T09:00:00", 7]}
+
+
+def test_paginate_sets_next_cursor_from_last_row_of_page():
+    rows = [SimpleNamespace(created_date=datetime(2026, 10, 18, 12 - i), id=10 - i) for i in range(4)]
+    response = Response()
+
+    page = paginate(rows, 3, response, lambda r: (r.created_date, r.id))
+
+    assert page == rows[:3]
+    assert decode_cursor(response.headers[NEXT_CURSOR_HEADER]) == (datetime(2026, 10, 18, 10), 8)
+
+
+def test_paginate_last_page_has_no_cursor():
+    rows = [SimpleNamespace(created_date=datetime(2026, 10, 18), id=1)]
+    response = Response()
+
+    assert paginate(rows, 3, response, lambda r: (r.created_date, r.id)) == rows
+    assert NEXT_CURSOR_HEADER not in response.headers
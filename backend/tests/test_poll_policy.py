@@ -0,0 +1,95 @@
+"""
+core.poll_policy 동작 (backoff / 예상 완료 시각 근처 polling / 예상 시간 계산 / 잡별 override)
+
+    cd backend
+    python -m pytest tests/test_poll_policy.py
+"""
+import pytest
+
+from core.poll_policy import PollPolicy, expected_duration, load_poll_policy
+
+
+def make_policy(**overrides) -> PollPolicy:
+    # jitter 없이 간격을 그대로 비교
+    options = dict(
+        queue_interval=1.0, queue_max_interval=5.0,
+        initial_interval=2.0, max_interval=30.0, backoff=2.0, jitter=0.0,
+        near_finish_interval=2.0, near_finish_window=0.15,
+    )
+    options.update(overrides)
+    return PollPolicy(**options)
+
+
+def test_expected_duration_is_median_seconds_of_successful_builds():
+    assert expected_duration([60_000, 120_000, 90_000]) == 90.0
+    assert expected_duration([60_000, 120_000]) == 90.0
+    # duration 이 없거나 0 이하인 빌드는 빼고 계산
+    assert expected_duration([0, None, -5, 30_000]) == 30.0
+
+
+def test_expected_duration_without_history_is_none():
+    assert expected_duration([]) is None
+    assert expected_duration([0, None]) is None
+
+
+def test_queue_wait_backs_off_up_to_max():
+    policy = make_policy()
+    assert [policy.queue_wait(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_build_wait_backs_off_up_to_max_without_history():
+    policy = make_policy()
+    assert [policy.build_wait(n, elapsed=n * 10, expected=None) for n in range(6)] == [2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+
+def test_build_wait_tightens_near_expected_finish():
+    policy = make_policy()
+    # 예상 100초, ±15초 구간 안에서는 backoff 와 상관없이 near_finish_interval
+    for elapsed in (85, 95, 100, 110, 115):
+        assert policy.build_wait(10, elapsed=elapsed, expected=100) == 2.0
+
+
+def test_build_wait_stops_at_near_finish_window_start():
+    policy = make_policy()
+    # 구간 시작(85초)까지 35초 남음 → max_interval(30) 그대로
+    assert policy.build_wait(10, elapsed=50, expected=100) == 30.0
+    # 15초 남음 → 구간 시작을 지나치지 않도록 15초로 자름
+    assert policy.build_wait(10, elapsed=70, expected=100) == 15.0
+    # 남은 시간이 near_finish_interval 보다 짧아도 그보다 촘촘하게는 보지 않는다
+    assert policy.build_wait(10, elapsed=84, expected=100) == 2.0
+
+
+def test_build_wait_backs_off_again_after_expected_window():
+    policy = make_policy()
+    # 예상보다 오래 걸리는 빌드는 다시 backoff 간격으로
+    assert policy.build_wait(10, elapsed=200, expected=100) == 30.0
+    assert policy.build_wait(1, elapsed=200, expected=100) == 4.0
+
+
+def test_jitter_stays_within_ratio():
+    policy = make_policy(jitter=0.2)
+    waits = [policy.build_wait(10, elapsed=0, expected=None) for _ in range(200)]
+    assert all(24.0 <= w <= 36.0 for w in waits)
+    assert len(set(waits)) > 1
+
+
+def test_load_poll_policy_applies_default_then_job_overrides(monkeypatch):
+    monkeypatch.setenv(
+        "JENKINS_POLL_POLICY",
+        '{"*": {"jitter": 0.1, "max_interval": 10}, "job-a": {"max_interval": 20, "unknown": 1}}',
+    )
+    a = load_poll_policy("job-a")
+    b = load_poll_policy("job-b")
+
+    assert (a.jitter, a.max_interval) == (0.1, 20)
+    assert (b.jitter, b.max_interval) == (0.1, 10)
+    assert a.build_deadline == PollPolicy().build_deadline
+
+
+@pytest.mark.parametrize("raw", [None, "", "not json"])
+def test_load_poll_policy_falls_back_to_defaults(monkeypatch, raw):
+    if raw is None:
+        monkeypatch.delenv("JENKINS_POLL_POLICY", raising=False)
+    else:
+        monkeypatch.setenv("JENKINS_POLL_POLICY", raw)
+    assert load_poll_policy("job-a") == PollPolicy()
@@ -0,0 +1,163 @@
+"""
+core.series_store.SeriesStore 동작 (tail 다시 받기 / 앞쪽 gap / 끊긴 구간 / max_points)
+
+    cd backend
+    python -m pytest tests/test_series_store.py
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core import series_store
+from core.series_store import SeriesStore
+
+
+STEP = 60
+NOW = 1_000_020   # STEP 배수
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # store 모듈이 보는 시각만 바꾼다 (wall / monotonic 을 같이 움직임)
+    now = SimpleNamespace(value=NOW)
+    monkeypatch.setattr(series_store, "time", SimpleNamespace(
+        time=lambda: now.value,
+        monotonic=lambda: float(now.value),
+    ))
+    return now
+
+
+class Upstream:
+    # query_range 흉내: [start, end] 의 STEP 마다 "ts:version" 값을 돌려주고 받은 구간을 기록
+    def __init__(self) -> None:
+        self.version = 1
+        self.calls: list[tuple[int, int]] = []
+
+    async def __call__(self, start: int, end: int):
+        self.calls.append((start, end))
+        values = [[ts, f"{ts}:{self.version}"] for ts in range(start, end + 1, STEP)]
+        return [{"metric": {"namespace": "a"}, "values": values}] if values else []
+
+
+def make_store(**overrides) -> SeriesStore:
+    options = dict(settle=120, tail_ttl=30, max_age=10 * 86400, idle=3600, max_points=10_000)
+    options.update(overrides)
+    return SeriesStore("t", **options)
+
+
+def points(result) -> dict[int, str]:
+    return {ts: value for s in result for ts, value in s["values"]}
+
+
+def test_repeat_within_tail_ttl_is_a_hit(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        start, end = NOW - 600, NOW
+
+        first = await store.get_range("q", start, end, STEP, upstream)
+        second = await store.get_range("q", start, end, STEP, upstream)
+
+        assert upstream.calls == [(start, end)]
+        assert first == second
+        assert len(points(second)) == 11
+        assert store.stats()["hits"] == 1
+
+    asyncio.run(main())
+
+
+def test_sliding_window_refetches_only_unsettled_tail(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        await store.get_range("q", NOW - 600, NOW, STEP, upstream)
+
+        # tail_ttl 이 지난 뒤 한 step 밀린 구간 → settle(120초) 이전까지는 확정, 그 뒤만 다시 받는다
+        clock.value += STEP
+        upstream.version = 2
+        result = points(await store.get_range("q", NOW - 540, NOW + 60, STEP, upstream))
+
+        assert upstream.calls[1] == (NOW - 60, NOW + 60)
+        assert sorted(result) == list(range(NOW - 540, NOW + 61, STEP))
+        assert result[NOW - 120] == f"{NOW - 120}:1"
+        assert result[NOW - 60] == f"{NOW - 60}:2"
+        assert result[NOW + 60] == f"{NOW + 60}:2"
+
+    asyncio.run(main())
+
+
+def test_tail_refetch_drops_vanished_points(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        await store.get_range("q", NOW - 600, NOW, STEP, upstream)
+
+        # 다시 받은 tail 구간에 없는 점은 지운다 (그 사이 사라진 시리즈 / 점)
+        clock.value += STEP
+
+        async def empty(start, end):
+            upstream.calls.append((start, end))
+            return []
+
+        result = points(await store.get_range("q", NOW - 540, NOW + 60, STEP, empty))
+        assert upstream.calls[1] == (NOW - 60, NOW + 60)
+        assert max(result) == NOW - 120
+
+    asyncio.run(main())
+
+
+def test_earlier_start_fetches_only_the_gap(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        await store.get_range("q", NOW - 600, NOW, STEP, upstream)
+
+        result = points(await store.get_range("q", NOW - 900, NOW, STEP, upstream))
+
+        assert upstream.calls[1:] == [(NOW - 900, NOW - 660)]
+        assert sorted(result) == list(range(NOW - 900, NOW + 1, STEP))
+
+    asyncio.run(main())
+
+
+def test_disjoint_range_resets_entry(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        await store.get_range("q", NOW - 600, NOW, STEP, upstream)
+
+        result = points(await store.get_range("q", NOW - 7200, NOW - 6600, STEP, upstream))
+
+        assert upstream.calls[1:] == [(NOW - 7200, NOW - 6600)]
+        assert sorted(result) == list(range(NOW - 7200, NOW - 6599, STEP))
+        assert store.stats()["resets"] == 1
+        # 예전 구간은 버렸으므로 다시 받는다
+        await store.get_range("q", NOW - 600, NOW, STEP, upstream)
+        assert len(upstream.calls) == 3
+
+    asyncio.run(main())
+
+
+def test_max_points_evicts_least_recently_used_key(clock):
+    async def main():
+        store, upstream = make_store(max_points=15), Upstream()
+        await store.get_range("a", NOW - 600, NOW, STEP, upstream)
+        await store.get_range("b", NOW - 600, NOW, STEP, upstream)
+
+        stats = store.stats()
+        assert (stats["keys"], stats["points"], stats["evictions"]) == (1, 11, 1)
+
+        # 남은 b 는 그대로 쓰고, 밀려난 a 는 다시 받는다
+        await store.get_range("b", NOW - 600, NOW, STEP, upstream)
+        assert len(upstream.calls) == 2
+        await store.get_range("a", NOW - 600, NOW, STEP, upstream)
+        assert len(upstream.calls) == 3
+
+    asyncio.run(main())
+
+
+def test_concurrent_requests_for_one_key_fetch_once(clock):
+    async def main():
+        store, upstream = make_store(), Upstream()
+        results = await asyncio.gather(*(store.get_range("q", NOW - 600, NOW, STEP, upstream) for _ in range(5)))
+
+        assert upstream.calls == [(NOW - 600, NOW)]
+        assert all(r == results[0] for r in results)
+
+    asyncio.run(main())
@@ -0,0 +1,215 @@
+"""
+core.ttl_cache.TTLCache 동작 (single-flight / invalidate / 취소된 load)
+
+    cd backend
+    python -m pytest tests/test_ttl_cache.py
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core import ttl_cache
+from core.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # 캐시 모듈이 보는 시각만 바꾼다 (event loop의 time.monotonic은 그대로)
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(ttl_cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+class Loader:
+    # 호출 수를 세고, release() 전까지 결과를 돌려주지 않는 loader
+    def __init__(self, value="v1") -> None:
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.gate = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.gate.wait()
+        return self.value
+
+    def release(self) -> None:
+        self.gate.set()
+
+
+def test_hit_until_ttl_expires(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        loader = Loader()
+        loader.release()
+
+        assert await cache.get_or_load("k", loader) == "v1"
+        clock.value += 9
+        assert await cache.get_or_load("k", loader) == "v1"
+        assert loader.calls == 1
+
+        clock.value += 2
+        loader.value = "v2"
+        assert await cache.get_or_load("k", loader) == "v2"
+        assert loader.calls == 2
+        assert cache.stats()["hits"] == 1
+
+    asyncio.run(main())
+
+
+def test_concurrent_misses_share_one_load(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        loader = Loader()
+
+        tasks = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(10)]
+        await loader.started.wait()
+        await asyncio.sleep(0)
+        loader.release()
+
+        assert await asyncio.gather(*tasks) == ["v1"] * 10
+        assert loader.calls == 1
+        stats = cache.stats()
+        assert (stats["misses"], stats["coalesced"], stats["size"]) == (1, 9, 1)
+
+    asyncio.run(main())
+
+
+def test_loader_error_reaches_waiters_and_is_not_cached(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        gate = asyncio.Event()
+
+        async def failing():
+            await gate.wait()
+            raise RuntimeError("upstream down")
+
+        tasks = [asyncio.create_task(cache.get_or_load("k", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        loader = Loader()
+        loader.release()
+        assert await cache.get_or_load("k", loader) == "v1"
+
+    asyncio.run(main())
+
+
+def test_none_is_not_cached(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        loader = Loader(value=None)
+        loader.release()
+
+        assert await cache.get_or_load("k", loader) is None
+        assert await cache.get_or_load("k", loader) is None
+        assert loader.calls == 2
+
+    asyncio.run(main())
+
+
+def test_invalidate_during_load_drops_in_flight_result(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        old = Loader("before write")
+        leader = asyncio.create_task(cache.get_or_load("k", old))
+        await old.started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("k", old))
+        await asyncio.sleep(0)
+
+        # 쓰기 commit 후 invalidate → 그 뒤의 요청은 진행 중인 load를 기다리지 않고 새로 읽는다
+        cache.invalidate("k")
+        new = Loader("after write")
+        new.release()
+        assert await cache.get_or_load("k", new) == "after write"
+        assert new.calls == 1
+
+        # 먼저 기다리던 요청은 원래 load 결과를 받지만 캐시에는 남지 않는다
+        old.release()
+        assert await leader == "before write"
+        assert await waiter == "before write"
+        assert await cache.get_or_load("k", old) == "after write"
+        assert old.calls == 1
+
+    asyncio.run(main())
+
+
+def test_clear_during_load_drops_in_flight_result(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        old = Loader("before clear")
+        leader = asyncio.create_task(cache.get_or_load("k", old))
+        await old.started.wait()
+
+        cache.clear()
+        old.release()
+        assert await leader == "before clear"
+        assert cache.stats()["size"] == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_leader_hands_load_to_waiter(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        first = Loader("first")
+        leader = asyncio.create_task(cache.get_or_load("k", first))
+        await first.started.wait()
+
+        second = Loader("second")
+        second.release()
+        waiter = asyncio.create_task(cache.get_or_load("k", second))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # 기다리던 요청은 취소되지 않고 자기 loader로 다시 읽는다
+        assert await waiter == "second"
+        assert (first.calls, second.calls) == (1, 1)
+        assert await cache.get_or_load("k", first) == "second"
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_does_not_cancel_load(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=10)
+        loader = Loader()
+        leader = asyncio.create_task(cache.get_or_load("k", loader))
+        await loader.started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("k", loader))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        loader.release()
+        assert await leader == "v1"
+        assert cache.stats()["size"] == 1
+
+    asyncio.run(main())
+
+
+def test_lru_eviction(clock):
+    async def main():
+        cache = TTLCache("t", ttl=10, max_items=2)
+
+        async def load_key(key):
+            async def loader():
+                return key
+            return await cache.get_or_load(key, loader)
+
+        await load_key("a")
+        await load_key("b")
+        await load_key("a")   # a가 최근에 쓰였으므로 b가 밀려난다
+        await load_key("c")
+
+        assert list(cache._entries) == ["a", "c"]
+        assert cache.stats()["evictions"] == 1
+
+    asyncio.run(main())
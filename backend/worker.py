@@ -0,0 +1,32 @@
+import asyncio
+import logging
+import signal
+from core import http_pool
+from core.build_watcher import build_watcher
+from core.deploy_scheduler import deploy_scheduler
+from core.log_tiering import log_tiering
+
+# API 서버와 분리해서 배포 대기열 / 로그 보관 작업만 처리하는 워커
+#   python worker.py
+# 여러 개를 동시에 띄워도 deploy_jobs 를 SKIP LOCKED 로 나눠 가져간다.
+
+async def main():
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    build_watcher.start()
+    deploy_scheduler.start()
+    log_tiering.start()
+    try:
+        await stop.wait()
+    finally:
+        await deploy_scheduler.stop()
+        await log_tiering.stop()
+        await build_watcher.stop()
+        await http_pool.close_all()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
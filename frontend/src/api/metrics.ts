@@ -68,6 +68,18 @@ export interface NamespaceHealthResponse {
   }
 }
 
+// resource-usage / health / cost-summary 를 한 번에 (실패한 항목은 null, errors 에 이유)
+export type NamespaceOverviewSection = "usage" | "health" | "cost"
+
+// include 에 넣은 항목만 응답에 담김
+export interface NamespaceOverviewResponse {
+  namespace: string
+  usage?: NamespaceResourceUsageResponse | null
+  health?: NamespaceHealthResponse | null
+  cost?: NamespaceCostSummaryResponse | null
+  errors: Partial<Record<"usage" | "health" | "cost", string>>
+}
+
 export interface NamespaceTopWorkload {
   name: string
   totalCost: number
@@ -121,6 +133,22 @@ export const getNamespaceHealth = async (namespace: string) => {
   return handleResponse<NamespaceHealthResponse>(res)
 }
 
+export const getNamespaceOverview = async (
+  namespace: string,
+  minutes = 60,
+  stepSec = 60,
+  include: NamespaceOverviewSection[] = ["usage", "health", "cost"],
+) => {
+  const res = await fetch(
+    `${METRICS_BASE}/${encodeURIComponent(namespace)}/overview${buildQuery({
+      minutes,
+      step_sec: stepSec,
+      include: include.join(","),
+    })}`,
+  )
+  return handleResponse<NamespaceOverviewResponse>(res)
+}
+
 export const getNamespaceTopWorkloads = async (
   namespace: string,
   window = "7d",
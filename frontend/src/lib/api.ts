@@ -428,19 +428,27 @@ export const api = {
     const API_BASE = 'https://www.yoitang.cloud/api'
     const url = `${API_BASE}/service/user/${userId}`
 
-    const response = await fetch(url, {
-      method: 'GET',
-      headers: {
-        'Content-Type': 'application/json',
-      },
-    })
+    // 목록은 페이지 단위로 내려오므로 X-Next-Cursor 헤더가 없을 때까지 이어서 받음
+    const services: any[] = []
+    let cursor: string | null = null
+    do {
+      const pageUrl: string = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url
+      const response = await fetch(pageUrl, {
+        method: 'GET',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+      })
 
-    if (!response.ok) {
-      const text = await response.text()
-      throw new Error(`Failed to fetch services: ${response.status} ${text}`)
-    }
+      if (!response.ok) {
+        const text = await response.text()
+        throw new Error(`Failed to fetch services: ${response.status} ${text}`)
+      }
+
+      services.push(...(await response.json()))
+      cursor = response.headers.get('X-Next-Cursor')
+    } while (cursor)
 
-    const services = await response.json()
     // 백엔드에서 datetime을 ISO 문자열로 변환하여 반환하므로 그대로 사용
     return services.map((service: any) => ({
       service_id: service.service_id,
@@ -9,6 +9,8 @@ export interface LogResponse {
   application_log: string | null;
   created_date: string;
   updated_date: string | null;
+  // 너무 커서 마지막 부분만 담긴 로그 종류 → 전체 크기(bytes), 전체는 /log/{deployId}/{logType} 로
+  truncated?: Partial<Record<'build' | 'deploy' | 'application', number>>;
 }
 
 // DB에서 로그 한 건 가져오기
@@ -15,7 +15,7 @@ import {
 } from "recharts"
 import { ArrowLeft, Cpu, DollarSign, Database, Rocket } from "lucide-react"
 
-import { getNamespaceCostSummary, getNamespaceResourceUsage } from "@/api/metrics"
+import { getNamespaceOverview } from "@/api/metrics"
 import { Alert, AlertDescription, AlertTitle } from "@/components/ui/alert"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
@@ -66,19 +66,16 @@ const MetricsDashboard = () => {
   const hasServiceId = typeof serviceId === "number" && !Number.isNaN(serviceId)
   const locale = getLocale(language)
 
-  const resourceUsageQuery = useQuery({
-    queryKey: ["metrics-resource-usage", namespace],
-    queryFn: () => getNamespaceResourceUsage(namespace),
-    enabled: Boolean(namespace),
-    staleTime: 60_000,
-  })
-
-  const costSummaryQuery = useQuery({
-    queryKey: ["metrics-cost-summary", namespace],
-    queryFn: () => getNamespaceCostSummary(namespace),
+  // 사용량 / 비용을 한 요청으로 (일부 upstream 실패는 항목별 errors 로 옴, 패널에 없는 health 는 받지 않음)
+  const overviewQuery = useQuery({
+    queryKey: ["metrics-overview", namespace],
+    queryFn: () => getNamespaceOverview(namespace, 60, 60, ["usage", "cost"]),
     enabled: Boolean(namespace),
     staleTime: 60_000,
   })
+  const overviewError = overviewQuery.isError ? (overviewQuery.error as Error).message : undefined
+  const resourceUsageError = overviewError ?? overviewQuery.data?.errors.usage
+  const costSummaryError = overviewError ?? overviewQuery.data?.errors.cost
 
   const deploymentsQuery = useQuery({
     queryKey: ["service-deployments", serviceId],
@@ -87,8 +84,8 @@ const MetricsDashboard = () => {
     staleTime: 30_000,
   })
 
-  const resourceUsage = resourceUsageQuery.data
-  const costSummary = costSummaryQuery.data
+  const resourceUsage = overviewQuery.data?.usage ?? undefined
+  const costSummary = overviewQuery.data?.cost ?? undefined
   const deploymentRows = useMemo(() => {
     if (!deploymentsQuery.data?.length) return []
     return [...deploymentsQuery.data].sort(
@@ -415,10 +412,10 @@ const MetricsDashboard = () => {
               </CardTitle>
             </CardHeader>
             <CardContent>
-              {resourceUsageQuery.isLoading ? (
+              {overviewQuery.isLoading ? (
                 <p className="text-sm text-muted-foreground">{loadingText}</p>
-              ) : resourceUsageQuery.isError ? (
-                <p className="text-sm text-destructive">{(resourceUsageQuery.error as Error).message}</p>
+              ) : resourceUsageError ? (
+                <p className="text-sm text-destructive">{resourceUsageError}</p>
               ) : clusterSeriesData.length ? (
                 <div className="h-64">
                   <ResponsiveContainer width="100%" height="100%">
@@ -465,10 +462,10 @@ const MetricsDashboard = () => {
             </CardTitle>
           </CardHeader>
           <CardContent>
-            {costSummaryQuery.isLoading ? (
+            {overviewQuery.isLoading ? (
               <p className="text-sm text-muted-foreground">{loadingText}</p>
-            ) : costSummaryQuery.isError ? (
-              <p className="text-sm text-destructive">{(costSummaryQuery.error as Error).message}</p>
+            ) : costSummaryError ? (
+              <p className="text-sm text-destructive">{costSummaryError}</p>
             ) : costChartData.length ? (
               <div className="h-64">
                 <ResponsiveContainer width="100%" height="100%">